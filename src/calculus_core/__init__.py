@@ -43,59 +43,123 @@ Using Pre-defined Pile Catalogs:
     estaca = EstacaFactory.criar_metalica('HP_310x79', cota=20)
 """
 
+from typing import TYPE_CHECKING
+
+from calculus_core.utils.lazy_imports import lazy_exports
+
 __version__ = '0.5.1'
 
 # =============================================================================
 # PUBLIC API
 # =============================================================================
 
-# Domain - Core Entities
-# Adapters - Coefficient Providers
-from calculus_core.adapters.coefficients import (
-    AokiVelloso1975Provider,
-    AokiVellosoLaprovitera1988Provider,
-    DecourtQuaresma1978Provider,
-    Teixeira1996Provider,
-)
-
-# Bootstrap - Factory Functions
-from calculus_core.bootstrap import (
-    create_calculation_service,
-    create_calculator,  # [NEW]
-    get_all_calculators,
-    get_calculator_instance,  # [NEW]
-)
-
-# Domain - Calculation Strategies
-from calculus_core.domain.calculation import (
-    AokiVellosoCalculator,
-    DecourtQuaresmaCalculator,
-    MetodoCalculo,
-    TeixeiraCalculator,
-)
-from calculus_core.domain.model import Estaca, MedidaSPT, PerfilSPT
-
-# Domain - Value Objects
-from calculus_core.domain.value_objects import (
-    CoeficienteSolo,
-    FatoresF1F2,
-    ResultadoCalculo,
-    TipoSolo,
+# Names are imported on first access, so ``import calculus_core`` does not
+# load the calculators, coefficient tables, method registry or catalogs.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        # Domain - Core Entities
+        'calculus_core.domain.model': ('Estaca', 'MedidaSPT', 'PerfilSPT'),
+        # Domain - Value Objects
+        'calculus_core.domain.value_objects': (
+            'CoeficienteSolo',
+            'ConstrutorCurva',
+            'CurvaCapacidade',
+            'FatoresF1F2',
+            'ResultadoCalculo',
+            'TipoSolo',
+        ),
+        # Domain - Calculation Strategies
+        'calculus_core.domain.calculation': (
+            'AokiVellosoCalculator',
+            'DecourtQuaresmaCalculator',
+            'MetodoCalculo',
+            'TeixeiraCalculator',
+        ),
+        # Adapters - Coefficient Providers
+        'calculus_core.adapters.coefficients': (
+            'AokiVelloso1975Provider',
+            'AokiVellosoLaprovitera1988Provider',
+            'DecourtQuaresma1978Provider',
+            'Teixeira1996Provider',
+        ),
+        # Bootstrap - Factory Functions
+        'calculus_core.bootstrap': (
+            'create_async_calculation_service',
+            'create_calculation_service',
+            'create_calculator',
+            'get_all_calculators',
+            'get_calculator_instance',
+        ),
+        # Service Layer
+        'calculus_core.service_layer': (
+            'AsyncCalculationService',
+            'BatchResult',
+            'CalculationRequest',
+            'CalculationResult',
+            'CalculationService',
+            'ProgressoObra',
+            'ResultadoObra',
+            'ResultadoSondagem',
+            'calcular_obra',
+            'calcular_todos_metodos_todas_estacas',
+            'calcular_todos_metodos_uma_estaca',
+            'calcular_um_metodo_todas_estacas',
+            'calculate_pile_capacity',
+            'calculate_pile_capacity_by_depth',
+            'iterar_obra',
+            'serializar_resultados',
+        ),
+    },
 )
 
-# Service Layer
-from calculus_core.service_layer import (
-    BatchResult,
-    CalculationRequest,
-    CalculationResult,
-    CalculationService,
-    calcular_todos_metodos_todas_estacas,
-    calcular_todos_metodos_uma_estaca,
-    calcular_um_metodo_todas_estacas,
-    calculate_pile_capacity,
-    calculate_pile_capacity_by_depth,
-    serializar_resultados,
-)
+if TYPE_CHECKING:
+    from calculus_core.adapters.coefficients import (
+        AokiVelloso1975Provider,
+        AokiVellosoLaprovitera1988Provider,
+        DecourtQuaresma1978Provider,
+        Teixeira1996Provider,
+    )
+    from calculus_core.bootstrap import (
+        create_async_calculation_service,
+        create_calculation_service,
+        create_calculator,
+        get_all_calculators,
+        get_calculator_instance,
+    )
+    from calculus_core.domain.calculation import (
+        AokiVellosoCalculator,
+        DecourtQuaresmaCalculator,
+        MetodoCalculo,
+        TeixeiraCalculator,
+    )
+    from calculus_core.domain.model import Estaca, MedidaSPT, PerfilSPT
+    from calculus_core.domain.value_objects import (
+        CoeficienteSolo,
+        ConstrutorCurva,
+        CurvaCapacidade,
+        FatoresF1F2,
+        ResultadoCalculo,
+        TipoSolo,
+    )
+    from calculus_core.service_layer import (
+        AsyncCalculationService,
+        BatchResult,
+        CalculationRequest,
+        CalculationResult,
+        CalculationService,
+        ProgressoObra,
+        ResultadoObra,
+        ResultadoSondagem,
+        calcular_obra,
+        calcular_todos_metodos_todas_estacas,
+        calcular_todos_metodos_uma_estaca,
+        calcular_um_metodo_todas_estacas,
+        calculate_pile_capacity,
+        calculate_pile_capacity_by_depth,
+        iterar_obra,
+        serializar_resultados,
+    )
 
 __all__ = [
     # Version
@@ -106,6 +170,8 @@ __all__ = [
     'PerfilSPT',
     # Domain - Value Objects
     'ResultadoCalculo',
+    'CurvaCapacidade',
+    'ConstrutorCurva',
     'TipoSolo',
     'CoeficienteSolo',
     'FatoresF1F2',
@@ -124,8 +190,10 @@ __all__ = [
     'get_calculator_instance',  # [NEW]
     'get_all_calculators',
     'create_calculation_service',
+    'create_async_calculation_service',
     # Services
     'CalculationService',
+    'AsyncCalculationService',
     'CalculationRequest',
     'CalculationResult',
     'calculate_pile_capacity',
@@ -136,4 +204,10 @@ __all__ = [
     'calcular_um_metodo_todas_estacas',
     'calcular_todos_metodos_todas_estacas',
     'serializar_resultados',
+    # Site (multi-boring) API
+    'calcular_obra',
+    'iterar_obra',
+    'ResultadoObra',
+    'ResultadoSondagem',
+    'ProgressoObra',
 ]
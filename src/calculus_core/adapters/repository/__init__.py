@@ -5,3 +5,11 @@ This package contains repository interfaces and implementations
 for data access. Repositories abstract the data storage mechanism
 allowing the domain to remain pure.
 """
+
+from .archive import ARCHIVE_EXTENSION, ProfileArchive, write_profile_archive
+
+__all__ = [
+    'ARCHIVE_EXTENSION',
+    'ProfileArchive',
+    'write_profile_archive',
+]
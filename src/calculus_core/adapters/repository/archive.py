@@ -0,0 +1,416 @@
+"""
+Profile Archive
+
+Compact binary storage for many SPT and CPT profiles, read through mmap.
+
+Re-parsing CSV files into profile objects costs time and memory that grow
+with the number of borings. An archive is written once and then opened in
+constant time: only the header is read on open, the index is decoded on
+demand and a profile's columns are copied into an array-backed profile
+(``PerfilSPTColunar`` / ``PerfilCPTColunar``) only when it is requested.
+The operating system pages in just the bytes that are touched.
+
+Layout (little-endian):
+
+    header      magic, version, counts and section offsets
+    data        per profile, 8-byte aligned column blocks:
+                  SPT: depth f8, N_SPT q8/f8, thickness f8, soil u16
+                  CPT: depth f8, qc f8, fs f8, Rf f8, u2 f8
+    index       one fixed-size record per profile
+    soils       (offset, length) of each soil name in the text block
+    text        UTF-8 profile and soil names
+
+Soil codes are stored as indices into the archive's own soil name table
+and mapped to the process codes (``CODIGOS_SOLO``) when a profile is
+materialized, so archives are portable between processes. An open
+archive reserves the process codes of its soils.
+
+Example:
+    write_profile_archive('obra.ccpf', perfis)
+    with ProfileArchive('obra.ccpf') as arquivo:
+        perfil = arquivo.get('SP-01')
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import IO, Iterable, Iterator
+from weakref import WeakValueDictionary
+
+from calculus_core.domain.model import ColunasSPT, PerfilSPT, PerfilSPTColunar
+from calculus_core.domain.soil_investigation import (
+    ColunasCPT,
+    PerfilCPT,
+    PerfilCPTColunar,
+    SoilTestType,
+)
+from calculus_core.domain.soil_types import CODIGOS_SOLO, ReservaCodigo
+
+MAGIC = b'CCPERFIS'
+VERSION = 1
+# File name extension of profile archives
+ARCHIVE_EXTENSION = '.ccpf'
+
+# magic, version, profiles, soils, reserved, index, soils and text offsets
+_HEADER = struct.Struct('<8sIIIIQQQ')
+# name offset/length, kind, flags, reserved, rows, interval, data offset
+_RECORD = struct.Struct('<IIBBHIdQ')
+_SOIL = struct.Struct('<II')
+
+_KIND_SPT = 0
+_KIND_CPT = 1
+_FLAG_RELIABLE = 1
+_FLAG_INTEGER_SPT = 2
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+# =============================================================================
+# WRITER
+# =============================================================================
+
+
+def _write_column(arquivo: IO[bytes], coluna: array) -> None:
+    if _BIG_ENDIAN:
+        coluna = array(coluna.typecode, coluna)
+        coluna.byteswap()
+    arquivo.write(coluna.tobytes())
+
+
+def _align(arquivo: IO[bytes]) -> None:
+    arquivo.write(b'\0' * (-arquivo.tell() % 8))
+
+
+def write_profile_archive(
+    path: str | os.PathLike,
+    profiles: Iterable[PerfilSPT | PerfilCPT],
+) -> int:
+    """
+    Write profiles to a binary archive.
+
+    Profiles are streamed to disk one at a time, so ``profiles`` may be a
+    generator over more borings than fit in memory.
+
+    Args:
+        path: Destination file (overwritten).
+        profiles: SPT and/or CPT profiles with unique ``nome_sondagem``.
+
+    Returns:
+        Number of profiles written.
+
+    Raises:
+        ValueError: If two profiles share a name.
+        TypeError: If an item is not a PerfilSPT or PerfilCPT.
+    """
+    solos: dict[str, int] = {}
+    nomes: dict[str, None] = {}
+    registros = []
+    texto = bytearray()
+
+    with open(path, 'wb') as arquivo:
+        arquivo.write(b'\0' * _HEADER.size)
+        for perfil in profiles:
+            nome = perfil.nome_sondagem
+            if nome in nomes:
+                raise ValueError(f'Sondagem duplicada no arquivo: {nome}')
+            nomes[nome] = None
+
+            _align(arquivo)
+            inicio = arquivo.tell()
+            if isinstance(perfil, PerfilSPT):
+                colunas = perfil.colunas()
+                tipo = _KIND_SPT
+                flags = _FLAG_RELIABLE if perfil.confiavel else 0
+                if colunas.n_spt.typecode == 'q':
+                    flags |= _FLAG_INTEGER_SPT
+                locais = array(
+                    'H',
+                    (
+                        solos.setdefault(CODIGOS_SOLO.nome(c), len(solos))
+                        for c in colunas.codigos_solo
+                    ),
+                )
+                blocos = [
+                    colunas.profundidades,
+                    colunas.n_spt,
+                    colunas.espessuras,
+                    locais,
+                ]
+            elif isinstance(perfil, PerfilCPT):
+                if isinstance(perfil, PerfilCPTColunar):
+                    colunas_cpt = perfil.colunas()
+                else:
+                    colunas_cpt = ColunasCPT.de_medidas(perfil)
+                tipo, flags = _KIND_CPT, 0
+                blocos = [
+                    colunas_cpt.profundidades,
+                    colunas_cpt.qc,
+                    colunas_cpt.fs,
+                    colunas_cpt.rf,
+                    colunas_cpt.u2,
+                ]
+            else:
+                raise TypeError(
+                    f'Perfil não suportado: {type(perfil).__name__}'
+                )
+            for bloco in blocos:
+                _write_column(arquivo, bloco)
+
+            nome_bytes = nome.encode()
+            registros.append(
+                _RECORD.pack(
+                    len(texto),
+                    len(nome_bytes),
+                    tipo,
+                    flags,
+                    0,
+                    len(blocos[0]),
+                    perfil.intervalo_padrao,
+                    inicio,
+                )
+            )
+            texto += nome_bytes
+
+        tabela_solos = []
+        for nome_solo in solos:
+            nome_bytes = nome_solo.encode()
+            tabela_solos.append(_SOIL.pack(len(texto), len(nome_bytes)))
+            texto += nome_bytes
+
+        _align(arquivo)
+        inicio_indice = arquivo.tell()
+        arquivo.write(b''.join(registros))
+        inicio_solos = arquivo.tell()
+        arquivo.write(b''.join(tabela_solos))
+        inicio_texto = arquivo.tell()
+        arquivo.write(texto)
+
+        arquivo.seek(0)
+        arquivo.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                len(registros),
+                len(solos),
+                0,
+                inicio_indice,
+                inicio_solos,
+                inicio_texto,
+            )
+        )
+    return len(registros)
+
+
+# =============================================================================
+# READER
+# =============================================================================
+
+
+class ProfileArchive:
+    """
+    Read-only, memory-mapped access to a profile archive.
+
+    Opening reads only the header. Profile names are decoded on first
+    lookup, and each profile is materialized as an array-backed profile
+    when requested. While a materialized profile is alive, ``get`` returns
+    the same object, so caches keyed by profile (prepared coefficients,
+    fingerprints) keep working across lookups.
+
+    Archives pickle as their path, so they can be handed to worker
+    processes, which reopen the file.
+
+    Attributes:
+        path: Archive file path.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Open an archive.
+
+        Args:
+            path: Archive file written by ``write_profile_archive``.
+
+        Raises:
+            ValueError: If the file is not a supported archive.
+        """
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as arquivo:
+            self._mmap = mmap.mmap(
+                arquivo.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self._dados = memoryview(self._mmap)
+        if len(self._dados) < _HEADER.size:
+            self.close()
+            raise ValueError(f'Arquivo de perfis inválido: {self.path}')
+        (
+            magic,
+            versao,
+            self._total,
+            self._total_solos,
+            _,
+            self._inicio_indice,
+            self._inicio_solos,
+            self._inicio_texto,
+        ) = _HEADER.unpack_from(self._dados, 0)
+        if magic != MAGIC or versao != VERSION:
+            self.close()
+            raise ValueError(f'Arquivo de perfis inválido: {self.path}')
+        self._indice_nomes: dict[str, int] | None = None
+        self._reservas_solo: list[ReservaCodigo] | None = None
+        self._perfis: WeakValueDictionary = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names())
+
+    def __contains__(self, nome: object) -> bool:
+        return nome in self._nomes()
+
+    def __enter__(self) -> 'ProfileArchive':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce__(self):
+        return (ProfileArchive, (self.path,))
+
+    def __repr__(self) -> str:
+        return f'ProfileArchive({self.path!r}, perfis={self._total})'
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+
+        Profiles already materialized stay valid (they hold copies).
+        """
+        self._dados.release()
+        self._mmap.close()
+
+    def _texto(self, deslocamento: int, tamanho: int) -> str:
+        inicio = self._inicio_texto + deslocamento
+        return str(self._dados[inicio : inicio + tamanho], 'utf-8')
+
+    def _registro(self, posicao: int) -> tuple:
+        return _RECORD.unpack_from(
+            self._dados, self._inicio_indice + posicao * _RECORD.size
+        )
+
+    def _nomes(self) -> dict[str, int]:
+        if self._indice_nomes is None:
+            nomes = {}
+            for posicao in range(self._total):
+                deslocamento, tamanho, *_ = self._registro(posicao)
+                nomes[self._texto(deslocamento, tamanho)] = posicao
+            self._indice_nomes = nomes
+        return self._indice_nomes
+
+    def names(self) -> list[str]:
+        """Return the boring names, in archive order."""
+        return list(self._nomes())
+
+    def _posicao(self, nome: str) -> int:
+        posicao = self._nomes().get(nome)
+        if posicao is None:
+            raise ValueError(f'Sondagem não encontrada no arquivo: {nome}')
+        return posicao
+
+    def test_type(self, nome: str) -> SoilTestType:
+        """
+        Return whether a boring is an SPT or a CPT.
+
+        Raises:
+            ValueError: If the boring is not in the archive.
+        """
+        tipo = self._registro(self._posicao(nome))[2]
+        return SoilTestType.CPT if tipo == _KIND_CPT else SoilTestType.SPT
+
+    def get(self, nome: str) -> PerfilSPTColunar | PerfilCPTColunar:
+        """
+        Return a boring as an array-backed profile.
+
+        Args:
+            nome: Boring name (``nome_sondagem``).
+
+        Returns:
+            PerfilSPTColunar or PerfilCPTColunar.
+
+        Raises:
+            ValueError: If the boring is not in the archive.
+        """
+        perfil = self._perfis.get(nome)
+        if perfil is None:
+            perfil = self._materializar(nome, self._posicao(nome))
+            self._perfis[nome] = perfil
+        return perfil
+
+    def profiles(self) -> Iterator[PerfilSPTColunar | PerfilCPTColunar]:
+        """Yield every profile, materializing one at a time."""
+        for nome in self._nomes():
+            yield self.get(nome)
+
+    def _coluna(self, typecode: str, inicio: int, total: int) -> array:
+        coluna = array(typecode)
+        fim = inicio + total * coluna.itemsize
+        coluna.frombytes(self._dados[inicio:fim])
+        if _BIG_ENDIAN:
+            coluna.byteswap()
+        return coluna
+
+    def _solos(self) -> list[ReservaCodigo]:
+        # Held by the archive, so the soil codes stay assigned while open
+        if self._reservas_solo is None:
+            self._reservas_solo = [
+                CODIGOS_SOLO.reservar(
+                    self._texto(
+                        *_SOIL.unpack_from(
+                            self._dados, self._inicio_solos + i * _SOIL.size
+                        )
+                    )
+                )
+                for i in range(self._total_solos)
+            ]
+        return self._reservas_solo
+
+    def _materializar(
+        self, nome: str, posicao: int
+    ) -> PerfilSPTColunar | PerfilCPTColunar:
+        _, _, tipo, flags, _, total, intervalo, inicio = self._registro(
+            posicao
+        )
+        if tipo == _KIND_CPT:
+            colunas = [
+                self._coluna('d', inicio + k * 8 * total, total)
+                for k in range(5)
+            ]
+            return PerfilCPTColunar.de_colunas(
+                ColunasCPT(*colunas),
+                nome_sondagem=nome,
+                intervalo_padrao=intervalo,
+            )
+
+        tipo_n = 'q' if flags & _FLAG_INTEGER_SPT else 'd'
+        profundidades = self._coluna('d', inicio, total)
+        n_spt = self._coluna(tipo_n, inicio + 8 * total, total)
+        espessuras = self._coluna('d', inicio + 16 * total, total)
+        locais = self._coluna('H', inicio + 24 * total, total)
+        reservas = self._solos()
+        return PerfilSPTColunar.de_colunas(
+            ColunasSPT(
+                profundidades=profundidades,
+                n_spt=n_spt,
+                codigos_solo=array(
+                    'B' if len(CODIGOS_SOLO) <= 256 else 'H',
+                    [reservas[local].codigo for local in locais],
+                ),
+                espessuras=espessuras,
+                reservas=tuple(reservas[local] for local in set(locais)),
+            ),
+            nome_sondagem=nome,
+            confiavel=bool(flags & _FLAG_RELIABLE),
+            intervalo_padrao=intervalo,
+        )
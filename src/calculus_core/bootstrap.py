@@ -11,11 +11,17 @@ dependencies are composed, this makes the system:
 - Easy to understand (all wiring in one place)
 """
 
+from concurrent.futures import Executor
+
 from calculus_core.domain.calculation import (
     MetodoCalculo,
+    MetodoCalculoMemoizado,
 )
 from calculus_core.domain.method_registry import CalculationMethodRegistry
-from calculus_core.service_layer import CalculationService
+from calculus_core.service_layer import (
+    AsyncCalculationService,
+    CalculationService,
+)
 
 # =============================================================================
 # CALCULATOR FACTORIES
@@ -37,12 +43,21 @@ def create_calculator(method_id: str) -> MetodoCalculo:
 # =============================================================================
 
 
-def create_calculation_service(method: str) -> CalculationService:
+def create_calculation_service(
+    method: str,
+    *,
+    cache_size: int | None = None,
+    cache_ttl: float | None = None,
+) -> CalculationService:
     """
     Create a CalculationService for a specific method.
 
     Args:
         method: Method ID registered in CalculationMethodRegistry.
+        cache_size: If given, memoize results in an LRU cache of this
+            size (keyed by profile fingerprint and pile).
+        cache_ttl: Lifetime of cached results in seconds (requires
+            ``cache_size``).
 
     Returns:
         Configured CalculationService instance.
@@ -52,6 +67,10 @@ def create_calculation_service(method: str) -> CalculationService:
     """
     try:
         calculator = create_calculator(method)
+        if cache_size is not None:
+            calculator = MetodoCalculoMemoizado(
+                calculator, cache_size, cache_ttl
+            )
         return CalculationService(calculator)
     except ValueError as e:
         # Wrap or re-raise with helpful message
@@ -61,6 +80,52 @@ def create_calculation_service(method: str) -> CalculationService:
         ) from e
 
 
+def create_async_calculation_service(
+    method: str,
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    max_concurrency: int | None = None,
+    max_batch_concurrency: int = 1,
+    cache_size: int | None = None,
+    cache_ttl: float | None = None,
+) -> AsyncCalculationService:
+    """
+    Create an AsyncCalculationService for a specific method.
+
+    Args:
+        method: Method ID registered in CalculationMethodRegistry.
+        executor: Executor to run calculations on (default: an owned
+            thread pool). A process pool resolves the calculator in
+            each worker.
+        max_workers: Size of the owned thread pool, or the worker count
+            of ``executor``.
+        max_concurrency: Interactive calls running at once.
+        max_batch_concurrency: Batch calls running at once.
+        cache_size: If given, memoize results in an LRU cache of this
+            size (not usable with a process pool).
+        cache_ttl: Lifetime of cached results in seconds (requires
+            ``cache_size``).
+
+    Returns:
+        Configured AsyncCalculationService instance.
+
+    Raises:
+        ValueError: If method name is not recognized.
+    """
+    return AsyncCalculationService(
+        create_calculation_service(
+            method, cache_size=cache_size, cache_ttl=cache_ttl
+        ),
+        executor=executor,
+        max_workers=max_workers,
+        max_concurrency=max_concurrency,
+        max_batch_concurrency=max_batch_concurrency,
+        # A memoized service keeps its cache only on the bound service
+        metodo=method if cache_size is None else None,
+    )
+
+
 # =============================================================================
 # PRE-CONFIGURED INSTANCES (for convenience)
 # =============================================================================
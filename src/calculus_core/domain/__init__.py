@@ -6,98 +6,221 @@ load capacity calculations. This layer is completely independent of any
 external frameworks or infrastructure concerns.
 
 Modules:
-- model: Core entities (Estaca, PerfilSPT, MedidaSPT)
+- model: Core entities (Estaca, PerfilSPT, MedidaSPT, PerfilSPTColunar)
 - value_objects: Immutable domain concepts (ResultadoCalculo, TipoSolo)
 - calculation: Method implementations (Aoki-Velloso, Décourt-Quaresma, etc.)
 - pile_types: Specific pile implementations and catalogs
 - soil_types: Soil type mapping between methods
 - soil_investigation: CPT profiles and CPT-SPT conversion
 - method_registry: Plugin registry for calculation methods
+- profile_builder: Bulk construction of SPT/CPT profiles
+- profile_views: Read-only measurement views
 """
 
-# Core entities
-# Method registry
-from .method_registry import (
-    CalculationMethodInfo,
-    CalculationMethodRegistry,
-    get_calculator,
-    get_method_info,
-    list_available_methods,
-    register_method,
-)
-from .model import Estaca, MedidaSPT, PerfilSPT
-from .pile_catalogs import (
-    CATALOGO_ESCAVADAS,
-    CATALOGO_FRANKI,
-    CATALOGO_HELICE_CONTINUA,
-    CATALOGO_OMEGA,
-    CATALOGO_PRE_MOLDADAS,
-    CATALOGO_RAIZ,
-    PerfilEscavada,
-    PerfilFranki,
-    PerfilHeliceContinua,
-    PerfilOmega,
-    PerfilPreMoldada,
-    PerfilRaiz,
-    buscar_perfil_por_diametro,
-    listar_perfis_por_tipo,
-    listar_tipos_estaca,
-    obter_perfil,
-    resumo_catalogos,
-)
-
-# Pile types and catalogs
-from .pile_types import (
-    CATALOGO_PERFIS_METALICOS,
-    EstacaBase,
-    EstacaCircular,
-    EstacaFactory,
-    EstacaMetalica,
-    EstacaQuadrada,
-    PerfilMetalico,
-)
+from typing import TYPE_CHECKING
 
-# Soil investigation (CPT, conversions)
-from .soil_investigation import (
-    ConversionRegistry,
-    CPTtoSPTConverter,
-    CPTtoSPTCorrelation,
-    MedidaCPT,
-    PerfilCPT,
-    SoilTestType,
-    converter_cpt_para_spt,
-    listar_correlacoes_cpt_spt,
-    obter_info_correlacao,
-)
+from calculus_core.utils.lazy_imports import lazy_exports
 
-# Soil type system
-from .soil_types import (
-    AokiVellosoSoilMapper,
-    BaseSoilMapper,
-    DecourtQuaresmaSoilMapper,
-    SoilMapperRegistry,
-    SoilTypeMapper,
-    TeixeiraSoilMapper,
-    TipoSoloCanonical,
-    is_soil_supported,
-    map_soil_type,
+# Submodules are imported on first use of one of their names, so
+# importing e.g. ``calculus_core.domain.model`` does not load the pile
+# catalogs, the calculators or the method registry.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        '.method_registry': (
+            'CalculationMethodInfo',
+            'CalculationMethodRegistry',
+            'get_calculator',
+            'get_method_info',
+            'list_available_methods',
+            'register_method',
+        ),
+        '.model': (
+            'ColunasSPT',
+            'Estaca',
+            'MedidaSPT',
+            'PerfilSPT',
+            'PerfilSPTColunar',
+        ),
+        '.pile_catalogs': (
+            'CATALOGO_ESCAVADAS',
+            'CATALOGO_FRANKI',
+            'CATALOGO_HELICE_CONTINUA',
+            'CATALOGO_OMEGA',
+            'CATALOGO_PRE_MOLDADAS',
+            'CATALOGO_RAIZ',
+            'IndiceDiametros',
+            'PerfilEscavada',
+            'PerfilFranki',
+            'PerfilHeliceContinua',
+            'PerfilOmega',
+            'PerfilPreMoldada',
+            'PerfilRaiz',
+            'buscar_perfil_por_diametro',
+            'listar_perfis_por_tipo',
+            'listar_tipos_estaca',
+            'obter_indice_diametros',
+            'obter_perfil',
+            'perfil_mais_proximo',
+            'resumo_catalogos',
+        ),
+        '.pile_types': (
+            'CATALOGO_PERFIS_METALICOS',
+            'EstacaBase',
+            'EstacaCircular',
+            'EstacaFactory',
+            'EstacaMetalica',
+            'EstacaQuadrada',
+            'PerfilMetalico',
+        ),
+        '.profile_builder': ('ProfileBuilder',),
+        '.profile_views': ('MedidasView',),
+        '.soil_investigation': (
+            'ColunasCPT',
+            'ConversionRegistry',
+            'CPTtoSPTConverter',
+            'CPTtoSPTCorrelation',
+            'MedidaCPT',
+            'PerfilCPT',
+            'PerfilCPTColunar',
+            'SoilTestType',
+            'converter_cpt_para_spt',
+            'listar_correlacoes_cpt_spt',
+            'obter_info_correlacao',
+        ),
+        '.soil_types': (
+            'CODIGOS_ESTACA',
+            'CODIGOS_SOLO',
+            'AokiVellosoSoilMapper',
+            'BaseSoilMapper',
+            'DecourtQuaresmaSoilMapper',
+            'MapeamentoCodigos',
+            'ReservaCodigo',
+            'SoilMapperRegistry',
+            'SoilTypeMapper',
+            'TabelaCodigos',
+            'TeixeiraSoilMapper',
+            'TipoSoloCanonical',
+            'codigo_estaca',
+            'codigo_solo',
+            'is_soil_supported',
+            'map_soil_type',
+            'tabela_solo_metodo',
+        ),
+        '.value_objects': (
+            'CoeficienteSolo',
+            'ConstrutorCurva',
+            'CurvaCapacidade',
+            'FatoresF1F2',
+            'ResultadoCalculo',
+            'TipoSolo',
+        ),
+    },
 )
 
-# Value objects
-from .value_objects import (
-    CoeficienteSolo,
-    FatoresF1F2,
-    ResultadoCalculo,
-    TipoSolo,
-)
+if TYPE_CHECKING:
+    from .method_registry import (
+        CalculationMethodInfo,
+        CalculationMethodRegistry,
+        get_calculator,
+        get_method_info,
+        list_available_methods,
+        register_method,
+    )
+    from .model import (
+        ColunasSPT,
+        Estaca,
+        MedidaSPT,
+        PerfilSPT,
+        PerfilSPTColunar,
+    )
+    from .pile_catalogs import (
+        CATALOGO_ESCAVADAS,
+        CATALOGO_FRANKI,
+        CATALOGO_HELICE_CONTINUA,
+        CATALOGO_OMEGA,
+        CATALOGO_PRE_MOLDADAS,
+        CATALOGO_RAIZ,
+        IndiceDiametros,
+        PerfilEscavada,
+        PerfilFranki,
+        PerfilHeliceContinua,
+        PerfilOmega,
+        PerfilPreMoldada,
+        PerfilRaiz,
+        buscar_perfil_por_diametro,
+        listar_perfis_por_tipo,
+        listar_tipos_estaca,
+        obter_indice_diametros,
+        obter_perfil,
+        perfil_mais_proximo,
+        resumo_catalogos,
+    )
+    from .pile_types import (
+        CATALOGO_PERFIS_METALICOS,
+        EstacaBase,
+        EstacaCircular,
+        EstacaFactory,
+        EstacaMetalica,
+        EstacaQuadrada,
+        PerfilMetalico,
+    )
+    from .profile_builder import ProfileBuilder
+    from .profile_views import MedidasView
+    from .soil_investigation import (
+        ColunasCPT,
+        ConversionRegistry,
+        CPTtoSPTConverter,
+        CPTtoSPTCorrelation,
+        MedidaCPT,
+        PerfilCPT,
+        PerfilCPTColunar,
+        SoilTestType,
+        converter_cpt_para_spt,
+        listar_correlacoes_cpt_spt,
+        obter_info_correlacao,
+    )
+    from .soil_types import (
+        CODIGOS_ESTACA,
+        CODIGOS_SOLO,
+        AokiVellosoSoilMapper,
+        BaseSoilMapper,
+        DecourtQuaresmaSoilMapper,
+        MapeamentoCodigos,
+        ReservaCodigo,
+        SoilMapperRegistry,
+        SoilTypeMapper,
+        TabelaCodigos,
+        TeixeiraSoilMapper,
+        TipoSoloCanonical,
+        codigo_estaca,
+        codigo_solo,
+        is_soil_supported,
+        map_soil_type,
+        tabela_solo_metodo,
+    )
+    from .value_objects import (
+        CoeficienteSolo,
+        ConstrutorCurva,
+        CurvaCapacidade,
+        FatoresF1F2,
+        ResultadoCalculo,
+        TipoSolo,
+    )
 
 __all__ = [
     # Core entities
     'Estaca',
     'MedidaSPT',
     'PerfilSPT',
+    'PerfilSPTColunar',
+    'ColunasSPT',
+    'ProfileBuilder',
+    'MedidasView',
     # Value objects
     'ResultadoCalculo',
+    'CurvaCapacidade',
+    'ConstrutorCurva',
     'TipoSolo',
     'CoeficienteSolo',
     'FatoresF1F2',
@@ -127,6 +250,9 @@ __all__ = [
     'obter_perfil',
     'buscar_perfil_por_diametro',
     'resumo_catalogos',
+    'IndiceDiametros',
+    'obter_indice_diametros',
+    'perfil_mais_proximo',
     # Soil type system
     'TipoSoloCanonical',
     'SoilTypeMapper',
@@ -137,9 +263,19 @@ __all__ = [
     'SoilMapperRegistry',
     'map_soil_type',
     'is_soil_supported',
+    'TabelaCodigos',
+    'MapeamentoCodigos',
+    'ReservaCodigo',
+    'CODIGOS_SOLO',
+    'CODIGOS_ESTACA',
+    'codigo_solo',
+    'codigo_estaca',
+    'tabela_solo_metodo',
     # Soil investigation (CPT)
     'MedidaCPT',
     'PerfilCPT',
+    'PerfilCPTColunar',
+    'ColunasCPT',
     'SoilTestType',
     'CPTtoSPTConverter',
     'CPTtoSPTCorrelation',
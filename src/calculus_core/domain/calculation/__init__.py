@@ -6,10 +6,40 @@ load capacity methods. Each method is implemented as a strategy that can
 be injected with coefficient data.
 """
 
-from .aoki_velloso import AokiVellosoCalculator
-from .base import CoefficientProvider, MetodoCalculo
-from .decourt_quaresma import DecourtQuaresmaCalculator
-from .teixeira import TeixeiraCalculator
+from typing import TYPE_CHECKING
+
+from calculus_core.utils.lazy_imports import lazy_exports
+
+# Calculators (and their coefficient tables) load on first use
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        '.aoki_velloso': ('AokiVellosoCalculator',),
+        '.base': (
+            'CoefficientProvider',
+            'MetodoCalculo',
+        ),
+        '.decourt_quaresma': ('DecourtQuaresmaCalculator',),
+        '.memo': (
+            'CacheLRU',
+            'EstatisticasCache',
+            'MetodoCalculoMemoizado',
+        ),
+        '.prepared': (
+            'CoeficientesPorCamada',
+            'PerfilPreparado',
+        ),
+        '.teixeira': ('TeixeiraCalculator',),
+    },
+)
+
+if TYPE_CHECKING:
+    from .aoki_velloso import AokiVellosoCalculator
+    from .base import CoefficientProvider, MetodoCalculo
+    from .decourt_quaresma import DecourtQuaresmaCalculator
+    from .memo import CacheLRU, EstatisticasCache, MetodoCalculoMemoizado
+    from .prepared import CoeficientesPorCamada, PerfilPreparado
+    from .teixeira import TeixeiraCalculator
 
 __all__ = [
     'CoefficientProvider',
@@ -17,4 +47,9 @@ __all__ = [
     'AokiVellosoCalculator',
     'DecourtQuaresmaCalculator',
     'TeixeiraCalculator',
+    'PerfilPreparado',
+    'CoeficientesPorCamada',
+    'CacheLRU',
+    'EstatisticasCache',
+    'MetodoCalculoMemoizado',
 ]
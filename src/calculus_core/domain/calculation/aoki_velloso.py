@@ -9,8 +9,17 @@ from calculus_core.domain.calculation.base import (
     CoefficientProvider,
     MetodoCalculo,
 )
+from calculus_core.domain.calculation.prepared import (
+    CoeficientesPorCamada,
+    PerfilPreparado,
+)
 from calculus_core.domain.model import Estaca, PerfilSPT
-from calculus_core.domain.value_objects import ResultadoCalculo
+from calculus_core.domain.soil_types import CODIGOS_ESTACA, CODIGOS_SOLO
+from calculus_core.domain.value_objects import (
+    ConstrutorCurva,
+    CurvaCapacidade,
+    ResultadoCalculo,
+)
 
 
 def normalizar_tipo_solo(tipo_solo: str) -> str:
@@ -27,6 +36,11 @@ def normalizar_tipo_estaca(tipo_estaca: str) -> str:
     return tipo_estaca.lower().replace(' ', '_').replace('-', '_')
 
 
+# Method-specific names indexed by soil/pile code
+SOLO_AOKI = CODIGOS_SOLO.mapear(normalizar_tipo_solo)
+ESTACA_AOKI = CODIGOS_ESTACA.mapear(normalizar_tipo_estaca)
+
+
 class AokiVellosoCalculator(MetodoCalculo):
     """
     Calculator for the Aoki-Velloso (1975) method.
@@ -76,6 +90,44 @@ class AokiVellosoCalculator(MetodoCalculo):
 
         return perfil_spt.obter_medida(cota_apoio_ponta).N_SPT
 
+    def coeficientes_camadas(
+        self, perfil_spt: PerfilSPT
+    ) -> tuple[PerfilPreparado, CoeficientesPorCamada, CoeficientesPorCamada]:
+        """
+        Resolve K and alpha (alpha* for unreliable SPT) for every layer.
+
+        Args:
+            perfil_spt: SPT profile.
+
+        Returns:
+            Tuple of (prepared profile, K per layer, alpha per layer).
+        """
+        preparado = self.perfil_preparado(perfil_spt)
+        confiavel = perfil_spt.confiavel
+        k_camadas = preparado.coeficientes(
+            ('K',),
+            lambda codigo: self._provider.get_k(SOLO_AOKI[codigo]),
+        )
+        alpha_camadas = preparado.coeficientes(
+            ('alpha', confiavel),
+            lambda codigo: self._provider.get_alpha(
+                SOLO_AOKI[codigo], confiavel
+            ),
+        )
+        return preparado, k_camadas, alpha_camadas
+
+    def verificar_estaca(self, estaca: Estaca) -> None:
+        """Check that F1/F2 are defined for the pile type."""
+        self._provider.get_f1_f2(
+            ESTACA_AOKI.para_nome(estaca.tipo), estaca.secao_transversal
+        )
+
+    def verificar_solo(self, tipo_solo: str, estaca: Estaca) -> None:
+        """Check that K and alpha are defined for the soil type."""
+        tipo_solo = SOLO_AOKI.para_nome(tipo_solo)
+        self._provider.get_k(tipo_solo)
+        self._provider.get_alpha(tipo_solo)
+
     @staticmethod
     def calcular_rp(K: float, Np: int, f1: float, area_ponta: float) -> float:
         """
@@ -131,6 +183,9 @@ class AokiVellosoCalculator(MetodoCalculo):
             ResultadoCalculo with complete results.
         """
         cota = estaca.cota_assentamento
+        preparado, k_camadas, alpha_camadas = self.coeficientes_camadas(
+            perfil_spt
+        )
 
         # Get Np at tip (1m below settlement)
         cota_ponta = cota + 1
@@ -140,10 +195,9 @@ class AokiVellosoCalculator(MetodoCalculo):
         Np = medida_ponta.N_SPT
 
         # Get coefficients for tip
-        tipo_solo_norm = normalizar_tipo_solo(medida_ponta.tipo_solo)
-        tipo_estaca_norm = normalizar_tipo_estaca(estaca.tipo)
+        tipo_estaca_norm = ESTACA_AOKI.para_nome(estaca.tipo)
 
-        K = self._provider.get_k(tipo_solo_norm)
+        K = k_camadas.para_solo(medida_ponta.tipo_solo)
         f1, f2 = self._provider.get_f1_f2(
             tipo_estaca_norm, estaca.secao_transversal
         )
@@ -154,30 +208,20 @@ class AokiVellosoCalculator(MetodoCalculo):
         # Calculate lateral resistance using actual layers
         Rl = 0.0
 
-        # Filter layers along the shaft (strictly above tip)
-        layers = [m for m in perfil_spt.medidas if m.profundidade < cota]
-
-        for camada in layers:
-            tipo_solo_camada = normalizar_tipo_solo(camada.tipo_solo)
-
-            K_layer = self._provider.get_k(tipo_solo_camada)
-            alpha = self._provider.get_alpha(
-                tipo_solo_camada, perfil_spt.confiavel
-            )
-
-            # Determine layer thickness
-            # Use explicit thickness if available, otherwise default interval
-            dz = camada.espessura_camada
-            if dz is None:
-                dz = perfil_spt.intervalo_padrao
+        # Layers along the shaft (strictly above tip), with per-layer
+        # coefficients and thickness (explicit or the default interval)
+        # already resolved in the prepared profile
+        camadas_fuste = len(perfil_spt.medidas_acima(cota))
 
+        for i in range(camadas_fuste):
+            K_camada = k_camadas[i]
             Rl += self.calcular_rl_parcial(
-                alpha=alpha,
-                K=K_layer,
-                Nl=camada.N_SPT,
+                alpha=alpha_camadas[i],
+                K=K_camada,
+                Nl=preparado.n_spt[i],
                 f2=f2,
                 perimetro=estaca.perimetro,
-                espessura_camada=dz,
+                espessura_camada=preparado.espessuras[i],
             )
 
         # Calculate allowable load
@@ -192,6 +236,78 @@ class AokiVellosoCalculator(MetodoCalculo):
             capacidade_carga_adm=carga_adm,
         )
 
+    def calcular_curva(
+        self, perfil_spt: PerfilSPT, estaca: Estaca
+    ) -> CurvaCapacidade:
+        """
+        Execute the Aoki-Velloso calculation for every cota in one pass.
+
+        The lateral resistance of each layer is added to a running prefix
+        sum as the tip moves down, so each cota reuses the sum of the cota
+        above instead of re-filtering and re-summing the whole profile.
+        Terms are accumulated in the same order as ``calcular``, so the
+        results are identical to the per-cota evaluation.
+
+        Args:
+            perfil_spt: SPT profile.
+            estaca: Prototype pile (cloned at each cota via ``na_cota``).
+
+        Returns:
+            CurvaCapacidade ordered by cota.
+        """
+        preparado, k_camadas, alpha_camadas = self.coeficientes_camadas(
+            perfil_spt
+        )
+        profundidades = perfil_spt.profundidades_disponiveis()
+        tipo_estaca_norm = ESTACA_AOKI.para_nome(estaca.tipo)
+        area_ponta = estaca.area_ponta
+        perimetro = estaca.perimetro
+
+        fatores: tuple[float, float] | None = None
+
+        Rl = 0.0
+        proxima_camada = 0
+        curva = ConstrutorCurva()
+
+        for cota_alvo in range(1, self.cota_parada(perfil_spt) + 1):
+            cota = estaca.na_cota(cota_alvo).cota_assentamento
+
+            # Tip coefficients (resolved once per soil type)
+            medida_ponta = perfil_spt.obter_medida(
+                cota + 1, estrategia='mais_proxima'
+            )
+            K = k_camadas.para_solo(medida_ponta.tipo_solo)
+
+            if fatores is None:
+                fatores = self._provider.get_f1_f2(
+                    tipo_estaca_norm, estaca.secao_transversal
+                )
+            f1, f2 = fatores
+
+            Rp = self.calcular_rp(K, medida_ponta.N_SPT, f1, area_ponta)
+
+            # Extend the prefix sum with the layers now above the tip
+            while (
+                proxima_camada < len(profundidades)
+                and profundidades[proxima_camada] < cota
+            ):
+                K_camada = k_camadas[proxima_camada]
+                Rl += self.calcular_rl_parcial(
+                    alpha=alpha_camadas[proxima_camada],
+                    K=K_camada,
+                    Nl=preparado.n_spt[proxima_camada],
+                    f2=f2,
+                    perimetro=perimetro,
+                    espessura_camada=preparado.espessuras[proxima_camada],
+                )
+                proxima_camada += 1
+
+            curva.adicionar(
+                cota, Rp, Rl, Rp + Rl, self.calcular_carga_admissivel(Rp, Rl)
+            )
+
+        return curva.construir()
+
     def cota_parada(self, perfil_spt: PerfilSPT) -> int:
         """
         Determine stopping depth for Aoki-Velloso.
@@ -7,10 +7,56 @@ domain logic depends on abstractions, not concrete implementations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
+from weakref import WeakKeyDictionary
+
+from calculus_core.domain.calculation.prepared import PerfilPreparado
+from calculus_core.domain.model import (
+    PROFUNDIDADE_TOLERANCIA,
+    Estaca,
+    MedidaSPT,
+    PerfilSPT,
+)
+from calculus_core.domain.value_objects import (
+    CurvaCapacidade,
+    ResultadoCalculo,
+)
+
+
+def camada_exata_no_indice(
+    medidas: Sequence[MedidaSPT], indice: int, profundidade: float
+) -> MedidaSPT | None:
+    """
+    Return the layer at ``indice`` if it is the exact match for a depth.
+
+    Used by single-pass curves that already know, through a running
+    pointer, where a depth falls in the sorted measurements. Returns None
+    when the layer is not an unambiguous exact match, so callers can fall
+    back to ``PerfilSPT.obter_medida`` and keep its lookup semantics.
 
-from calculus_core.domain.model import Estaca, PerfilSPT
-from calculus_core.domain.value_objects import ResultadoCalculo
+    Args:
+        medidas: Measurements sorted by depth.
+        indice: Index of the first layer at or below ``profundidade``.
+        profundidade: Depth in meters.
+
+    Returns:
+        The matching MedidaSPT, or None.
+    """
+    if indice >= len(medidas):
+        return None
+    if (
+        abs(medidas[indice].profundidade - profundidade)
+        >= PROFUNDIDADE_TOLERANCIA
+    ):
+        return None
+    if (
+        indice > 0
+        and abs(medidas[indice - 1].profundidade - profundidade)
+        < PROFUNDIDADE_TOLERANCIA
+    ):
+        return None
+    return medidas[indice]
 
 
 @runtime_checkable
@@ -95,6 +141,78 @@ class MetodoCalculo(ABC):
         """
         pass
 
+    def calcular_curva(
+        self, perfil_spt: PerfilSPT, estaca: Estaca
+    ) -> CurvaCapacidade:
+        """
+        Execute the calculation for every cota up to the stopping depth.
+
+        The default implementation evaluates ``calcular`` once per cota.
+        Methods can override it with a single-pass implementation, as long
+        as the results stay identical to the per-cota evaluation.
+
+        Args:
+            perfil_spt: SPT profile with soil layers.
+            estaca: Prototype pile (cloned at each cota via ``na_cota``).
+
+        Returns:
+            CurvaCapacidade ordered by cota.
+        """
+        return CurvaCapacidade.de_resultados(
+            self.calcular(perfil_spt, estaca.na_cota(cota))
+            for cota in range(1, self.cota_parada(perfil_spt) + 1)
+        )
+
+    def perfil_preparado(self, perfil_spt: PerfilSPT) -> PerfilPreparado:
+        """
+        Return the prepared (per-layer coefficient) form of a profile.
+
+        Preparations are cached per calculator and profile, and rebuilt
+        when the profile changes.
+
+        Args:
+            perfil_spt: SPT profile.
+
+        Returns:
+            PerfilPreparado for this profile.
+        """
+        cache = self.__dict__.get('_perfis_preparados')
+        if cache is None:
+            cache = self._perfis_preparados = WeakKeyDictionary()
+        preparado = cache.get(perfil_spt)
+        if preparado is None or not preparado.atualizado(perfil_spt):
+            preparado = cache[perfil_spt] = PerfilPreparado(perfil_spt)
+        return preparado
+
+    def verificar_estaca(self, estaca: Estaca) -> None:
+        """
+        Check that the method has coefficients for a pile type.
+
+        Only lookups that depend on the pile alone are checked, so a pile
+        that passes can still fail for a particular soil. The default
+        implementation accepts every pile.
+
+        Args:
+            estaca: Pile to check (type and geometry).
+
+        Raises:
+            ValueError: If the method cannot be applied to the pile.
+        """
+
+    def verificar_solo(self, tipo_solo: str, estaca: Estaca) -> None:
+        """
+        Check that the method has coefficients for a soil and pile.
+
+        The default implementation accepts every soil.
+
+        Args:
+            tipo_solo: Soil type name.
+            estaca: Pile (type and construction process).
+
+        Raises:
+            ValueError: If the coefficients are not defined.
+        """
+
     @abstractmethod
     def cota_parada(self, perfil_spt: PerfilSPT) -> int:
         """
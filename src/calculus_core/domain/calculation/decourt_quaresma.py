@@ -8,9 +8,16 @@ Coefficients are injected through the DecourtCoefficientProvider protocol.
 from calculus_core.domain.calculation.base import (
     DecourtCoefficientProvider,
     MetodoCalculo,
+    camada_exata_no_indice,
 )
+from calculus_core.domain.calculation.prepared import CoeficientesPorCamada
 from calculus_core.domain.model import Estaca, PerfilSPT
-from calculus_core.domain.value_objects import ResultadoCalculo
+from calculus_core.domain.soil_types import CODIGOS_ESTACA, CODIGOS_SOLO
+from calculus_core.domain.value_objects import (
+    ConstrutorCurva,
+    CurvaCapacidade,
+    ResultadoCalculo,
+)
 
 # Mapping for soil type normalization
 MAPEAMENTO_SOLO_DECOURT = {
@@ -85,6 +92,14 @@ def normalizar_tipo_estaca_decourt(tipo_estaca: str) -> str:
     return norm
 
 
+# Method-specific names indexed by soil/pile code
+SOLO_DECOURT = CODIGOS_SOLO.mapear(normalizar_tipo_solo_decourt)
+SOLO_DECOURT_K = CODIGOS_SOLO.mapear(
+    lambda tipo_solo: normalizar_tipo_solo_decourt(tipo_solo, para_K=True)
+)
+ESTACA_DECOURT = CODIGOS_ESTACA.mapear(normalizar_tipo_estaca_decourt)
+
+
 class DecourtQuaresmaCalculator(MetodoCalculo):
     """
     Calculator for the Décourt-Quaresma (1978) method.
@@ -155,15 +170,80 @@ class DecourtQuaresmaCalculator(MetodoCalculo):
         # N_l is the average along the shaft.
         # We include all layers up to but not including the tip depth.
         # Assuming measurements are ordered by depth.
-        N_spts = [
-            m.N_SPT for m in perfil_spt.medidas if m.profundidade < cota_tip
-        ]
+        N_spts = [m.N_SPT for m in perfil_spt.medidas_acima(cota_tip)]
 
         if not N_spts:
             return 0.0
 
         return sum(N_spts) / len(N_spts)
 
+    def coeficientes_camadas(
+        self, perfil_spt: PerfilSPT, estaca: Estaca
+    ) -> tuple[
+        CoeficientesPorCamada, CoeficientesPorCamada, CoeficientesPorCamada
+    ]:
+        """
+        Resolve K, alpha and beta for every layer of a profile.
+
+        K depends on the construction process and alpha/beta on the pile
+        type, so each combination is resolved once per profile.
+
+        Args:
+            perfil_spt: SPT profile.
+            estaca: Pile (only its type and construction process are used).
+
+        Returns:
+            Tuple of (K, alpha, beta) per layer.
+        """
+        preparado = self.perfil_preparado(perfil_spt)
+        processo = estaca.processo_construcao
+        tipo_estaca = ESTACA_DECOURT.para_nome(estaca.tipo)
+        k_camadas = preparado.coeficientes(
+            ('K', processo),
+            lambda codigo: self._provider.get_k(
+                SOLO_DECOURT_K[codigo], processo
+            ),
+        )
+        alpha_camadas = preparado.coeficientes(
+            ('alpha', tipo_estaca),
+            lambda codigo: self._provider.get_alpha(
+                SOLO_DECOURT[codigo], tipo_estaca
+            ),
+        )
+        beta_camadas = preparado.coeficientes(
+            ('beta', tipo_estaca),
+            lambda codigo: self._provider.get_beta(
+                SOLO_DECOURT[codigo], tipo_estaca
+            ),
+        )
+        return k_camadas, alpha_camadas, beta_camadas
+
+    def verificar_estaca(self, estaca: Estaca) -> None:
+        """Check that alpha and beta exist for the pile in some soil group."""
+        tipo_estaca = ESTACA_DECOURT.para_nome(estaca.tipo)
+        erro: ValueError | None = None
+        for grupo in MAPEAMENTO_SOLO_DECOURT:
+            try:
+                self._provider.get_alpha(grupo, tipo_estaca)
+                self._provider.get_beta(grupo, tipo_estaca)
+            except ValueError as exc:
+                erro = exc
+            else:
+                return
+        if erro is not None:
+            raise erro
+
+    def verificar_solo(self, tipo_solo: str, estaca: Estaca) -> None:
+        """Check that K, alpha and beta are defined for soil and pile."""
+        # Held until the lookups are done, so the code stays assigned
+        reserva = CODIGOS_SOLO.reservar(tipo_solo)
+        tipo_estaca = ESTACA_DECOURT.para_nome(estaca.tipo)
+        self._provider.get_k(
+            SOLO_DECOURT_K[reserva.codigo], estaca.processo_construcao
+        )
+        self._provider.get_alpha(SOLO_DECOURT[reserva.codigo], tipo_estaca)
+        self._provider.get_beta(SOLO_DECOURT[reserva.codigo], tipo_estaca)
+
     @staticmethod
     def calcular_rp(
         alpha: float, Np: float, K: float, area_ponta: float
@@ -230,20 +310,17 @@ class DecourtQuaresmaCalculator(MetodoCalculo):
         else:
             camada_ponta = perfil_spt.obter_medida(cota)
 
-        tipo_solo_ponta = normalizar_tipo_solo_decourt(camada_ponta.tipo_solo)
-        tipo_solo_K = normalizar_tipo_solo_decourt(
-            camada_ponta.tipo_solo, para_K=True
-        )
-        tipo_estaca = normalizar_tipo_estaca_decourt(estaca.tipo)
-
         # Calculate Np and Nl
         Np = self.calcular_np(perfil_spt, cota)
         Nl = self.calcular_nl(perfil_spt, estaca)
 
-        # Get coefficients
-        K = self._provider.get_k(tipo_solo_K, estaca.processo_construcao)
-        alpha = self._provider.get_alpha(tipo_solo_ponta, tipo_estaca)
-        beta = self._provider.get_beta(tipo_solo_ponta, tipo_estaca)
+        # Get coefficients (resolved once per profile and pile type)
+        k_camadas, alpha_camadas, beta_camadas = self.coeficientes_camadas(
+            perfil_spt, estaca
+        )
+        K = k_camadas.para_solo(camada_ponta.tipo_solo)
+        alpha = alpha_camadas.para_solo(camada_ponta.tipo_solo)
+        beta = beta_camadas.para_solo(camada_ponta.tipo_solo)
 
         # Calculate resistances
         Rp = self.calcular_rp(alpha, Np, K, estaca.area_ponta)
@@ -266,6 +343,86 @@ class DecourtQuaresmaCalculator(MetodoCalculo):
             capacidade_carga_adm=carga_adm,
         )
 
+    def calcular_curva(
+        self, perfil_spt: PerfilSPT, estaca: Estaca
+    ) -> CurvaCapacidade:
+        """
+        Execute the Décourt-Quaresma calculation for every cota in one pass.
+
+        Nl is carried down the profile as a running sum and count of
+        N_SPT above the tip, and Np is resolved from the layers adjacent
+        to the running pointer. Lookups that are not exact layer hits fall
+        back to the scalar path, so results are identical to ``calcular``.
+
+        Args:
+            perfil_spt: SPT profile.
+            estaca: Prototype pile (cloned at each cota via ``na_cota``).
+
+        Returns:
+            CurvaCapacidade ordered by cota.
+        """
+        medidas = perfil_spt.medidas
+        k_camadas, alpha_camadas, beta_camadas = self.coeficientes_camadas(
+            perfil_spt, estaca
+        )
+        area_ponta = estaca.area_ponta
+        perimetro = estaca.perimetro
+
+        soma_n = 0
+        contagem_n = 0
+        indice = 0  # First layer at or below the cota
+        indice_abaixo = 0  # First layer at or below cota + 1
+        curva = ConstrutorCurva()
+
+        for cota_alvo in range(1, self.cota_parada(perfil_spt) + 1):
+            cota = estaca.na_cota(cota_alvo).cota_assentamento
+
+            # Advance the running N_SPT sum along the shaft
+            while (
+                indice < len(medidas) and medidas[indice].profundidade < cota
+            ):
+                soma_n += medidas[indice].N_SPT
+                contagem_n += 1
+                indice += 1
+            while (
+                indice_abaixo < len(medidas)
+                and medidas[indice_abaixo].profundidade < cota + 1
+            ):
+                indice_abaixo += 1
+
+            medida_acima = camada_exata_no_indice(medidas, indice, cota)
+            medida_abaixo = camada_exata_no_indice(
+                medidas, indice_abaixo, cota + 1
+            )
+
+            # Tip layer for coefficients
+            if medida_abaixo is not None:
+                camada_ponta = medida_abaixo
+            elif cota + 1 in perfil_spt:
+                camada_ponta = perfil_spt.obter_medida(cota + 1)
+            else:
+                camada_ponta = perfil_spt.obter_medida(cota)
+
+            # Np from the neighbouring layers, Nl from the running mean
+            if medida_acima is not None and medida_abaixo is not None:
+                Np = (medida_acima.N_SPT + medida_abaixo.N_SPT) / 2
+            else:
+                Np = self.calcular_np(perfil_spt, cota)
+            Nl = soma_n / contagem_n if contagem_n else 0.0
+
+            K = k_camadas.para_solo(camada_ponta.tipo_solo)
+            alpha = alpha_camadas.para_solo(camada_ponta.tipo_solo)
+            beta = beta_camadas.para_solo(camada_ponta.tipo_solo)
+
+            Rp = self.calcular_rp(alpha, Np, K, area_ponta)
+            Rl = self.calcular_rl(beta, Nl, perimetro, max(cota - 1, 0))
+
+            curva.adicionar(
+                cota, Rp, Rl, Rp + Rl, self.calcular_carga_adm_decourt(Rp, Rl)
+            )
+
+        return curva.construir()
+
     @staticmethod
     def calcular_carga_adm_decourt(Rp: float, Rl: float) -> float:
         """
@@ -0,0 +1,248 @@
+"""
+Memoized Calculations
+
+LRU result cache around a calculation method.
+
+Interactive reruns and batch jobs evaluate the same (method, profile,
+pile, cota) combination many times. Results depend only on the profile
+content (``PerfilSPT.impressao_digital``) and on the pile geometry
+(``chave_estaca``), so they can be cached under those keys and returned
+without recalculating.
+
+Example:
+    calc = MetodoCalculoMemoizado(AokiVellosoCalculator(provider), 1024)
+    calc.calcular(perfil, estaca)  # calculated
+    calc.calcular(perfil, estaca)  # from cache
+    calc.cache.estatisticas()
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+from calculus_core.domain.calculation.base import MetodoCalculo
+from calculus_core.domain.model import Estaca, PerfilSPT, chave_estaca
+from calculus_core.domain.value_objects import (
+    CurvaCapacidade,
+    ResultadoCalculo,
+)
+
+V = TypeVar('V')
+
+_AUSENTE = object()
+
+
+@dataclass(frozen=True)
+class EstatisticasCache:
+    """
+    Snapshot of a cache's counters.
+
+    Attributes:
+        acertos: Lookups answered from the cache.
+        falhas: Lookups that had to compute the value.
+        remocoes: Entries dropped for size or age.
+        tamanho: Entries currently stored.
+        tamanho_maximo: Capacity (None for unbounded).
+    """
+
+    acertos: int
+    falhas: int
+    remocoes: int
+    tamanho: int
+    tamanho_maximo: int | None
+
+    @property
+    def taxa_acerto(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+
+class CacheLRU(Generic[V]):
+    """
+    Thread-safe least-recently-used cache with optional expiry.
+
+    Attributes:
+        tamanho_maximo: Maximum number of entries (None for unbounded).
+        ttl: Seconds an entry stays valid (None for no expiry).
+    """
+
+    def __init__(
+        self,
+        tamanho_maximo: int | None = 1024,
+        ttl: float | None = None,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            tamanho_maximo: Maximum number of entries (None for unbounded).
+            ttl: Seconds an entry stays valid (None for no expiry).
+            relogio: Clock used for expiry (injectable for tests).
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if tamanho_maximo is not None and tamanho_maximo <= 0:
+            raise ValueError('Tamanho máximo do cache deve ser positivo.')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('TTL do cache deve ser positivo.')
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl = ttl
+        self._relogio = relogio
+        self._dados: OrderedDict[Hashable, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._acertos = 0
+        self._falhas = 0
+        self._remocoes = 0
+
+    def obter(self, chave: Hashable, calcular: Callable[[], V]) -> V:
+        """
+        Return the cached value for ``chave``, computing it if needed.
+
+        The value is computed outside the lock, so concurrent misses on
+        the same key may both compute it; the last one is kept.
+
+        Args:
+            chave: Hashable key.
+            calcular: Produces the value on a miss.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        valor = self._buscar(chave)
+        if valor is not _AUSENTE:
+            return valor
+        valor = calcular()
+        self._guardar(chave, valor)
+        return valor
+
+    def _buscar(self, chave: Hashable) -> Any:
+        with self._lock:
+            entrada = self._dados.get(chave)
+            if entrada is not None:
+                valor, expira_em = entrada
+                if self.ttl is None or self._relogio() < expira_em:
+                    self._dados.move_to_end(chave)
+                    self._acertos += 1
+                    return valor
+                del self._dados[chave]
+                self._remocoes += 1
+            self._falhas += 1
+            return _AUSENTE
+
+    def _guardar(self, chave: Hashable, valor: V) -> None:
+        expira_em = self._relogio() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._dados[chave] = (valor, expira_em)
+            self._dados.move_to_end(chave)
+            if self.tamanho_maximo is not None:
+                while len(self._dados) > self.tamanho_maximo:
+                    self._dados.popitem(last=False)
+                    self._remocoes += 1
+
+    def limpar(self) -> None:
+        """Remove every entry (the counters are kept)."""
+        with self._lock:
+            self._dados.clear()
+
+    def __len__(self) -> int:
+        return len(self._dados)
+
+    def estatisticas(self) -> EstatisticasCache:
+        """Return a snapshot of the hit/miss counters."""
+        with self._lock:
+            return EstatisticasCache(
+                acertos=self._acertos,
+                falhas=self._falhas,
+                remocoes=self._remocoes,
+                tamanho=len(self._dados),
+                tamanho_maximo=self.tamanho_maximo,
+            )
+
+
+class MetodoCalculoMemoizado(MetodoCalculo):
+    """
+    Calculation method whose results are cached by content.
+
+    Wraps another MetodoCalculo. ``calcular`` and ``calcular_curva`` are
+    cached under (profile fingerprint, pile key); every other attribute
+    is delegated to the wrapped method. Failed calculations are not
+    cached.
+
+    Attributes:
+        metodo: The wrapped calculation method.
+        cache: Result cache (may be shared between wrappers of the same
+            method).
+    """
+
+    def __init__(
+        self,
+        metodo: MetodoCalculo,
+        tamanho_maximo: int | None = 1024,
+        ttl: float | None = None,
+        cache: CacheLRU | None = None,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            metodo: Calculation method to wrap.
+            tamanho_maximo: Cache capacity when ``cache`` is not given.
+            ttl: Entry lifetime in seconds when ``cache`` is not given.
+            cache: Existing cache to use instead of a new one.
+        """
+        self.metodo = metodo
+        self.cache = (
+            cache if cache is not None else CacheLRU(tamanho_maximo, ttl)
+        )
+
+    def calcular(
+        self, perfil_spt: PerfilSPT, estaca: Estaca
+    ) -> ResultadoCalculo:
+        """Return the cached result, calculating it on a miss."""
+        chave = (
+            'calcular',
+            perfil_spt.impressao_digital,
+            chave_estaca(estaca),
+        )
+        return self.cache.obter(
+            chave, lambda: self.metodo.calcular(perfil_spt, estaca)
+        )
+
+    def calcular_curva(
+        self, perfil_spt: PerfilSPT, estaca: Estaca
+    ) -> CurvaCapacidade:
+        """Return the cached curve, calculating it on a miss."""
+        # The prototype's own cota does not affect the curve
+        chave = (
+            'curva',
+            perfil_spt.impressao_digital,
+            chave_estaca(estaca)[:-1],
+        )
+        # Curves are immutable, so the cached one is shared
+        return self.cache.obter(
+            chave, lambda: self.metodo.calcular_curva(perfil_spt, estaca)
+        )
+
+    def cota_parada(self, perfil_spt: PerfilSPT) -> int:
+        """Delegate to the wrapped method."""
+        return self.metodo.cota_parada(perfil_spt)
+
+    def verificar_estaca(self, estaca: Estaca) -> None:
+        """Delegate to the wrapped method."""
+        self.metodo.verificar_estaca(estaca)
+
+    def verificar_solo(self, tipo_solo: str, estaca: Estaca) -> None:
+        """Delegate to the wrapped method."""
+        self.metodo.verificar_solo(tipo_solo, estaca)
+
+    def __getattr__(self, nome: str) -> Any:
+        # Method-specific helpers (calcular_np, coeficientes_camadas, ...)
+        metodo = self.__dict__.get('metodo')
+        if metodo is None:
+            raise AttributeError(nome)
+        return getattr(metodo, nome)
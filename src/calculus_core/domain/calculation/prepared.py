@@ -0,0 +1,168 @@
+"""
+Prepared Profiles
+
+Per-layer coefficient vectors resolved once per (profile, method).
+
+Soil normalization and coefficient lookups depend only on the layer's soil
+type and on the method (plus, for some methods, the pile type or the
+construction process), never on the pile geometry or on the depth being
+evaluated. A prepared profile resolves them once into per-layer vectors so
+that every later pile/cota evaluation against the same boring is plain
+arithmetic.
+"""
+
+import math
+from collections.abc import Sequence
+from typing import Callable, Hashable
+
+from calculus_core.domain.model import PerfilSPT
+from calculus_core.domain.soil_types import CODIGOS_SOLO, ReservaCodigo
+
+
+class CoeficientesPorCamada:
+    """
+    Coefficient value for every layer of a profile.
+
+    ``valores`` holds one value per layer (NaN where the lookup failed)
+    for arithmetic and vectorized use. Values are resolved once per soil
+    code (``CODIGOS_SOLO``). Lookups that fail (unsupported soil or pile
+    types) are remembered and raised again only when that layer or soil is
+    used, so errors surface exactly where an on-demand lookup would have
+    raised them.
+    """
+
+    __slots__ = (
+        '_funcao',
+        '_por_codigo',
+        '_reservas',
+        'codigos_solo',
+        'valores',
+    )
+
+    def __init__(
+        self, codigos_solo: Sequence[int], funcao: Callable[[int], float]
+    ) -> None:
+        """
+        Resolve a coefficient for every layer.
+
+        Args:
+            codigos_solo: Soil code of each layer.
+            funcao: Maps a soil code to the coefficient.
+        """
+        self.codigos_solo = codigos_solo
+        self._funcao = funcao
+        self._por_codigo: dict[int, float | ValueError] = {}
+        # Soils looked up by name; holding them keeps their codes valid
+        self._reservas: dict[str, ReservaCodigo] = {}
+        self.valores: list[float] = []
+        for codigo in codigos_solo:
+            valor = self._resolver(codigo)
+            self.valores.append(
+                math.nan if isinstance(valor, ValueError) else valor
+            )
+
+    def _resolver(self, codigo: int) -> float | ValueError:
+        valor = self._por_codigo.get(codigo)
+        if valor is None:
+            try:
+                valor = self._funcao(codigo)
+            except ValueError as exc:
+                valor = exc
+            self._por_codigo[codigo] = valor
+        return valor
+
+    def para_codigo(self, codigo: int) -> float:
+        """
+        Return the coefficient for a soil code (layer or not).
+
+        Args:
+            codigo: Soil code from ``CODIGOS_SOLO``.
+
+        Returns:
+            The coefficient value.
+
+        Raises:
+            ValueError: If the coefficient is not defined for the soil.
+        """
+        valor = self._resolver(codigo)
+        if isinstance(valor, ValueError):
+            raise ValueError(*valor.args)
+        return valor
+
+    def para_solo(self, tipo_solo: str) -> float:
+        """Return the coefficient for a soil type name."""
+        reserva = self._reservas.get(tipo_solo)
+        if reserva is None:
+            reserva = self._reservas[tipo_solo] = CODIGOS_SOLO.reservar(
+                tipo_solo
+            )
+        return self.para_codigo(reserva.codigo)
+
+    def __len__(self) -> int:
+        return len(self.codigos_solo)
+
+    def __getitem__(self, indice: int) -> float:
+        valor = self.valores[indice]
+        if math.isnan(valor):
+            # Raises the error recorded for this layer's soil code
+            return self.para_codigo(self.codigos_solo[indice])
+        return valor
+
+
+class PerfilPreparado:
+    """
+    Layer data and coefficient vectors of one profile for one method.
+
+    Holds no reference to the profile itself, so it can be cached in a
+    WeakKeyDictionary keyed by the profile. ``versao`` records the profile
+    version it was prepared from.
+
+    Attributes:
+        versao: Profile version at preparation time.
+        intervalo_padrao: Profile standard interval at preparation time.
+        codigos_solo: Soil code of each layer (``CODIGOS_SOLO``).
+        n_spt: N_SPT of each layer.
+        espessuras: Thickness of each layer (``intervalo_padrao`` when the
+            layer has no explicit thickness).
+    """
+
+    def __init__(self, perfil_spt: PerfilSPT) -> None:
+        colunas = perfil_spt.colunas()
+        self.versao = perfil_spt.versao
+        self.intervalo_padrao = perfil_spt.intervalo_padrao
+        # The columns hold the reservations of the soil codes
+        self._colunas = colunas
+        self.codigos_solo = colunas.codigos_solo
+        self.n_spt = tuple(colunas.n_spt)
+        self.espessuras = tuple(
+            perfil_spt.intervalo_padrao if math.isnan(espessura) else espessura
+            for espessura in colunas.espessuras
+        )
+        self._vetores: dict[Hashable, CoeficientesPorCamada] = {}
+
+    def atualizado(self, perfil_spt: PerfilSPT) -> bool:
+        """Check whether this preparation still matches the profile."""
+        return (
+            self.versao == perfil_spt.versao
+            and self.intervalo_padrao == perfil_spt.intervalo_padrao
+        )
+
+    def coeficientes(
+        self, chave: Hashable, funcao: Callable[[int], float]
+    ) -> CoeficientesPorCamada:
+        """
+        Return the per-layer vector for ``chave``, resolving it once.
+
+        Args:
+            chave: Identifies the coefficient (e.g. ``('K',)`` or
+                ``('alpha', 'escavada')``).
+            funcao: Maps a soil code to the coefficient.
+
+        Returns:
+            CoeficientesPorCamada aligned with the profile layers.
+        """
+        vetor = self._vetores.get(chave)
+        if vetor is None:
+            vetor = CoeficientesPorCamada(self.codigos_solo, funcao)
+            self._vetores[chave] = vetor
+        return vetor
@@ -8,9 +8,16 @@ Coefficients are injected through the TeixeiraCoefficientProvider protocol.
 from calculus_core.domain.calculation.base import (
     MetodoCalculo,
     TeixeiraCoefficientProvider,
+    camada_exata_no_indice,
 )
+from calculus_core.domain.calculation.prepared import CoeficientesPorCamada
 from calculus_core.domain.model import Estaca, PerfilSPT
-from calculus_core.domain.value_objects import ResultadoCalculo
+from calculus_core.domain.soil_types import CODIGOS_ESTACA, CODIGOS_SOLO
+from calculus_core.domain.value_objects import (
+    ConstrutorCurva,
+    CurvaCapacidade,
+    ResultadoCalculo,
+)
 
 # Mapping for soil type normalization
 MAPEAMENTO_SOLO_TEIXEIRA = {
@@ -55,6 +62,11 @@ def normalizar_tipo_estaca_teixeira(tipo_estaca: str) -> str:
     return tipo_estaca.lower().replace(' ', '_').replace('-', '_')
 
 
+# Method-specific names indexed by soil/pile code
+SOLO_TEIXEIRA = CODIGOS_SOLO.mapear(normalizar_tipo_solo_teixeira)
+ESTACA_TEIXEIRA = CODIGOS_ESTACA.mapear(normalizar_tipo_estaca_teixeira)
+
+
 class TeixeiraCalculator(MetodoCalculo):
     """
     Calculator for the Teixeira (1996) method.
@@ -116,6 +128,85 @@ class TeixeiraCalculator(MetodoCalculo):
             prof_inicio, cota_assentamento, metodo='media'
         )
 
+    def coeficientes_camadas(
+        self, perfil_spt: PerfilSPT, estaca: Estaca
+    ) -> CoeficientesPorCamada:
+        """
+        Resolve alpha for every layer of a profile, for the pile type.
+
+        Args:
+            perfil_spt: SPT profile.
+            estaca: Pile (only its type is used).
+
+        Returns:
+            Alpha per layer.
+        """
+        tipo_estaca = ESTACA_TEIXEIRA.para_nome(estaca.tipo)
+        return self.perfil_preparado(perfil_spt).coeficientes(
+            ('alpha', tipo_estaca),
+            lambda codigo: self._provider.get_alpha(
+                SOLO_TEIXEIRA[codigo], tipo_estaca
+            ),
+        )
+
+    def verificar_estaca(self, estaca: Estaca) -> None:
+        """Check that beta is defined for the pile type."""
+        self._provider.get_beta(ESTACA_TEIXEIRA.para_nome(estaca.tipo))
+
+    def verificar_solo(self, tipo_solo: str, estaca: Estaca) -> None:
+        """Check that alpha is defined for the soil and pile type."""
+        self._provider.get_alpha(
+            SOLO_TEIXEIRA.para_nome(tipo_solo),
+            ESTACA_TEIXEIRA.para_nome(estaca.tipo),
+        )
+
+    def calcular_np_curvas(
+        self,
+        perfil_spt: PerfilSPT,
+        cotas: list[float],
+        diametros: list[float],
+    ) -> dict[float, list[float]]:
+        """
+        Calculate Np for every cota and every diameter in one pass each.
+
+        Each diameter slides the interval [cota - 4*D, cota + 1*D] down
+        the profile, so its cotas are served by a single windowed query.
+
+        Args:
+            perfil_spt: SPT profile.
+            cotas: Settlement depths, preferably in ascending order.
+            diametros: Pile diameters (m).
+
+        Returns:
+            Mapping of diameter to the Np values for each cota.
+        """
+        return {
+            diametro: perfil_spt.obter_media_n_spt_intervalos(
+                (cota - 4 * diametro, cota + 1 * diametro) for cota in cotas
+            )
+            for diametro in diametros
+        }
+
+    def calcular_nl_curva(
+        self, perfil_spt: PerfilSPT, cotas: list[float]
+    ) -> list[float]:
+        """
+        Calculate Nl for every cota in one pass.
+
+        Args:
+            perfil_spt: SPT profile.
+            cotas: Settlement depths, preferably in ascending order.
+
+        Returns:
+            Nl value for each cota.
+        """
+        if not cotas:
+            return []
+        prof_inicio = perfil_spt.profundidade_minima
+        return perfil_spt.obter_media_n_spt_intervalos(
+            (prof_inicio, cota) for cota in cotas
+        )
+
     @staticmethod
     def calcular_rp(alpha: float, Np: float, area_ponta: float) -> float:
         """
@@ -177,15 +268,16 @@ class TeixeiraCalculator(MetodoCalculo):
         else:
             camada_ponta = perfil_spt.obter_medida(cota)
 
-        tipo_solo = normalizar_tipo_solo_teixeira(camada_ponta.tipo_solo)
-        tipo_estaca = normalizar_tipo_estaca_teixeira(estaca.tipo)
+        tipo_estaca = ESTACA_TEIXEIRA.para_nome(estaca.tipo)
 
         # Calculate Np and Nl
         Np = self.calcular_np(perfil_spt, cota, estaca.secao_transversal)
         Nl = self.calcular_nl(perfil_spt, cota)
 
-        # Get coefficients
-        alpha = self._provider.get_alpha(tipo_solo, tipo_estaca)
+        # Get coefficients (alpha resolved once per profile and pile type)
+        alpha = self.coeficientes_camadas(perfil_spt, estaca).para_solo(
+            camada_ponta.tipo_solo
+        )
         beta = self._provider.get_beta(tipo_estaca)
 
         # Calculate resistances
@@ -209,6 +301,76 @@ class TeixeiraCalculator(MetodoCalculo):
             capacidade_carga_adm=carga_adm,
         )
 
+    def calcular_curva(
+        self, perfil_spt: PerfilSPT, estaca: Estaca
+    ) -> CurvaCapacidade:
+        """
+        Execute the Teixeira calculation for every cota in one pass.
+
+        Np and Nl come from the windowed kernels above instead of one
+        interval scan per cota, and the tip layer is resolved from a
+        running pointer. Results are identical to ``calcular``.
+
+        Args:
+            perfil_spt: SPT profile.
+            estaca: Prototype pile (cloned at each cota via ``na_cota``).
+
+        Returns:
+            CurvaCapacidade ordered by cota.
+        """
+        cotas = [
+            estaca.na_cota(cota_alvo).cota_assentamento
+            for cota_alvo in range(1, self.cota_parada(perfil_spt) + 1)
+        ]
+        if not cotas:
+            return ConstrutorCurva().construir()
+
+        diametro = estaca.secao_transversal
+        valores_np = self.calcular_np_curvas(perfil_spt, cotas, [diametro])[
+            diametro
+        ]
+        valores_nl = self.calcular_nl_curva(perfil_spt, cotas)
+
+        medidas = perfil_spt.medidas
+        tipo_estaca = ESTACA_TEIXEIRA.para_nome(estaca.tipo)
+        area_ponta = estaca.area_ponta
+        perimetro = estaca.perimetro
+
+        alpha_camadas = self.coeficientes_camadas(perfil_spt, estaca)
+        beta: float | None = None
+        indice_abaixo = 0  # First layer at or below cota + 1
+        curva = ConstrutorCurva()
+
+        for cota, Np, Nl in zip(cotas, valores_np, valores_nl):
+            while (
+                indice_abaixo < len(medidas)
+                and medidas[indice_abaixo].profundidade < cota + 1
+            ):
+                indice_abaixo += 1
+
+            # Tip layer for the alpha coefficient
+            camada_ponta = camada_exata_no_indice(
+                medidas, indice_abaixo, cota + 1
+            )
+            if camada_ponta is None:
+                if cota + 1 in perfil_spt:
+                    camada_ponta = perfil_spt.obter_medida(cota + 1)
+                else:
+                    camada_ponta = perfil_spt.obter_medida(cota)
+
+            alpha = alpha_camadas.para_solo(camada_ponta.tipo_solo)
+            if beta is None:
+                beta = self._provider.get_beta(tipo_estaca)
+
+            Rp = self.calcular_rp(alpha, Np, area_ponta)
+            Rl = self.calcular_rl(beta, Nl, perimetro, max(cota - 1, 0))
+
+            curva.adicionar(
+                cota, Rp, Rl, Rp + Rl, self.calcular_carga_adm_teixeira(Rp, Rl)
+            )
+
+        return curva.construir()
+
     @staticmethod
     def calcular_carga_adm_teixeira(Rp: float, Rl: float) -> float:
         """
@@ -6,19 +6,97 @@ New methods can be registered dynamically, making it easy to add
 +12 or more methods without modifying core code.
 
 Design Pattern: Plugin/Registry Pattern
+
+Installed packages can contribute methods through the
+``calculus_core.methods`` entry point group. The entry point name is the
+method ID and its object is a CalculationMethodInfo (or a list of them, or
+a callable returning either). Entry points are only loaded when their ID
+is looked up, and a ``'module:attribute'`` calculator factory is only
+imported when the first calculator is created:
+
+    [project.entry-points."calculus_core.methods"]
+    meu_metodo_2024 = "meu_pacote.metadados:INFO"
+
+    # meu_pacote/metadados.py (no calculator imports)
+    INFO = CalculationMethodInfo(
+        id='meu_metodo_2024',
+        ...,
+        calculator_factory='meu_pacote.calculo:criar_calculadora',
+    )
 """
 
+import importlib
+import threading
 from dataclasses import dataclass
-from typing import Callable
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Callable
 
 from calculus_core.domain.calculation.base import MetodoCalculo
-from calculus_core.domain.soil_types import SoilMapperRegistry, SoilTypeMapper
+from calculus_core.domain.soil_types import (
+    AokiVellosoSoilMapper,
+    DecourtQuaresmaSoilMapper,
+    SoilMapperRegistry,
+    SoilTypeMapper,
+    TeixeiraSoilMapper,
+)
+from calculus_core.utils.logging_config import get_logger
+
+ENTRY_POINT_GROUP = 'calculus_core.methods'
+
+_logger = get_logger(__name__)
 
 # =============================================================================
 # METHOD METADATA
 # =============================================================================
 
 
+class LazyCalculatorFactory:
+    """
+    Calculator factory named as ``'module:attribute'``.
+
+    The module is imported on the first call, so method metadata can be
+    registered without loading the calculator or its coefficient tables.
+    """
+
+    __slots__ = ('_factory', 'target')
+
+    def __init__(self, target: str):
+        """
+        Initialize the factory.
+
+        Args:
+            target: ``'module:attribute'`` path of a zero-argument callable
+                returning a MetodoCalculo (the attribute may be dotted).
+
+        Raises:
+            ValueError: If ``target`` is not in ``module:attribute`` form.
+        """
+        module, sep, attribute = target.partition(':')
+        if not sep or not module or not attribute:
+            raise ValueError(
+                f'Fábrica de calculadora inválida: "{target}". '
+                'Use o formato "modulo:atributo".'
+            )
+        self.target = target
+        self._factory: Callable[[], MetodoCalculo] | None = None
+
+    def resolve(self) -> Callable[[], MetodoCalculo]:
+        """Import and return the target callable."""
+        if self._factory is None:
+            module, _, attribute = self.target.partition(':')
+            obj: Any = importlib.import_module(module)
+            for part in attribute.split('.'):
+                obj = getattr(obj, part)
+            self._factory = obj
+        return self._factory
+
+    def __call__(self) -> MetodoCalculo:
+        return self.resolve()()
+
+    def __repr__(self) -> str:
+        return f'LazyCalculatorFactory({self.target!r})'
+
+
 @dataclass
 class CalculationMethodInfo:
     """
@@ -42,8 +120,8 @@ class CalculationMethodInfo:
     supported_pile_types: list[str]
     supported_soil_types: list[str]
 
-    # Factory
-    calculator_factory: Callable[[], MetodoCalculo]
+    # Factory (a 'module:attribute' string is imported on first use)
+    calculator_factory: Callable[[], MetodoCalculo] | str
     soil_mapper: SoilTypeMapper | None = None
 
     # Constraints
@@ -51,6 +129,12 @@ class CalculationMethodInfo:
     min_spt_depth: int = 2
     notes: str | None = None
 
+    def __post_init__(self):
+        if isinstance(self.calculator_factory, str):
+            self.calculator_factory = LazyCalculatorFactory(
+                self.calculator_factory
+            )
+
 
 # =============================================================================
 # METHOD REGISTRY
@@ -69,6 +153,79 @@ class CalculationMethodRegistry:
     """
 
     _methods: dict[str, CalculationMethodInfo] = {}
+    _instances: dict[str, MetodoCalculo] = {}
+    # Entry points found by discover_plugins, loaded when first looked up
+    _pending: dict[str, EntryPoint] = {}
+    # Bumped on every change, so derived caches know when to rebuild
+    _version: int = 0
+    # Built-ins and plugins are registered on first use of the registry
+    _builtins_loaded: bool = False
+    _lock = threading.RLock()
+
+    @classmethod
+    def _ensure_builtins(cls) -> None:
+        """Register the built-in methods and find plugins, once."""
+        if cls._builtins_loaded:
+            return
+        with cls._lock:
+            if not cls._builtins_loaded:
+                _register_builtin_methods()
+                cls._discover()
+                cls._builtins_loaded = True
+
+    @classmethod
+    def discover_plugins(cls) -> list[str]:
+        """
+        Find methods published in the ``calculus_core.methods`` group.
+
+        Only the entry point names are read; each entry point is loaded
+        when its method ID is first looked up. Names that are already
+        registered are ignored, so built-in and explicitly registered
+        methods take precedence.
+
+        Returns:
+            IDs of the newly discovered (still unloaded) methods.
+        """
+        cls._ensure_builtins()
+        return cls._discover()
+
+    @classmethod
+    def _discover(cls) -> list[str]:
+        novos = []
+        with cls._lock:
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                nome = entry_point.name
+                if nome in cls._methods or nome in cls._pending:
+                    continue
+                cls._pending[nome] = entry_point
+                novos.append(nome)
+        return novos
+
+    @classmethod
+    def _load_pending(cls, method_id: str | None = None) -> None:
+        """Load one pending entry point (or all of them)."""
+        if not cls._pending:
+            return
+        with cls._lock:
+            nomes = list(cls._pending) if method_id is None else [method_id]
+            for nome in nomes:
+                entry_point = cls._pending.pop(nome, None)
+                if entry_point is None:
+                    continue
+                try:
+                    infos = _plugin_infos(entry_point.load())
+                except Exception:
+                    # A broken plugin must not take the registry down
+                    _logger.warning(
+                        'Falha ao carregar o método "%s" (%s).',
+                        nome,
+                        entry_point.value,
+                        exc_info=True,
+                    )
+                    continue
+                for info in infos:
+                    if info.id not in cls._methods:
+                        cls._add(info)
 
     @classmethod
     def register(cls, method_info: CalculationMethodInfo) -> None:
@@ -78,7 +235,16 @@ class CalculationMethodRegistry:
         Args:
             method_info: Complete method information.
         """
+        cls._ensure_builtins()
+        with cls._lock:
+            cls._pending.pop(method_info.id, None)
+            cls._add(method_info)
+
+    @classmethod
+    def _add(cls, method_info: CalculationMethodInfo) -> None:
         cls._methods[method_info.id] = method_info
+        cls._instances.pop(method_info.id, None)
+        cls._version += 1
 
         # Also register soil mapper if provided
         if method_info.soil_mapper:
@@ -86,11 +252,20 @@ class CalculationMethodRegistry:
                 method_info.id, method_info.soil_mapper
             )
 
+    @classmethod
+    def version(cls) -> int:
+        """Return the change counter (loads the built-in methods)."""
+        cls._ensure_builtins()
+        return cls._version
+
     @classmethod
     def get(cls, method_id: str) -> CalculationMethodInfo:
         """Get method information by ID."""
+        cls._ensure_builtins()
         if method_id not in cls._methods:
-            available = ', '.join(cls._methods.keys())
+            cls._load_pending(method_id)
+        if method_id not in cls._methods:
+            available = ', '.join(cls.list_ids())
             raise ValueError(
                 f'Método "{method_id}" não encontrado. Disponíveis: {available}'
             )
@@ -102,19 +277,41 @@ class CalculationMethodRegistry:
         info = cls.get(method_id)
         return info.calculator_factory()
 
+    @classmethod
+    def get_calculator_instance(cls, method_id: str) -> MetodoCalculo:
+        """
+        Return a shared calculator instance for a method.
+
+        Calculators hold no per-call state, so batch APIs reuse one
+        instance per method (which also keeps its prepared profiles).
+        The instance is dropped when the method is registered again.
+        """
+        cls._ensure_builtins()
+        calculator = cls._instances.get(method_id)
+        if calculator is None:
+            calculator = cls._instances[method_id] = cls.create_calculator(
+                method_id
+            )
+        return calculator
+
     @classmethod
     def list_all(cls) -> list[CalculationMethodInfo]:
         """List all registered methods."""
+        cls._ensure_builtins()
+        cls._load_pending()
         return list(cls._methods.values())
 
     @classmethod
     def list_ids(cls) -> list[str]:
-        """List all method IDs."""
-        return list(cls._methods.keys())
+        """List all method IDs (including plugins not loaded yet)."""
+        cls._ensure_builtins()
+        return [*cls._methods, *cls._pending]
 
     @classmethod
     def list_by_pile_type(cls, pile_type: str) -> list[CalculationMethodInfo]:
         """List methods that support a specific pile type."""
+        cls._ensure_builtins()
+        cls._load_pending()
         pile_type_norm = pile_type.lower().replace(' ', '_')
         return [
             m
@@ -126,6 +323,8 @@ class CalculationMethodRegistry:
     @classmethod
     def list_by_soil_type(cls, soil_type: str) -> list[CalculationMethodInfo]:
         """List methods that support a specific soil type."""
+        cls._ensure_builtins()
+        cls._load_pending()
         soil_type_norm = soil_type.lower().replace(' ', '_')
         return [
             m
@@ -136,19 +335,29 @@ class CalculationMethodRegistry:
 
     @classmethod
     def is_registered(cls, method_id: str) -> bool:
-        """Check if a method is registered."""
-        return method_id in cls._methods
+        """Check if a method is registered (or discovered)."""
+        cls._ensure_builtins()
+        return method_id in cls._methods or method_id in cls._pending
 
     @classmethod
     def unregister(cls, method_id: str) -> None:
         """Unregister a method (useful for testing)."""
+        cls._ensure_builtins()
+        cls._pending.pop(method_id, None)
         if method_id in cls._methods:
             del cls._methods[method_id]
+            cls._instances.pop(method_id, None)
+            cls._version += 1
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered methods (useful for testing)."""
+        # Cleared registries stay empty instead of reloading the built-ins
+        cls._builtins_loaded = True
         cls._methods.clear()
+        cls._pending.clear()
+        cls._instances.clear()
+        cls._version += 1
 
 
 # =============================================================================
@@ -211,27 +420,65 @@ def register_method(
 # =============================================================================
 
 
-def _register_builtin_methods():
-    """Register all built-in calculation methods."""
+def _plugin_infos(obj: Any) -> list[CalculationMethodInfo]:
+    """Normalize what a plugin entry point provides into method infos."""
+    if callable(obj) and not isinstance(obj, CalculationMethodInfo):
+        obj = obj()
+    infos = [obj] if isinstance(obj, CalculationMethodInfo) else list(obj)
+    for info in infos:
+        if not isinstance(info, CalculationMethodInfo):
+            raise TypeError(
+                f'Entry point deve fornecer CalculationMethodInfo, '
+                f'não {type(info).__name__}.'
+            )
+    return infos
+
+
+# Factories import their calculator and provider only when called
+
+
+def _create_aoki_velloso_1975() -> MetodoCalculo:
+    from calculus_core.adapters.coefficients import AokiVelloso1975Provider
+    from calculus_core.domain.calculation import AokiVellosoCalculator
+
+    return AokiVellosoCalculator(AokiVelloso1975Provider())
+
+
+def _create_aoki_velloso_laprovitera_1988() -> MetodoCalculo:
     from calculus_core.adapters.coefficients import (
-        AokiVelloso1975Provider,
         AokiVellosoLaprovitera1988Provider,
-        DecourtQuaresma1978Provider,
-        Teixeira1996Provider,
     )
-    from calculus_core.domain.calculation import (
-        AokiVellosoCalculator,
-        DecourtQuaresmaCalculator,
-        TeixeiraCalculator,
-    )
-    from calculus_core.domain.soil_types import (
-        AokiVellosoSoilMapper,
-        DecourtQuaresmaSoilMapper,
-        TeixeiraSoilMapper,
+    from calculus_core.domain.calculation import AokiVellosoCalculator
+
+    return AokiVellosoCalculator(AokiVellosoLaprovitera1988Provider())
+
+
+def _create_decourt_quaresma_1978() -> MetodoCalculo:
+    from calculus_core.adapters.coefficients import (
+        DecourtQuaresma1978Provider,
     )
+    from calculus_core.domain.calculation import DecourtQuaresmaCalculator
+
+    return DecourtQuaresmaCalculator(DecourtQuaresma1978Provider())
 
+
+def _create_teixeira_1996() -> MetodoCalculo:
+    from calculus_core.adapters.coefficients import Teixeira1996Provider
+    from calculus_core.domain.calculation import TeixeiraCalculator
+
+    return TeixeiraCalculator(Teixeira1996Provider())
+
+
+def _register_builtin_methods():
+    """
+    Register all built-in calculation methods.
+
+    Called by the registry on first use (not at import time). Only the
+    metadata is registered; calculators and coefficient tables load when
+    the first calculator of a method is created.
+    """
     # Aoki-Velloso (1975)
-    CalculationMethodRegistry.register(
+    CalculationMethodRegistry._add(
         CalculationMethodInfo(
             id='aoki_velloso_1975',
             name='Aoki e Velloso (1975)',
@@ -257,15 +504,13 @@ def _register_builtin_methods():
                 'ômega',
             ],
             supported_soil_types=['all'],
-            calculator_factory=lambda: AokiVellosoCalculator(
-                AokiVelloso1975Provider()
-            ),
+            calculator_factory=_create_aoki_velloso_1975,
             soil_mapper=AokiVellosoSoilMapper(),
         )
     )
 
     # Aoki-Velloso (Laprovitera 1988)
-    CalculationMethodRegistry.register(
+    CalculationMethodRegistry._add(
         CalculationMethodInfo(
             id='aoki_velloso_laprovitera_1988',
             name='Aoki e Velloso (1975) por Laprovitera (1988)',
@@ -290,16 +535,14 @@ def _register_builtin_methods():
                 'ômega',
             ],
             supported_soil_types=['all'],
-            calculator_factory=lambda: AokiVellosoCalculator(
-                AokiVellosoLaprovitera1988Provider()
-            ),
+            calculator_factory=_create_aoki_velloso_laprovitera_1988,
             soil_mapper=AokiVellosoSoilMapper(),
             notes='Inclui coeficientes alpha* para SPT não confiável.',
         )
     )
 
     # Décourt-Quaresma (1978)
-    CalculationMethodRegistry.register(
+    CalculationMethodRegistry._add(
         CalculationMethodInfo(
             id='decourt_quaresma_1978',
             name='Décourt e Quaresma (1978)',
@@ -328,15 +571,13 @@ def _register_builtin_methods():
                 'injetada',
             ],
             supported_soil_types=['argila', 'silte', 'areia'],
-            calculator_factory=lambda: DecourtQuaresmaCalculator(
-                DecourtQuaresma1978Provider()
-            ),
+            calculator_factory=_create_decourt_quaresma_1978,
             soil_mapper=DecourtQuaresmaSoilMapper(),
         )
     )
 
     # Teixeira (1996)
-    CalculationMethodRegistry.register(
+    CalculationMethodRegistry._add(
         CalculationMethodInfo(
             id='teixeira_1996',
             name='Teixeira (1996)',
@@ -359,18 +600,12 @@ def _register_builtin_methods():
                 'raiz',
             ],
             supported_soil_types=['all'],
-            calculator_factory=lambda: TeixeiraCalculator(
-                Teixeira1996Provider()
-            ),
+            calculator_factory=_create_teixeira_1996,
             soil_mapper=TeixeiraSoilMapper(),
         )
     )
 
 
-# Auto-register when module is imported
-_register_builtin_methods()
-
-
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -7,13 +7,25 @@ calculations. These entities encapsulate business rules and behaviors.
 Entities:
 - MedidaSPT: Single SPT measurement at a specific depth
 - PerfilSPT: Complete SPT profile with multiple measurements
+- ColunasSPT / PerfilSPTColunar: Columnar (struct-of-arrays) profile storage
 - Estaca: Foundation pile with geometric properties
 """
 
+import hashlib
 import math
-from bisect import bisect_left, bisect_right
-from dataclasses import dataclass
-from typing import Iterator, Literal
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, Literal
+
+from calculus_core.domain.profile_builder import (
+    ProfileBuilder,
+    validar_colunas,
+)
+from calculus_core.domain.profile_views import MedidasView
+from calculus_core.domain.soil_types import CODIGOS_SOLO, ReservaCodigo
 
 # =============================================================================
 # CONSTANTS
@@ -67,6 +79,198 @@ class MedidaSPT:
         )
 
 
+# =============================================================================
+# COLUMNAR SPT STORAGE
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ColunasSPT:
+    """
+    Struct-of-arrays representation of an SPT profile.
+
+    Each attribute is a contiguous ``array.array`` ordered by depth, so
+    vectorized code can consume the columns directly (or as NumPy arrays
+    through ``para_numpy``) without touching MedidaSPT objects.
+
+    Attributes:
+        profundidades: Depths in meters (``'d'``).
+        n_spt: SPT blow counts (``'q'`` when all integers, else ``'d'``).
+        codigos_solo: Soil type codes from ``CODIGOS_SOLO`` (``'B'``, or
+            ``'H'`` once more than 256 soil names have been interned).
+            Canonical soil types have the codes of ``TipoSoloCanonical``.
+        espessuras: Layer thicknesses, NaN when not informed (``'d'``).
+        reservas: Reservations keeping the soil codes assigned (taken
+            from the codes when not given).
+
+    Soil names are interned at ingest, so materialized measurements carry
+    the normalized name (e.g. ``'Argila Arenosa'`` -> ``'argila_arenosa'``).
+    """
+
+    profundidades: array
+    n_spt: array
+    codigos_solo: array
+    espessuras: array
+    reservas: tuple[ReservaCodigo, ...] = field(
+        default=(), repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if not self.reservas and len(self.codigos_solo):
+            object.__setattr__(
+                self, 'reservas', CODIGOS_SOLO.reter(self.codigos_solo)
+            )
+
+    @classmethod
+    def de_registros(
+        cls,
+        registros: Iterable[tuple[float, float, str, float | None]],
+    ) -> 'ColunasSPT':
+        """
+        Build columns from already validated rows sorted by depth.
+
+        Args:
+            registros: Rows of (profundidade, N_SPT, tipo_solo, espessura).
+
+        Returns:
+            ColunasSPT with one entry per row.
+        """
+        profundidades = array('d')
+        valores_n: list[float] = []
+        codigos: list[int] = []
+        espessuras = array('d')
+        reservas: dict[str, ReservaCodigo] = {}
+
+        for profundidade, n_spt, tipo_solo, espessura in registros:
+            profundidades.append(profundidade)
+            valores_n.append(n_spt)
+            reserva = reservas.get(tipo_solo)
+            if reserva is None:
+                reserva = reservas[tipo_solo] = CODIGOS_SOLO.reservar(
+                    tipo_solo
+                )
+            codigos.append(reserva.codigo)
+            espessuras.append(math.nan if espessura is None else espessura)
+
+        inteiros = all(isinstance(n, int) for n in valores_n)
+        return cls(
+            profundidades=profundidades,
+            n_spt=array('q' if inteiros else 'd', valores_n),
+            codigos_solo=array(
+                'B' if len(CODIGOS_SOLO) <= 256 else 'H', codigos
+            ),
+            espessuras=espessuras,
+            reservas=tuple(set(reservas.values())),
+        )
+
+    @classmethod
+    def de_medidas(cls, medidas: Iterable[MedidaSPT]) -> 'ColunasSPT':
+        """
+        Build columns from measurements sorted by depth.
+
+        Args:
+            medidas: MedidaSPT objects sorted by depth.
+
+        Returns:
+            ColunasSPT with one entry per measurement.
+        """
+        return cls.de_registros(
+            (m.profundidade, m.N_SPT, m.tipo_solo, m.espessura_camada)
+            for m in medidas
+        )
+
+    def __len__(self) -> int:
+        return len(self.profundidades)
+
+    def tipo_solo(self, indice: int) -> str:
+        """Return the (normalized) soil type name at ``indice``."""
+        return CODIGOS_SOLO.nome(self.codigos_solo[indice])
+
+    def registro(self, indice: int) -> tuple[float, float, str, float | None]:
+        """Return the row at ``indice`` as a plain tuple."""
+        espessura = self.espessuras[indice]
+        return (
+            self.profundidades[indice],
+            self.n_spt[indice],
+            self.tipo_solo(indice),
+            None if math.isnan(espessura) else espessura,
+        )
+
+    def medida(self, indice: int) -> MedidaSPT:
+        """Materialize the row at ``indice`` as a MedidaSPT."""
+        return MedidaSPT(*self.registro(indice))
+
+    def para_numpy(self) -> dict[str, Any]:
+        """
+        Expose the columns as read-only NumPy arrays without copying.
+
+        Returns:
+            Mapping of column name to ``numpy.ndarray`` sharing memory
+            with the underlying arrays.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError(
+                'NumPy não está instalado. '
+                'Instale com: pip install calculus-core[numpy]'
+            ) from exc
+
+        tipos = {
+            'd': np.float64,
+            'q': np.int64,
+            'B': np.uint8,
+            'H': np.uint16,
+        }
+        resultado = {}
+        for nome in ('profundidades', 'n_spt', 'codigos_solo', 'espessuras'):
+            coluna = getattr(self, nome)
+            vetor = np.frombuffer(coluna, dtype=tipos[coluna.typecode])
+            vetor.flags.writeable = False
+            resultado[nome] = vetor
+        return resultado
+
+    def __reduce__(self):
+        # Soil codes are process-local beyond the canonical types, so
+        # pickles (e.g. sent to worker processes) carry the names instead.
+        nomes = sorted(set(self.codigos_solo))
+        posicoes = {codigo: i for i, codigo in enumerate(nomes)}
+        return (
+            ColunasSPT._de_estado,
+            (
+                self.profundidades,
+                self.n_spt,
+                [CODIGOS_SOLO.nome(codigo) for codigo in nomes],
+                [posicoes[codigo] for codigo in self.codigos_solo],
+                self.espessuras,
+            ),
+        )
+
+    @classmethod
+    def _de_estado(
+        cls,
+        profundidades: array,
+        n_spt: array,
+        nomes_solo: list[str],
+        posicoes_solo: list[int],
+        espessuras: array,
+    ) -> 'ColunasSPT':
+        reservas = [CODIGOS_SOLO.reservar(nome) for nome in nomes_solo]
+        return cls(
+            profundidades=profundidades,
+            n_spt=n_spt,
+            codigos_solo=array(
+                'B' if len(CODIGOS_SOLO) <= 256 else 'H',
+                [reservas[posicao].codigo for posicao in posicoes_solo],
+            ),
+            espessuras=espessuras,
+            reservas=tuple(reservas),
+        )
+
+
 # =============================================================================
 # SPT PROFILE
 # =============================================================================
@@ -105,15 +309,196 @@ class PerfilSPT:
         self.intervalo_padrao = intervalo_padrao
         self._medidas: list[MedidaSPT] = []
         self._profundidades_cache: list[float] = []
+        self._indice_mm: dict[int, int] | None = None
+        self._colunas_cache: ColunasSPT | None = None
+        self._versao = 0
+        self._impressao: tuple[tuple[int, bool, float], str] | None = None
 
     @property
-    def medidas(self) -> list[MedidaSPT]:
-        """Return a copy of the measurements list."""
-        return list(self._medidas)
+    def medidas(self) -> MedidasView[MedidaSPT]:
+        """Return a read-only view of the measurements."""
+        return MedidasView(self._medidas)
+
+    def medidas_entre(
+        self, prof_inicio: float, prof_fim: float
+    ) -> MedidasView[MedidaSPT]:
+        """
+        Return a view of the measurements with depth in [inicio, fim].
+
+        Args:
+            prof_inicio: Start depth in meters (inclusive).
+            prof_fim: End depth in meters (inclusive).
+
+        Returns:
+            Read-only view over the matching measurements.
+        """
+        return MedidasView(
+            self._medidas,
+            bisect_left(self._profundidades_cache, prof_inicio),
+            bisect_right(self._profundidades_cache, prof_fim),
+        )
+
+    def medidas_acima(self, profundidade: float) -> MedidasView[MedidaSPT]:
+        """
+        Return a view of the measurements strictly above a depth.
+
+        Args:
+            profundidade: Depth in meters (exclusive), e.g. the pile tip.
+
+        Returns:
+            Read-only view over the shallower measurements.
+        """
+        return MedidasView(
+            self._medidas,
+            0,
+            bisect_left(self._profundidades_cache, profundidade),
+        )
 
     def _rebuild_cache(self) -> None:
         """Rebuild the depth lookup cache."""
         self._profundidades_cache = [m.profundidade for m in self._medidas]
+        self._indice_mm = None
+        self._colunas_cache = None
+        self._versao += 1
+
+    @property
+    def versao(self) -> int:
+        """Counter incremented on every change to the measurements."""
+        return self._versao
+
+    @property
+    def impressao_digital(self) -> str:
+        """
+        Stable content fingerprint of the profile.
+
+        A hash of everything the calculations read: depths, N_SPT, soil
+        names, layer thicknesses, ``confiavel`` and ``intervalo_padrao``
+        (not ``nome_sondagem``). Profiles with the same content share the
+        fingerprint, in any process. It is computed once per profile
+        version, so it changes after ``adicionar_medida(s)``.
+
+        Returns:
+            Hexadecimal digest (32 characters).
+        """
+        estado = (self._versao, self.confiavel, self.intervalo_padrao)
+        if self._impressao is None or self._impressao[0] != estado:
+            colunas = self.colunas()
+            h = hashlib.blake2b(digest_size=16)
+            h.update(repr((self.confiavel, self.intervalo_padrao)).encode())
+            h.update(colunas.profundidades.tobytes())
+            h.update(array('d', colunas.n_spt).tobytes())
+            h.update(colunas.espessuras.tobytes())
+            for codigo in colunas.codigos_solo:
+                h.update(CODIGOS_SOLO.nome(codigo).encode())
+                h.update(b'\x00')
+            self._impressao = (estado, h.hexdigest())
+        return self._impressao[1]
+
+    def indice_medida(self, profundidade: float) -> int | None:
+        """
+        Find the first measurement within tolerance of a depth.
+
+        Depths are keyed by integer millimetres. Stored depths are rounded
+        to 1mm, so any depth within ``PROFUNDIDADE_TOLERANCIA`` of a query
+        has a key at most one millimetre away from the query's key.
+
+        Args:
+            profundidade: Depth in meters.
+
+        Returns:
+            Index of the matching measurement, or None.
+        """
+        if self._indice_mm is None:
+            self._indice_mm = {}
+            for i, prof in enumerate(self._profundidades_cache):
+                self._indice_mm.setdefault(round(prof * 1000), i)
+
+        if not math.isfinite(profundidade):
+            return None
+
+        chave = round(profundidade * 1000)
+        # Keys in ascending depth order, so the shallowest match wins
+        for vizinha in (chave - 1, chave, chave + 1):
+            i = self._indice_mm.get(vizinha)
+            if (
+                i is not None
+                and abs(self._profundidades_cache[i] - profundidade)
+                < PROFUNDIDADE_TOLERANCIA
+            ):
+                return i
+        return None
+
+    def _definir_medidas(self, medidas: list[MedidaSPT]) -> None:
+        """Replace the measurements with a list already sorted by depth."""
+        self._medidas = medidas
+        self._rebuild_cache()
+
+    @classmethod
+    def builder(cls, **kwargs: Any) -> ProfileBuilder[MedidaSPT, 'PerfilSPT']:
+        """
+        Create a builder for bulk construction of a profile.
+
+        Args:
+            **kwargs: Profile attributes (nome_sondagem, confiavel,
+                intervalo_padrao).
+
+        Returns:
+            ProfileBuilder whose rows are (profundidade, N_SPT, tipo_solo)
+            or (profundidade, N_SPT, tipo_solo, espessura_camada).
+        """
+        return ProfileBuilder(cls(**kwargs), MedidaSPT)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        depths: Sequence[float],
+        n_spt: Sequence[int],
+        soils: Sequence[str],
+        espessuras: Sequence[float | None] | None = None,
+        **kwargs: Any,
+    ) -> 'PerfilSPT':
+        """
+        Build a profile from parallel columns, sorted or not.
+
+        Args:
+            depths: Depths in meters.
+            n_spt: SPT blow counts.
+            soils: Soil types.
+            espessuras: Optional layer thicknesses.
+            **kwargs: Profile attributes (nome_sondagem, confiavel,
+                intervalo_padrao).
+
+        Returns:
+            The populated profile.
+
+        Raises:
+            ValueError: If the columns have different lengths or a row is
+                invalid.
+        """
+        total = validar_colunas(
+            depths=depths, n_spt=n_spt, soils=soils, espessuras=espessuras
+        )
+        if espessuras is None:
+            espessuras = [None] * total
+        return (
+            cls.builder(**kwargs)
+            .estender(zip(depths, n_spt, soils, espessuras))
+            .construir()
+        )
+
+    def colunas(self) -> ColunasSPT:
+        """
+        Return the profile as contiguous columns.
+
+        The columns are built on first use and cached until the profile
+        is modified.
+
+        Returns:
+            ColunasSPT ordered by depth.
+        """
+        if self._colunas_cache is None:
+            self._colunas_cache = ColunasSPT.de_medidas(self._medidas)
+        return self._colunas_cache
 
     def adicionar_medida(
         self,
@@ -132,9 +517,10 @@ class PerfilSPT:
             espessura_camada: Optional layer thickness.
         """
         medida = MedidaSPT(profundidade, N_SPT, tipo_solo, espessura_camada)
-        self._medidas.append(medida)
-        self._medidas.sort(key=lambda x: x.profundidade)
-        self._rebuild_cache()
+        # Copy-on-write keeps previously returned views unchanged
+        medidas = list(self._medidas)
+        insort(medidas, medida, key=lambda x: x.profundidade)
+        self._definir_medidas(medidas)
 
     def adicionar_medidas(
         self,
@@ -148,6 +534,7 @@ class PerfilSPT:
             dados: List of tuples (profundidade, N_SPT, tipo_solo)
                    or (profundidade, N_SPT, tipo_solo, espessura_camada).
         """
+        novas = []
         for item in dados:
             if len(item) == 3:
                 prof, n, solo = item
@@ -156,10 +543,11 @@ class PerfilSPT:
                 prof, n, solo, espessura = item
 
             medida = MedidaSPT(prof, n, solo, espessura)
-            self._medidas.append(medida)
+            novas.append(medida)
 
-        self._medidas.sort(key=lambda x: x.profundidade)
-        self._rebuild_cache()
+        medidas = [*self._medidas, *novas]
+        medidas.sort(key=lambda x: x.profundidade)
+        self._definir_medidas(medidas)
 
     def obter_medida(
         self,
@@ -203,12 +591,9 @@ class PerfilSPT:
             )
 
         # Exact match
-        for medida in self._medidas:
-            if (
-                abs(medida.profundidade - profundidade)
-                < PROFUNDIDADE_TOLERANCIA
-            ):
-                return medida
+        idx = self.indice_medida(profundidade)
+        if idx is not None:
+            return self._medidas[idx]
 
         if estrategia == 'exata':
             raise ValueError(
@@ -216,10 +601,7 @@ class PerfilSPT:
             )
 
         if estrategia == 'mais_proxima':
-            return min(
-                self._medidas,
-                key=lambda x: abs(x.profundidade - profundidade),
-            )
+            return self._medidas[self._indice_mais_proximo(profundidade)]
 
         if estrategia == 'anterior':
             idx = bisect_right(self._profundidades_cache, profundidade) - 1
@@ -232,6 +614,22 @@ class PerfilSPT:
 
         raise ValueError(f'Estratégia desconhecida: {estrategia}')
 
+    def _indice_mais_proximo(self, profundidade: float) -> int:
+        """Index of the closest measurement (the shallower one on ties)."""
+        profundidades = self._profundidades_cache
+        idx = bisect_left(profundidades, profundidade)
+        if idx >= len(profundidades):
+            idx = len(profundidades) - 1
+        if idx == 0:
+            return 0
+        # First occurrence of the shallower neighbour's depth
+        anterior = bisect_left(profundidades, profundidades[idx - 1])
+        if abs(profundidades[anterior] - profundidade) <= abs(
+            profundidades[idx] - profundidade
+        ):
+            return anterior
+        return idx
+
     def _interpolar(self, profundidade: float) -> MedidaSPT:
         """Interpolate N_SPT linearly between adjacent measurements."""
         if profundidade <= self._medidas[0].profundidade:
@@ -288,11 +686,7 @@ class PerfilSPT:
         if prof_inicio > prof_fim:
             prof_inicio, prof_fim = prof_fim, prof_inicio
 
-        medidas_intervalo = [
-            m
-            for m in self._medidas
-            if prof_inicio <= m.profundidade <= prof_fim
-        ]
+        medidas_intervalo = self.medidas_entre(prof_inicio, prof_fim)
 
         if not medidas_intervalo:
             m_inicio = self.obter_medida(prof_inicio, 'interpolar')
@@ -310,6 +704,69 @@ class PerfilSPT:
 
         return sum(valores) / len(valores)
 
+    def obter_media_n_spt_intervalos(
+        self, intervalos: Iterable[tuple[float, float]]
+    ) -> list[float]:
+        """
+        Get the mean N_SPT for many depth intervals in one pass.
+
+        Equivalent to calling ``obter_n_spt_intervalo(inicio, fim, 'media')``
+        for each interval, including the interpolation fallback for empty
+        intervals. When the interval bounds are non-decreasing (as in a
+        depth curve) the window is tracked with two pointers and averaged
+        from prefix sums, so the whole batch is linear in the number of
+        measurements plus intervals.
+
+        Args:
+            intervalos: Iterable of (prof_inicio, prof_fim) tuples.
+
+        Returns:
+            Mean N_SPT for each interval, in input order.
+        """
+        colunas = self.colunas()
+        profundidades = colunas.profundidades
+        valores_n = colunas.n_spt
+        total = len(valores_n)
+
+        # Integer prefix sums are exact; other values are summed directly
+        # so results match the left-to-right sum of the scalar method
+        somas: list[int] | None = None
+        if valores_n.typecode == 'q':
+            somas = [0]
+            for n in valores_n:
+                somas.append(somas[-1] + n)
+
+        medias = []
+        inicio_anterior = fim_anterior = -math.inf
+        i = j = 0  # Window is valores_n[i:j]
+
+        for limite_a, limite_b in intervalos:
+            prof_inicio, prof_fim = (
+                min(limite_a, limite_b),
+                max(limite_a, limite_b),
+            )
+
+            if prof_inicio < inicio_anterior:
+                i = bisect_left(profundidades, prof_inicio)
+            while i < total and profundidades[i] < prof_inicio:
+                i += 1
+            if prof_fim < fim_anterior:
+                j = bisect_right(profundidades, prof_fim)
+            while j < total and profundidades[j] <= prof_fim:
+                j += 1
+            inicio_anterior, fim_anterior = prof_inicio, prof_fim
+
+            if j <= i:
+                m_inicio = self.obter_medida(prof_inicio, 'interpolar')
+                m_fim = self.obter_medida(prof_fim, 'interpolar')
+                medias.append(sum([m_inicio.N_SPT, m_fim.N_SPT]) / 2)
+            elif somas is not None:
+                medias.append((somas[j] - somas[i]) / (j - i))
+            else:
+                medias.append(sum(valores_n[i:j]) / (j - i))
+
+        return medias
+
     def iterar_profundidades(
         self,
         inicio: float | None = None,
@@ -382,10 +839,164 @@ class PerfilSPT:
 
     def __contains__(self, profundidade: float) -> bool:
         """Check if a specific depth has a measurement."""
-        return any(
-            abs(m.profundidade - profundidade) < PROFUNDIDADE_TOLERANCIA
-            for m in self._medidas
+        return self.indice_medida(profundidade) is not None
+
+
+class _MedidasColunares(Sequence):
+    """Read-only sequence materializing MedidaSPT rows on access."""
+
+    def __init__(self, colunas: ColunasSPT):
+        self._colunas = colunas
+
+    def __len__(self) -> int:
+        return len(self._colunas)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self._colunas.medida(i)
+                for i in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Índice fora do perfil SPT.')
+        return self._colunas.medida(index)
+
+    def __iter__(self) -> Iterator[MedidaSPT]:
+        colunas = self._colunas
+        for i in range(len(colunas)):
+            yield colunas.medida(i)
+
+
+class PerfilSPTColunar(PerfilSPT):
+    """
+    PerfilSPT backed by contiguous columns instead of MedidaSPT objects.
+
+    Exposes the same API as PerfilSPT. Measurements are materialized on
+    access, while depths, N_SPT, soil codes and thicknesses live in the
+    arrays returned by ``colunas()``. Suited to keeping many borings in
+    memory and to vectorized calculations.
+
+    Example:
+        perfil = PerfilSPTColunar(nome_sondagem='SP-01')
+        perfil.adicionar_medidas([(1.0, 5, 'argila'), (2.0, 10, 'areia')])
+        colunas = perfil.colunas()
+    """
+
+    def __init__(
+        self,
+        nome_sondagem: str = 'SP-01',
+        confiavel: bool = True,
+        intervalo_padrao: float = 1.0,
+    ):
+        super().__init__(nome_sondagem, confiavel, intervalo_padrao)
+        self._definir_colunas(ColunasSPT.de_registros([]))
+
+    @classmethod
+    def de_perfil(cls, perfil: PerfilSPT) -> 'PerfilSPTColunar':
+        """
+        Create a columnar copy of an existing profile.
+
+        Args:
+            perfil: Source SPT profile.
+
+        Returns:
+            PerfilSPTColunar with the same metadata and measurements.
+        """
+        novo = cls(
+            nome_sondagem=perfil.nome_sondagem,
+            confiavel=perfil.confiavel,
+            intervalo_padrao=perfil.intervalo_padrao,
         )
+        novo._definir_colunas(perfil.colunas())
+        return novo
+
+    @classmethod
+    def de_colunas(
+        cls, colunas: ColunasSPT, **kwargs: Any
+    ) -> 'PerfilSPTColunar':
+        """
+        Create a profile that uses existing columns as its storage.
+
+        Args:
+            colunas: Columns sorted by depth (not copied).
+            **kwargs: Profile attributes (nome_sondagem, confiavel,
+                intervalo_padrao).
+
+        Returns:
+            PerfilSPTColunar backed by ``colunas``.
+        """
+        perfil = cls(**kwargs)
+        perfil._definir_colunas(colunas)
+        return perfil
+
+    def _definir_colunas(self, colunas: ColunasSPT) -> None:
+        """Replace the storage and point the lookup caches at it."""
+        self._colunas_cache = colunas
+        self._medidas = _MedidasColunares(colunas)
+        self._profundidades_cache = colunas.profundidades
+        self._indice_mm = None
+        self._versao += 1
+
+    def _rebuild_cache(self) -> None:
+        """Columns are the storage, so there is nothing to rebuild."""
+
+    def _definir_medidas(self, medidas: list[MedidaSPT]) -> None:
+        """Replace the storage with measurements sorted by depth."""
+        self._definir_colunas(ColunasSPT.de_medidas(medidas))
+
+    def colunas(self) -> ColunasSPT:
+        """Return the columns backing this profile."""
+        return self._colunas_cache
+
+    def _inserir(self, novas: list[MedidaSPT]) -> None:
+        """Merge validated measurements into the columns, sorted by depth."""
+        colunas = self._colunas_cache
+        registros = [colunas.registro(i) for i in range(len(colunas))]
+        registros.extend(
+            (m.profundidade, m.N_SPT, m.tipo_solo, m.espessura_camada)
+            for m in novas
+        )
+        registros.sort(key=itemgetter(0))
+        self._definir_colunas(ColunasSPT.de_registros(registros))
+
+    def adicionar_medida(
+        self,
+        profundidade: float,
+        N_SPT: int,
+        tipo_solo: str,
+        espessura_camada: float | None = None,
+    ) -> None:
+        """
+        Add a single SPT measurement.
+
+        Args:
+            profundidade: Depth in meters.
+            N_SPT: SPT blow count.
+            tipo_solo: Soil type.
+            espessura_camada: Optional layer thickness.
+        """
+        self._inserir(
+            [MedidaSPT(profundidade, N_SPT, tipo_solo, espessura_camada)]
+        )
+
+    def adicionar_medidas(
+        self,
+        dados: list[tuple[float, int, str]]
+        | list[tuple[float, int, str, float]],
+    ) -> None:
+        """
+        Add multiple SPT measurements at once.
+
+        Args:
+            dados: List of tuples (profundidade, N_SPT, tipo_solo)
+                   or (profundidade, N_SPT, tipo_solo, espessura_camada).
+        """
+        self._inserir([MedidaSPT(*item) for item in dados])
+
+    def __repr__(self) -> str:
+        return super().__repr__().replace('PerfilSPT(', 'PerfilSPTColunar(', 1)
 
 
 # =============================================================================
@@ -393,6 +1004,31 @@ class PerfilSPT:
 # =============================================================================
 
 
+def chave_estaca(estaca: Any) -> tuple:
+    """
+    Build a hashable key for any pile (Estaca or EstacaBase).
+
+    The key holds the type, construction process, shape and the geometry
+    actually used by the methods (section, tip area, perimeter), plus the
+    installation depth.
+
+    Args:
+        estaca: Pile object.
+
+    Returns:
+        Tuple usable as a dictionary key.
+    """
+    return (
+        estaca.tipo,
+        estaca.processo_construcao,
+        getattr(estaca, 'formato', None),
+        estaca.secao_transversal,
+        estaca.area_ponta,
+        estaca.perimetro,
+        estaca.cota_assentamento,
+    )
+
+
 @dataclass
 class Estaca:
     """
@@ -454,6 +1090,16 @@ class Estaca:
         """Return the embedded length of the pile."""
         return self.cota_assentamento
 
+    @property
+    def chave(self) -> tuple:
+        """
+        Hashable key of everything the calculations read from the pile.
+
+        Piles with equal keys give equal results for the same profile and
+        method, so the key can index result caches.
+        """
+        return chave_estaca(self)
+
     def na_cota(self, nova_cota: float) -> 'Estaca':
         """Create a copy of this pile at a new depth."""
         return Estaca(
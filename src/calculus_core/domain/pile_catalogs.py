@@ -15,6 +15,7 @@ Catalogs include:
 """
 
 import math
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from typing import Literal
 
@@ -661,6 +662,167 @@ CATALOGOS = {
 }
 
 
+# Alternative spellings accepted for the catalog pile types
+ALIASES_TIPO_ESTACA = {
+    'premoldada': 'pre_moldada',
+    'pré_moldada': 'pre_moldada',
+    'hélice': 'helice_continua',
+    'cfa': 'helice_continua',
+    'micropile': 'raiz',
+    'microestaca': 'raiz',
+    'ômega': 'omega',
+}
+
+# Every accepted spelling (normalized) -> catalog key, built once
+_TIPOS_CATALOGO: dict[str, str] = {
+    **{tipo: tipo for tipo in CATALOGOS},
+    **ALIASES_TIPO_ESTACA,
+}
+
+
+def _resolver_tipo(tipo_estaca: str) -> str | None:
+    """Return the catalog key of a pile type name (None if unknown)."""
+    tipo = _TIPOS_CATALOGO.get(tipo_estaca)
+    if tipo is None:
+        # Not remembered: raw spellings come from user input
+        tipo_norm = tipo_estaca.lower().replace(' ', '_').replace('-', '_')
+        tipo = _TIPOS_CATALOGO.get(tipo_norm)
+    return tipo
+
+
+def diametro_efetivo(perfil: PerfilType) -> float | None:
+    """
+    Return the diameter used to compare catalog profiles.
+
+    Uses ``diametro``, ``dimensao_principal`` or ``diametro_fuste``,
+    whichever the profile has (None if it has none of them).
+    """
+    return getattr(
+        perfil,
+        'diametro',
+        getattr(
+            perfil,
+            'dimensao_principal',
+            getattr(perfil, 'diametro_fuste', None),
+        ),
+    )
+
+
+class IndiceDiametros:
+    """
+    Catalog profiles of one pile type sorted by effective diameter.
+
+    Queries use bisection. Ties are resolved in favour of the profile
+    that comes first in the catalog, which matches a linear scan over the
+    catalog in order.
+
+    Attributes:
+        diametros: Effective diameters, ascending.
+        nomes: Profile names aligned with ``diametros``.
+    """
+
+    def __init__(self, catalogo: dict[str, PerfilType]):
+        """
+        Build the index.
+
+        Args:
+            catalogo: Catalog mapping profile name to profile. Profiles
+                without an effective diameter are left out.
+        """
+        entradas = sorted(
+            (
+                (d, posicao, nome)
+                for posicao, (nome, perfil) in enumerate(catalogo.items())
+                if (d := diametro_efetivo(perfil)) is not None
+            ),
+        )
+        self.diametros = tuple(d for d, _, _ in entradas)
+        self.nomes = tuple(nome for _, _, nome in entradas)
+        self._posicoes = tuple(posicao for _, posicao, _ in entradas)
+
+    def __len__(self) -> int:
+        return len(self.diametros)
+
+    def _inicio_grupo(self, indice: int) -> int:
+        """First index holding the same diameter as ``indice``."""
+        return bisect_left(self.diametros, self.diametros[indice])
+
+    def mais_proximo(self, diametro: float) -> str | None:
+        """
+        Return the profile whose diameter is closest to ``diametro``.
+
+        Args:
+            diametro: Target diameter in meters.
+
+        Returns:
+            Profile name, or None if the index is empty.
+        """
+        if not self.diametros:
+            return None
+        direita = bisect_left(self.diametros, diametro)
+        candidatos = []
+        if direita < len(self.diametros):
+            candidatos.append(direita)
+        if direita > 0:
+            candidatos.append(self._inicio_grupo(direita - 1))
+        melhor = min(
+            candidatos,
+            key=lambda i: (
+                abs(self.diametros[i] - diametro),
+                self._posicoes[i],
+            ),
+        )
+        return self.nomes[melhor]
+
+    def no_intervalo(self, minimo: float, maximo: float) -> list[str]:
+        """
+        Return the profiles with diameter in ``[minimo, maximo]``.
+
+        Args:
+            minimo: Smallest diameter (inclusive).
+            maximo: Largest diameter (inclusive).
+
+        Returns:
+            Profile names in ascending diameter order.
+        """
+        inicio = bisect_left(self.diametros, minimo)
+        fim = bisect_right(self.diametros, maximo)
+        return list(self.nomes[inicio:fim])
+
+    def dentro_da_tolerancia(
+        self, diametro: float, tolerancia: float
+    ) -> str | None:
+        """
+        Return the first catalog profile within ``tolerancia`` of a diameter.
+
+        Args:
+            diametro: Target diameter in meters.
+            tolerancia: Maximum absolute difference.
+
+        Returns:
+            Profile name (first in catalog order), or None.
+        """
+        # Widened bounds, then the exact test, so rounding in
+        # ``diametro ± tolerancia`` never drops a boundary profile
+        folga = 1e-9
+        inicio = bisect_left(self.diametros, diametro - tolerancia - folga)
+        fim = bisect_right(self.diametros, diametro + tolerancia + folga)
+        dentro = [
+            i
+            for i in range(inicio, fim)
+            if abs(self.diametros[i] - diametro) <= tolerancia
+        ]
+        if not dentro:
+            return None
+        return self.nomes[min(dentro, key=self._posicoes.__getitem__)]
+
+
+# Per-type diameter indexes, built once at import time
+INDICES_DIAMETRO = {
+    tipo: IndiceDiametros(catalogo) for tipo, catalogo in CATALOGOS.items()
+}
+
+
 def listar_tipos_estaca() -> list[str]:
     """List all available pile types with catalogs."""
     return list(CATALOGOS.keys())
@@ -676,23 +838,9 @@ def listar_perfis_por_tipo(tipo_estaca: str) -> list[str]:
     Returns:
         List of profile names.
     """
-    tipo_norm = tipo_estaca.lower().replace(' ', '_').replace('-', '_')
-
-    # Handle aliases
-    aliases = {
-        'premoldada': 'pre_moldada',
-        'pré_moldada': 'pre_moldada',
-        'hélice': 'helice_continua',
-        'cfa': 'helice_continua',
-        'micropile': 'raiz',
-        'microestaca': 'raiz',
-        'ômega': 'omega',
-    }
-
-    if tipo_norm in aliases:
-        tipo_norm = aliases[tipo_norm]
-
-    if tipo_norm not in CATALOGOS:
+    tipo_norm = _resolver_tipo(tipo_estaca)
+
+    if tipo_norm is None:
         available = ', '.join(CATALOGOS.keys())
         raise ValueError(
             f'Tipo de estaca "{tipo_estaca}" não encontrado. '
@@ -713,23 +861,9 @@ def obter_perfil(tipo_estaca: str, nome_perfil: str) -> PerfilType:
     Returns:
         The profile object.
     """
-    tipo_norm = tipo_estaca.lower().replace(' ', '_').replace('-', '_')
-
-    # Handle aliases
-    aliases = {
-        'premoldada': 'pre_moldada',
-        'pré_moldada': 'pre_moldada',
-        'hélice': 'helice_continua',
-        'cfa': 'helice_continua',
-        'micropile': 'raiz',
-        'microestaca': 'raiz',
-        'ômega': 'omega',
-    }
-
-    if tipo_norm in aliases:
-        tipo_norm = aliases[tipo_norm]
-
-    if tipo_norm not in CATALOGOS:
+    tipo_norm = _resolver_tipo(tipo_estaca)
+
+    if tipo_norm is None:
         raise ValueError(f'Tipo de estaca "{tipo_estaca}" não encontrado.')
 
     catalogo = CATALOGOS[tipo_norm]
@@ -744,6 +878,44 @@ def obter_perfil(tipo_estaca: str, nome_perfil: str) -> PerfilType:
     return catalogo[nome_perfil]
 
 
+def obter_indice_diametros(tipo_estaca: str) -> IndiceDiametros:
+    """
+    Get the diameter index of a pile type.
+
+    Args:
+        tipo_estaca: Pile type name (aliases accepted).
+
+    Returns:
+        The IndiceDiametros of the type's catalog.
+
+    Raises:
+        ValueError: If the pile type has no catalog.
+    """
+    tipo_norm = _resolver_tipo(tipo_estaca)
+    if tipo_norm is None:
+        available = ', '.join(CATALOGOS.keys())
+        raise ValueError(
+            f'Tipo de estaca "{tipo_estaca}" não encontrado. '
+            f'Disponíveis: {available}'
+        )
+    return INDICES_DIAMETRO[tipo_norm]
+
+
+def perfil_mais_proximo(tipo_estaca: str, diametro: float) -> str | None:
+    """
+    Find the profile whose diameter is closest to a target.
+
+    Args:
+        tipo_estaca: Pile type name.
+        diametro: Target diameter in meters.
+
+    Returns:
+        Profile name (the first in the catalog on ties), or None if no
+        profile of the type has an effective diameter.
+    """
+    return obter_indice_diametros(tipo_estaca).mais_proximo(diametro)
+
+
 def buscar_perfil_por_diametro(
     tipo_estaca: str,
     diametro: float,
@@ -760,25 +932,12 @@ def buscar_perfil_por_diametro(
     Returns:
         Matching profile or None.
     """
-    perfis = listar_perfis_por_tipo(tipo_estaca)
-    catalogo = CATALOGOS[tipo_estaca.lower()]
-
-    for nome in perfis:
-        perfil = catalogo[nome]
-        # Get diameter based on profile type
-        if hasattr(perfil, 'diametro'):
-            d = perfil.diametro
-        elif hasattr(perfil, 'dimensao_principal'):
-            d = perfil.dimensao_principal
-        elif hasattr(perfil, 'diametro_fuste'):
-            d = perfil.diametro_fuste
-        else:
-            continue
-
-        if abs(d - diametro) <= tolerancia:
-            return perfil
-
-    return None
+    nome = obter_indice_diametros(tipo_estaca).dentro_da_tolerancia(
+        diametro, tolerancia
+    )
+    if nome is None:
+        return None
+    return obter_perfil(tipo_estaca, nome)
 
 
 def resumo_catalogos() -> dict[str, list[dict]]:
@@ -12,6 +12,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, replace
 from typing import Literal
 
+from calculus_core.domain.model import chave_estaca
+
 # =============================================================================
 # BASE PILE ABSTRACTION
 # =============================================================================
@@ -66,6 +68,11 @@ class EstacaBase(ABC):
         """Return a copy of the pile at a new depth."""
         pass
 
+    @property
+    def chave(self) -> tuple:
+        """Hashable key of the pile for result caches (see chave_estaca)."""
+        return chave_estaca(self)
+
 
 # =============================================================================
 # CONCRETE PILE TYPES
@@ -0,0 +1,155 @@
+"""
+Profile Builder
+
+Bulk construction of soil investigation profiles (SPT, CPT).
+
+Adding measurements one by one through ``adicionar_medida`` keeps the
+profile sorted and its caches valid after every call. When a whole profile
+is known up front (file imports, CPT-SPT conversion) that bookkeeping is
+wasted work: the builder validates each row once, sorts at most once and
+hands the final list to the profile, whose lookup index is then built
+lazily on first use.
+
+Example:
+    perfil = (
+        PerfilSPT.builder(nome_sondagem='SP-01')
+        .adicionar(1.0, 5, 'argila')
+        .adicionar(2.0, 8, 'areia')
+        .construir()
+    )
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, Generic, Iterable, Protocol, TypeVar
+
+
+class _ComProfundidade(Protocol):
+    profundidade: float
+
+
+class _PerfilConstruivel(Protocol):
+    def _definir_medidas(self, medidas: list[Any]) -> None: ...
+
+
+M = TypeVar('M', bound=_ComProfundidade)
+P = TypeVar('P', bound=_PerfilConstruivel)
+
+
+class ProfileBuilder(Generic[M, P]):
+    """
+    Accumulates measurements and builds a profile with a single sort.
+
+    Rows are validated as they are added (through the measurement
+    constructor). Input that is already ordered by depth is never sorted;
+    unordered input is sorted once, stably, in ``construir``.
+
+    Attributes:
+        perfil: Empty profile that will receive the measurements.
+    """
+
+    def __init__(self, perfil: P, criar_medida: Callable[..., M]):
+        """
+        Initialize the builder.
+
+        Args:
+            perfil: Empty profile that will receive the measurements.
+            criar_medida: Measurement constructor (validates each row).
+        """
+        self.perfil = perfil
+        self._criar_medida = criar_medida
+        self._medidas: list[M] = []
+        self._ordenado = True
+        self._construido = False
+
+    def adicionar(self, *valores: Any) -> 'ProfileBuilder[M, P]':
+        """
+        Add one measurement.
+
+        Args:
+            *valores: Arguments for the measurement constructor.
+
+        Returns:
+            The builder itself, for chaining.
+        """
+        self.adicionar_medida(self._criar_medida(*valores))
+        return self
+
+    def adicionar_medida(self, medida: M) -> 'ProfileBuilder[M, P]':
+        """
+        Add an already constructed measurement.
+
+        Args:
+            medida: Measurement to add.
+
+        Returns:
+            The builder itself, for chaining.
+        """
+        if self._construido:
+            raise ValueError('Perfil já construído por este construtor.')
+        if self._medidas and (
+            medida.profundidade < self._medidas[-1].profundidade
+        ):
+            self._ordenado = False
+        self._medidas.append(medida)
+        return self
+
+    def estender(
+        self, linhas: Iterable[tuple[Any, ...]]
+    ) -> 'ProfileBuilder[M, P]':
+        """
+        Add many measurements from an iterable of rows.
+
+        Args:
+            linhas: Rows with the arguments for the measurement constructor.
+
+        Returns:
+            The builder itself, for chaining.
+        """
+        for linha in linhas:
+            self.adicionar(*linha)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._medidas)
+
+    def construir(self) -> P:
+        """
+        Sort the measurements if needed and install them in the profile.
+
+        Returns:
+            The populated profile.
+
+        Raises:
+            ValueError: If the builder was already used.
+        """
+        if self._construido:
+            raise ValueError('Perfil já construído por este construtor.')
+        if not self._ordenado:
+            self._medidas.sort(key=attrgetter('profundidade'))
+        self._construido = True
+        self.perfil._definir_medidas(self._medidas)
+        return self.perfil
+
+
+def validar_colunas(**colunas: Any) -> int:
+    """
+    Check that parallel columns have the same length.
+
+    Args:
+        **colunas: Column name to sequence (None entries are ignored).
+
+    Returns:
+        The common length.
+
+    Raises:
+        ValueError: If the lengths differ.
+    """
+    tamanhos = {
+        nome: len(valores)
+        for nome, valores in colunas.items()
+        if valores is not None
+    }
+    if len(set(tamanhos.values())) > 1:
+        detalhes = ', '.join(f'{k}={v}' for k, v in tamanhos.items())
+        raise ValueError(f'As colunas devem ter o mesmo tamanho ({detalhes}).')
+    return next(iter(tamanhos.values()), 0)
@@ -0,0 +1,88 @@
+"""
+Profile Views
+
+Read-only, zero-copy views over the measurements of a soil profile.
+
+Profiles replace their storage on every mutation instead of changing it in
+place (copy-on-write), so a view taken from a profile keeps showing the
+measurements it was created from, just like the list copies it replaces,
+without allocating a new list on each access.
+"""
+
+from collections.abc import Sequence
+from typing import Iterator, TypeVar, overload
+
+M = TypeVar('M')
+
+
+class MedidasView(Sequence[M]):
+    """
+    Read-only view over a contiguous range of profile measurements.
+
+    Supports ``len``, indexing (including negative indices), iteration and
+    equality with any other sequence. Slicing with step 1 returns another
+    view over the same storage.
+
+    Example:
+        medidas = perfil.medidas
+        fuste = perfil.medidas_acima(10.0)
+        total = sum(m.N_SPT for m in fuste)
+    """
+
+    __slots__ = ('_dados', '_fim', '_inicio')
+
+    def __init__(
+        self, dados: Sequence[M], inicio: int = 0, fim: int | None = None
+    ):
+        """
+        Initialize the view.
+
+        Args:
+            dados: Underlying storage (never modified by the view).
+            inicio: First index in the view.
+            fim: One past the last index in the view (default: end).
+        """
+        self._dados = dados
+        self._inicio = inicio
+        self._fim = len(dados) if fim is None else max(fim, inicio)
+
+    def __len__(self) -> int:
+        return self._fim - self._inicio
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'MedidasView[M] | list[M]': ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            inicio, fim, passo = index.indices(len(self))
+            if passo != 1:
+                return [self[i] for i in range(inicio, fim, passo)]
+            return MedidasView(
+                self._dados, self._inicio + inicio, self._inicio + fim
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Índice fora da faixa de medidas.')
+        return self._dados[self._inicio + index]
+
+    def __iter__(self) -> Iterator[M]:
+        dados = self._dados
+        if self._inicio == 0 and self._fim == len(dados):
+            return iter(dados)
+        return (dados[i] for i in range(self._inicio, self._fim))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f'MedidasView({list(self)!r})'
@@ -16,10 +16,22 @@ This design allows:
 3. Adding new test types without modifying existing code
 """
 
+import math
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterator, Protocol, TypeVar
+from itertools import accumulate
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Iterator, Protocol, TypeVar
+
+from calculus_core.domain.profile_builder import (
+    ProfileBuilder,
+    validar_colunas,
+)
+from calculus_core.domain.profile_views import MedidasView
 
 # =============================================================================
 # ENUMS
@@ -170,9 +182,28 @@ class PerfilCPT:
         self._profundidades_cache: list[float] = []
 
     @property
-    def medidas(self) -> list[MedidaCPT]:
-        """Return a copy of the measurements list."""
-        return list(self._medidas)
+    def medidas(self) -> MedidasView[MedidaCPT]:
+        """Return a read-only view of the measurements."""
+        return MedidasView(self._medidas)
+
+    def medidas_entre(
+        self, prof_inicio: float, prof_fim: float
+    ) -> MedidasView[MedidaCPT]:
+        """
+        Return a view of the measurements with depth in [inicio, fim].
+
+        Args:
+            prof_inicio: Start depth in meters (inclusive).
+            prof_fim: End depth in meters (inclusive).
+
+        Returns:
+            Read-only view over the matching measurements.
+        """
+        return MedidasView(
+            self._medidas,
+            bisect_left(self._profundidades_cache, prof_inicio),
+            bisect_right(self._profundidades_cache, prof_fim),
+        )
 
     @property
     def test_type(self) -> SoilTestType:
@@ -183,6 +214,64 @@ class PerfilCPT:
         """Rebuild the depth lookup cache."""
         self._profundidades_cache = [m.profundidade for m in self._medidas]
 
+    def _definir_medidas(self, medidas: list[MedidaCPT]) -> None:
+        """Replace the measurements with a list already sorted by depth."""
+        self._medidas = medidas
+        self._rebuild_cache()
+
+    @classmethod
+    def builder(cls, **kwargs: Any) -> ProfileBuilder[MedidaCPT, 'PerfilCPT']:
+        """
+        Create a builder for bulk construction of a profile.
+
+        Args:
+            **kwargs: Profile attributes (nome_sondagem, intervalo_padrao).
+
+        Returns:
+            ProfileBuilder whose rows are (profundidade, qc, fs),
+            (profundidade, qc, fs, Rf) or (profundidade, qc, fs, Rf, u2).
+        """
+        return ProfileBuilder(cls(**kwargs), MedidaCPT)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        depths: Sequence[float],
+        qc: Sequence[float],
+        fs: Sequence[float],
+        rf: Sequence[float | None] | None = None,
+        u2: Sequence[float | None] | None = None,
+        **kwargs: Any,
+    ) -> 'PerfilCPT':
+        """
+        Build a profile from parallel columns, sorted or not.
+
+        Args:
+            depths: Depths in meters.
+            qc: Cone tip resistances (MPa).
+            fs: Sleeve frictions (kPa).
+            rf: Optional friction ratios (%).
+            u2: Optional pore pressures (kPa).
+            **kwargs: Profile attributes (nome_sondagem, intervalo_padrao).
+
+        Returns:
+            The populated profile.
+
+        Raises:
+            ValueError: If the columns have different lengths or a row is
+                invalid.
+        """
+        total = validar_colunas(depths=depths, qc=qc, fs=fs, rf=rf, u2=u2)
+        if rf is None:
+            rf = [None] * total
+        if u2 is None:
+            u2 = [None] * total
+        return (
+            cls.builder(**kwargs)
+            .estender(zip(depths, qc, fs, rf, u2))
+            .construir()
+        )
+
     def adicionar_medida(
         self,
         profundidade: float,
@@ -193,9 +282,10 @@ class PerfilCPT:
     ) -> None:
         """Add a single CPT measurement."""
         medida = MedidaCPT(profundidade, qc, fs, Rf, u2)
-        self._medidas.append(medida)
-        self._medidas.sort(key=lambda x: x.profundidade)
-        self._rebuild_cache()
+        # Copy-on-write keeps previously returned views unchanged
+        medidas = list(self._medidas)
+        insort(medidas, medida, key=lambda x: x.profundidade)
+        self._definir_medidas(medidas)
 
     def adicionar_medidas(
         self,
@@ -212,6 +302,7 @@ class PerfilCPT:
                 - (profundidade, qc, fs, Rf)
                 - (profundidade, qc, fs, Rf, u2)
         """
+        novas = []
         for item in dados:
             if len(item) == 3:
                 prof, qc, fs = item
@@ -223,20 +314,36 @@ class PerfilCPT:
                 prof, qc, fs, Rf, u2 = item
 
             medida = MedidaCPT(prof, qc, fs, Rf, u2)
-            self._medidas.append(medida)
+            novas.append(medida)
 
-        self._medidas.sort(key=lambda x: x.profundidade)
-        self._rebuild_cache()
+        medidas = [*self._medidas, *novas]
+        medidas.sort(key=lambda x: x.profundidade)
+        self._definir_medidas(medidas)
 
     def obter_medida(self, profundidade: float) -> MedidaCPT:
         """Get the CPT measurement closest to specified depth."""
-        if not self._medidas:
-            raise ValueError('Nenhuma medida registrada no perfil CPT.')
+        return self._medidas[self._indice_mais_proximo(profundidade)]
 
-        return min(
-            self._medidas,
-            key=lambda x: abs(x.profundidade - profundidade),
-        )
+    def _indice_mais_proximo(self, profundidade: float) -> int:
+        """
+        Index of the reading closest to a depth (the shallower on ties).
+
+        Raises:
+            ValueError: If the profile has no measurements.
+        """
+        profundidades = self._profundidades_cache
+        if not profundidades:
+            raise ValueError('Nenhuma medida registrada no perfil CPT.')
+        i = bisect_left(profundidades, profundidade)
+        if i == len(profundidades):
+            return bisect_left(profundidades, profundidades[-1])
+        if i > 0 and (
+            profundidade - profundidades[i - 1]
+            <= profundidades[i] - profundidade
+        ):
+            # First reading at that depth, as a linear scan would return
+            return bisect_left(profundidades, profundidades[i - 1])
+        return i
 
     def obter_qc_intervalo(
         self,
@@ -248,11 +355,7 @@ class PerfilCPT:
         if prof_inicio > prof_fim:
             prof_inicio, prof_fim = prof_fim, prof_inicio
 
-        medidas_intervalo = [
-            m
-            for m in self._medidas
-            if prof_inicio <= m.profundidade <= prof_fim
-        ]
+        medidas_intervalo = self.medidas_entre(prof_inicio, prof_fim)
 
         if not medidas_intervalo:
             return self.obter_medida(prof_inicio).qc
@@ -302,6 +405,399 @@ class PerfilCPT:
         return iter(self._medidas)
 
 
+# =============================================================================
+# COLUMNAR CPT STORAGE
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ColunasCPT:
+    """
+    Struct-of-arrays representation of a CPT profile.
+
+    Each attribute is a contiguous ``array('d')`` ordered by depth. Missing
+    Rf and u2 values are stored as NaN.
+
+    Attributes:
+        profundidades: Depths in meters.
+        qc: Cone tip resistances (MPa).
+        fs: Sleeve frictions (kPa).
+        rf: Friction ratios (%).
+        u2: Pore pressures (kPa).
+    """
+
+    profundidades: array
+    qc: array
+    fs: array
+    rf: array
+    u2: array
+
+    @classmethod
+    def de_linhas(cls, linhas: Iterable[tuple]) -> 'ColunasCPT':
+        """
+        Validate rows and build the columns, sorting once if needed.
+
+        Applies the checks and Rf derivation of MedidaCPT without creating
+        a MedidaCPT per row.
+
+        Args:
+            linhas: Rows of (profundidade, qc, fs[, Rf[, u2]]).
+
+        Returns:
+            ColunasCPT with one entry per row, sorted by depth.
+
+        Raises:
+            ValueError: If a row holds a negative depth, qc or fs.
+        """
+        registros = []
+        for linha in linhas:
+            profundidade, qc, fs, *resto = linha
+            rf = resto[0] if resto else None
+            u2 = resto[1] if len(resto) > 1 else None
+            if profundidade < 0:
+                raise ValueError('Profundidade não pode ser negativa.')
+            if qc < 0:
+                raise ValueError('qc não pode ser negativo.')
+            if fs < 0:
+                raise ValueError('fs não pode ser negativo.')
+            if rf is None and qc > 0:
+                rf = (fs / (qc * 1000)) * 100
+            registros.append(
+                (
+                    round(profundidade, 3),
+                    qc,
+                    fs,
+                    math.nan if rf is None else rf,
+                    math.nan if u2 is None else u2,
+                )
+            )
+        if any(
+            registros[i][0] > registros[i + 1][0]
+            for i in range(len(registros) - 1)
+        ):
+            registros.sort(key=itemgetter(0))
+        return cls._de_registros(registros)
+
+    @classmethod
+    def de_medidas(cls, medidas: Iterable[MedidaCPT]) -> 'ColunasCPT':
+        """
+        Build columns from measurements sorted by depth.
+
+        Args:
+            medidas: MedidaCPT objects sorted by depth.
+
+        Returns:
+            ColunasCPT with one entry per measurement.
+        """
+        return cls._de_registros(
+            (
+                m.profundidade,
+                m.qc,
+                m.fs,
+                math.nan if m.Rf is None else m.Rf,
+                math.nan if m.u2 is None else m.u2,
+            )
+            for m in medidas
+        )
+
+    @classmethod
+    def _de_registros(
+        cls, registros: Iterable[tuple[float, float, float, float, float]]
+    ) -> 'ColunasCPT':
+        colunas = [array('d') for _ in range(5)]
+        for registro in registros:
+            for coluna, valor in zip(colunas, registro):
+                coluna.append(valor)
+        return cls(*colunas)
+
+    def __len__(self) -> int:
+        return len(self.profundidades)
+
+    def registro(
+        self, indice: int
+    ) -> tuple[float, float, float, float | None, float | None]:
+        """Return the row at ``indice`` as a plain tuple."""
+        rf = self.rf[indice]
+        u2 = self.u2[indice]
+        return (
+            self.profundidades[indice],
+            self.qc[indice],
+            self.fs[indice],
+            None if math.isnan(rf) else rf,
+            None if math.isnan(u2) else u2,
+        )
+
+    def medida(self, indice: int) -> MedidaCPT:
+        """Materialize the row at ``indice`` as a MedidaCPT."""
+        return MedidaCPT(*self.registro(indice))
+
+
+class TabelaEsparsa:
+    """
+    Sparse table answering range min (or max) queries in O(1).
+
+    Level ``k`` holds the aggregate of every run of ``2**k`` values, so
+    any range is covered by two overlapping runs. Building costs
+    O(n log n) time and memory.
+    """
+
+    __slots__ = ('_funcao', '_niveis')
+
+    def __init__(
+        self,
+        valores: Sequence[float],
+        funcao: Callable[[float, float], float] = min,
+    ):
+        """
+        Build the table.
+
+        Args:
+            valores: Values to query.
+            funcao: Idempotent aggregate (``min`` or ``max``).
+        """
+        self._funcao = funcao
+        self._niveis = [array('d', valores)]
+        largura = 1
+        while 2 * largura <= len(valores):
+            anterior = self._niveis[-1]
+            self._niveis.append(
+                array(
+                    'd',
+                    map(
+                        funcao,
+                        anterior[: len(anterior) - largura],
+                        anterior[largura:],
+                    ),
+                )
+            )
+            largura *= 2
+
+    def consultar(self, inicio: int, fim: int) -> float:
+        """
+        Aggregate of ``valores[inicio:fim]``.
+
+        Raises:
+            ValueError: If the range is empty.
+        """
+        if fim <= inicio:
+            raise ValueError('Intervalo vazio na tabela esparsa.')
+        nivel = (fim - inicio).bit_length() - 1
+        valores = self._niveis[nivel]
+        return self._funcao(valores[inicio], valores[fim - (1 << nivel)])
+
+
+class _MedidasCPTColunares(Sequence):
+    """Read-only sequence materializing MedidaCPT rows on access."""
+
+    def __init__(self, colunas: ColunasCPT):
+        self._colunas = colunas
+
+    def __len__(self) -> int:
+        return len(self._colunas)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                self._colunas.medida(i)
+                for i in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Índice fora do perfil CPT.')
+        return self._colunas.medida(index)
+
+    def __iter__(self) -> Iterator[MedidaCPT]:
+        colunas = self._colunas
+        for i in range(len(colunas)):
+            yield colunas.medida(i)
+
+
+class PerfilCPTColunar(PerfilCPT):
+    """
+    PerfilCPT backed by contiguous columns instead of MedidaCPT objects.
+
+    Exposes the same API as PerfilCPT. Readings are materialized on
+    access, while the data lives in the arrays returned by ``colunas()``.
+    Interval queries use bisect on the depths, prefix sums of qc for means
+    and sparse tables for minimum and maximum, so each query is O(log n)
+    regardless of the interval length.
+
+    Example:
+        perfil = PerfilCPTColunar.from_arrays(depths, qc, fs)
+        perfil.obter_qc_intervalo(4.0, 6.0, metodo='minimo')
+    """
+
+    def __init__(
+        self,
+        nome_sondagem: str = 'CPT-01',
+        intervalo_padrao: float = 0.02,
+    ):
+        super().__init__(nome_sondagem, intervalo_padrao)
+        self._definir_colunas(ColunasCPT.de_linhas([]))
+
+    @classmethod
+    def from_arrays(
+        cls,
+        depths: Sequence[float],
+        qc: Sequence[float],
+        fs: Sequence[float],
+        rf: Sequence[float | None] | None = None,
+        u2: Sequence[float | None] | None = None,
+        **kwargs: Any,
+    ) -> 'PerfilCPTColunar':
+        """
+        Build a profile from parallel columns, sorted or not.
+
+        Rows go straight into the columns, without a MedidaCPT each.
+
+        Args:
+            depths: Depths in meters.
+            qc: Cone tip resistances (MPa).
+            fs: Sleeve frictions (kPa).
+            rf: Optional friction ratios (%).
+            u2: Optional pore pressures (kPa).
+            **kwargs: Profile attributes (nome_sondagem, intervalo_padrao).
+
+        Returns:
+            The populated profile.
+
+        Raises:
+            ValueError: If the columns have different lengths or a row is
+                invalid.
+        """
+        total = validar_colunas(depths=depths, qc=qc, fs=fs, rf=rf, u2=u2)
+        if rf is None:
+            rf = [None] * total
+        if u2 is None:
+            u2 = [None] * total
+        perfil = cls(**kwargs)
+        perfil._definir_colunas(
+            ColunasCPT.de_linhas(zip(depths, qc, fs, rf, u2))
+        )
+        return perfil
+
+    @classmethod
+    def de_perfil(cls, perfil: PerfilCPT) -> 'PerfilCPTColunar':
+        """
+        Create a columnar copy of an existing profile.
+
+        Args:
+            perfil: Source CPT profile.
+
+        Returns:
+            PerfilCPTColunar with the same metadata and readings.
+        """
+        novo = cls(
+            nome_sondagem=perfil.nome_sondagem,
+            intervalo_padrao=perfil.intervalo_padrao,
+        )
+        novo._definir_colunas(ColunasCPT.de_medidas(perfil))
+        return novo
+
+    @classmethod
+    def de_colunas(
+        cls, colunas: ColunasCPT, **kwargs: Any
+    ) -> 'PerfilCPTColunar':
+        """
+        Create a profile that uses existing columns as its storage.
+
+        Args:
+            colunas: Columns sorted by depth (not copied).
+            **kwargs: Profile attributes (nome_sondagem, intervalo_padrao).
+
+        Returns:
+            PerfilCPTColunar backed by ``colunas``.
+        """
+        perfil = cls(**kwargs)
+        perfil._definir_colunas(colunas)
+        return perfil
+
+    def _definir_colunas(self, colunas: ColunasCPT) -> None:
+        """Replace the storage and drop the derived indices."""
+        self._colunas = colunas
+        self._medidas = _MedidasCPTColunares(colunas)
+        self._profundidades_cache = colunas.profundidades
+        self._somas_qc: array | None = None
+        self._tabelas_qc: dict[str, TabelaEsparsa] = {}
+
+    def _rebuild_cache(self) -> None:
+        """Columns are the storage, so there is nothing to rebuild."""
+
+    def _definir_medidas(self, medidas: list[MedidaCPT]) -> None:
+        """Replace the storage with readings sorted by depth."""
+        self._definir_colunas(ColunasCPT.de_medidas(medidas))
+
+    def colunas(self) -> ColunasCPT:
+        """Return the columns backing this profile."""
+        return self._colunas
+
+    def _inserir(self, linhas: Iterable[tuple]) -> None:
+        colunas = self._colunas
+        existentes = (colunas.registro(i) for i in range(len(colunas)))
+        self._definir_colunas(ColunasCPT.de_linhas([*existentes, *linhas]))
+
+    def adicionar_medida(
+        self,
+        profundidade: float,
+        qc: float,
+        fs: float,
+        Rf: float | None = None,
+        u2: float | None = None,
+    ) -> None:
+        """Add a single CPT measurement."""
+        self._inserir([(profundidade, qc, fs, Rf, u2)])
+
+    def adicionar_medidas(
+        self,
+        dados: list[tuple[float, float, float]]
+        | list[tuple[float, float, float, float]]
+        | list[tuple[float, float, float, float, float]],
+    ) -> None:
+        """
+        Add multiple CPT measurements at once.
+
+        Args:
+            dados: List of (profundidade, qc, fs[, Rf[, u2]]) tuples.
+        """
+        self._inserir(dados)
+
+    def _tabela_qc(self, metodo: str) -> TabelaEsparsa:
+        tabela = self._tabelas_qc.get(metodo)
+        if tabela is None:
+            funcao = min if metodo == 'minimo' else max
+            tabela = TabelaEsparsa(self._colunas.qc, funcao)
+            self._tabelas_qc[metodo] = tabela
+        return tabela
+
+    def obter_qc_intervalo(
+        self,
+        prof_inicio: float,
+        prof_fim: float,
+        metodo: str = 'media',
+    ) -> float:
+        """Get aggregate qc for a depth interval."""
+        if prof_inicio > prof_fim:
+            prof_inicio, prof_fim = prof_fim, prof_inicio
+
+        inicio = bisect_left(self._profundidades_cache, prof_inicio)
+        fim = bisect_right(self._profundidades_cache, prof_fim)
+        if inicio >= fim:
+            return self._colunas.qc[self._indice_mais_proximo(prof_inicio)]
+
+        if metodo in ('minimo', 'maximo'):
+            return self._tabela_qc(metodo).consultar(inicio, fim)
+        if self._somas_qc is None:
+            self._somas_qc = array(
+                'd', accumulate(self._colunas.qc, initial=0.0)
+            )
+        somas = self._somas_qc
+        return (somas[fim] - somas[inicio]) / (fim - inicio)
+
+    def __repr__(self) -> str:
+        return super().__repr__().replace('PerfilCPT(', 'PerfilCPTColunar(', 1)
+
+
 # =============================================================================
 # SOIL PROFILE PROTOCOL
 # =============================================================================
@@ -538,7 +1034,7 @@ class CPTtoSPTConverter:
 
     def convert(
         self,
-        perfil_cpt: PerfilCPT,
+        perfil_cpt: PerfilCPT | Iterable[MedidaCPT | tuple],
         intervalo: float = 1.0,
         nome_sondagem: str | None = None,
     ):
@@ -546,48 +1042,112 @@ class CPTtoSPTConverter:
         Convert CPT profile to equivalent SPT profile.
 
         Args:
-            perfil_cpt: Source CPT profile.
+            perfil_cpt: Source CPT profile, or any iterable (e.g. a
+                generator reading a file) of MedidaCPT or
+                (profundidade, qc, fs[, Rf[, u2]]) rows sorted by depth.
             intervalo: Output SPT sampling interval in meters.
             nome_sondagem: Name for output profile.
 
         Returns:
             PerfilSPT with equivalent N_SPT values.
+
+        Raises:
+            ValueError: If there are no measurements, the rows are not
+                sorted by depth or the interval is not positive.
         """
         from calculus_core.domain.model import PerfilSPT
 
-        nome = nome_sondagem or f'{perfil_cpt.nome_sondagem}_SPT'
-        perfil_spt = PerfilSPT(nome_sondagem=nome, intervalo_padrao=intervalo)
-
-        # Sample at regular intervals
-        prof = perfil_cpt.profundidade_minima
-        while prof <= perfil_cpt.profundidade_maxima:
-            # Average CPT values in interval
-            medidas_intervalo = [
-                m
-                for m in perfil_cpt
-                if (prof - intervalo / 2)
-                <= m.profundidade
-                <= (prof + intervalo / 2)
-            ]
+        nome_origem = getattr(perfil_cpt, 'nome_sondagem', 'CPT-01')
+        nome = nome_sondagem or f'{nome_origem}_SPT'
+        return (
+            PerfilSPT.builder(nome_sondagem=nome, intervalo_padrao=intervalo)
+            .estender(self.linhas_spt(perfil_cpt, intervalo))
+            .construir()
+        )
 
-            if medidas_intervalo:
-                # Average qc and Rf
-                qc_medio = sum(m.qc for m in medidas_intervalo) / len(
-                    medidas_intervalo
-                )
+    def linhas_spt(
+        self,
+        medidas: Iterable[MedidaCPT | tuple],
+        intervalo: float = 1.0,
+    ) -> Iterator[tuple[float, int, str]]:
+        """
+        Yield the equivalent SPT rows of a CPT sounding in one pass.
 
-                # Infer soil type from average
-                medida_ref = medidas_intervalo[len(medidas_intervalo) // 2]
-                tipo_solo = self.inferir_tipo_solo(medida_ref)
+        Samples every ``intervalo`` meters from the first depth, averaging
+        qc over the points within half an interval of each sample depth.
+        The window boundaries only move forward, so each CPT point is read
+        once and kept only while some window can still contain it; the
+        input is never materialized as a whole.
 
-                # Convert to N_SPT
-                n_spt = self.converter_qc_para_nspt(qc_medio, tipo_solo)
+        Args:
+            medidas: MedidaCPT objects or (profundidade, qc, fs[, Rf[,
+                u2]]) rows, sorted by depth.
+            intervalo: Output SPT sampling interval in meters.
 
-                perfil_spt.adicionar_medida(prof, n_spt, tipo_solo)
+        Yields:
+            (profundidade, n_spt, tipo_solo) rows, by increasing depth.
 
-            prof = round(prof + intervalo, 3)
+        Raises:
+            ValueError: If there are no measurements, the rows are not
+                sorted by depth or the interval is not positive.
+        """
+        if intervalo <= 0:
+            raise ValueError('Intervalo deve ser positivo.')
+        fonte = (
+            m if isinstance(m, MedidaCPT) else MedidaCPT(*m) for m in medidas
+        )
+        proxima = next(fonte, None)
+        if proxima is None:
+            raise ValueError('Nenhuma medida registrada.')
+
+        metade = intervalo / 2
+        # Points of the current window are janela[inicio:]
+        janela: list[MedidaCPT] = []
+        inicio = 0
+        ultima = proxima.profundidade
+        prof = proxima.profundidade
+        while True:
+            # Advance the upper bound: read every point up to prof + h
+            while (
+                proxima is not None and proxima.profundidade <= prof + metade
+            ):
+                if proxima.profundidade < ultima:
+                    raise ValueError(
+                        'As medidas CPT devem estar em ordem crescente '
+                        'de profundidade.'
+                    )
+                ultima = proxima.profundidade
+                janela.append(proxima)
+                proxima = next(fonte, None)
+            if proxima is None and prof > ultima:
+                break
+
+            # Advance the lower bound: drop points above prof - h
+            while (
+                inicio < len(janela)
+                and janela[inicio].profundidade < prof - metade
+            ):
+                inicio += 1
+            if inicio > len(janela) // 2:
+                del janela[:inicio]
+                inicio = 0
+
+            total = len(janela) - inicio
+            if total:
+                # Each point is in at most two windows, so summing the
+                # window is O(1) amortized per point
+                qc_medio = (
+                    sum(janela[k].qc for k in range(inicio, len(janela)))
+                    / total
+                )
+                tipo_solo = self.inferir_tipo_solo(janela[inicio + total // 2])
+                yield (
+                    prof,
+                    self.converter_qc_para_nspt(qc_medio, tipo_solo),
+                    tipo_solo,
+                )
 
-        return perfil_spt
+            prof = round(prof + intervalo, 3)
 
 
 # =============================================================================
@@ -653,7 +1213,7 @@ ConversionRegistry.register(
 
 
 def converter_cpt_para_spt(
-    perfil_cpt: PerfilCPT,
+    perfil_cpt: PerfilCPT | Iterable[MedidaCPT | tuple],
     correlacao: str = 'robertson_1983',
     intervalo: float = 1.0,
 ):
@@ -661,7 +1221,7 @@ def converter_cpt_para_spt(
     Convenience function to convert CPT to equivalent SPT.
 
     Args:
-        perfil_cpt: Source CPT profile.
+        perfil_cpt: Source CPT profile (or rows sorted by depth).
         correlacao: Correlation name ('robertson_1983', 'aoki_velloso_1975', 'decourt_1995').
         intervalo: Output sampling interval.
 
@@ -9,11 +9,26 @@ Design Principles:
 1. Each method defines its own valid soil types
 2. A mapping layer translates between a canonical soil type and method-specific types
 3. Methods can define fallback strategies for unsupported soils
+4. Soil and pile type names are interned once into compact integer codes,
+   so hot paths index precomputed per-method tables instead of
+   re-normalizing strings
 """
 
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
 from enum import Enum, auto
-from typing import Protocol, runtime_checkable
+from typing import (
+    Callable,
+    Generic,
+    Iterable,
+    Protocol,
+    TypeVar,
+    runtime_checkable,
+)
+
+T = TypeVar('T')
 
 # =============================================================================
 # CANONICAL SOIL TYPES
@@ -88,6 +103,356 @@ class TipoSoloCanonical(Enum):
         """Convert to lowercase string representation."""
         return self.name.lower()
 
+    @property
+    def codigo(self) -> int:
+        """Integer code of this soil type in ``CODIGOS_SOLO``."""
+        return CODIGOS_SOLO.codigo(self.to_string())
+
+    @classmethod
+    def from_codigo(cls, codigo: int) -> 'TipoSoloCanonical':
+        """
+        Create from an integer code of ``CODIGOS_SOLO``.
+
+        Raises:
+            ValueError: If the code is not a canonical soil type.
+        """
+        return cls.from_string(CODIGOS_SOLO.nome(codigo))
+
+
+# =============================================================================
+# INTEGER TYPE CODES
+# =============================================================================
+
+
+# Codes a table assigns at once (codes must fit uint16 columns)
+LIMITE_CODIGOS = 4096
+
+# Raw spellings memoized per interned name, on average
+GRAFIAS_POR_CODIGO = 4
+
+# Recently looked-up names kept assigned even when no profile holds them
+RESERVAS_RECENTES = 256
+
+
+def normalizar_nome_tipo(nome: str) -> str:
+    """Normalize a soil or pile type name (lowercase, underscores)."""
+    return nome.lower().replace(' ', '_').replace('-', '_')
+
+
+class ReservaCodigo:
+    """
+    Keeps a name's code assigned while referenced.
+
+    Attributes:
+        codigo: Integer code of the name.
+        nome: Normalized name.
+    """
+
+    __slots__ = ('__weakref__', 'codigo', 'nome')
+
+    def __init__(self, codigo: int, nome: str):
+        self.codigo = codigo
+        self.nome = nome
+
+    def __repr__(self) -> str:
+        return f'ReservaCodigo({self.codigo}, {self.nome!r})'
+
+
+class TabelaCodigos:
+    """
+    Interns type names into compact integer codes.
+
+    Names are normalized once (lowercase, spaces and hyphens to
+    underscores) and spellings are memoized, so looking up the code of a
+    name already seen is a single dict access. Codes are dense; the first
+    256 fit in uint8.
+
+    The initial names (the canonical vocabulary) keep their codes for
+    the life of the process. Other names may come from untrusted input
+    (e.g. the HTTP server), so their codes are recycled: a code stays
+    assigned while a ``ReservaCodigo`` for it is alive (profile columns
+    hold the reservations of their soils) or while the name is among the
+    ``RESERVAS_RECENTES`` last looked up with ``codigo``. When all
+    ``limite`` codes are taken, the code of a name no longer in use is
+    given to the new name, so junk names never lock the table.
+
+    Example:
+        codigo = CODIGOS_SOLO.codigo('Argila Arenosa')
+        CODIGOS_SOLO.nome(codigo)  # 'argila_arenosa'
+    """
+
+    def __init__(
+        self,
+        nomes_iniciais: Iterable[str] = (),
+        limite: int = LIMITE_CODIGOS,
+    ):
+        """
+        Initialize the table.
+
+        Args:
+            nomes_iniciais: Permanent names that receive the first codes,
+                in order.
+            limite: Maximum number of codes (at most 65536).
+
+        Raises:
+            ValueError: If the limit is invalid.
+        """
+        if not 0 < limite <= 65536:
+            raise ValueError('Limite de códigos deve estar entre 1 e 65536.')
+        self.limite = limite
+        self._nomes: list[str] = []
+        self._codigos: dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Permanent codes [0, _fixos) and their shared reservations
+        self._fixos = 0
+        self._permanentes: list[ReservaCodigo] = []
+        # Recyclable codes: live reservation and memoized spellings
+        self._reservas: dict[int, weakref.ref[ReservaCodigo]] = {}
+        self._grafias: dict[int, list[str]] = {}
+        self._recentes: deque[ReservaCodigo] = deque(maxlen=RESERVAS_RECENTES)
+        # Codes whose reservation died (appended by weakref callbacks,
+        # which may run anywhere, so they never take the lock)
+        self._mortos: deque[int] = deque()
+        self._livres: deque[int] = deque()
+        self._mapeamentos: weakref.WeakSet[MapeamentoCodigos] = (
+            weakref.WeakSet()
+        )
+        for nome in nomes_iniciais:
+            normalizado = normalizar_nome_tipo(nome)
+            if normalizado not in self._codigos:
+                self._codigos[normalizado] = len(self._nomes)
+                self._nomes.append(normalizado)
+            self._codigos.setdefault(nome, self._codigos[normalizado])
+        if len(self._nomes) > limite:
+            raise ValueError('Nomes iniciais excedem o limite de códigos.')
+        self._fixos = len(self._nomes)
+        self._permanentes = [
+            ReservaCodigo(codigo, nome)
+            for codigo, nome in enumerate(self._nomes)
+        ]
+
+    def codigo(self, nome: str) -> int:
+        """
+        Return the code of a name, interning it if new.
+
+        The code of a name outside the initial ones stays valid while the
+        name is in use; hold ``reservar(nome)`` to keep it for longer.
+
+        Raises:
+            ValueError: If every code is held by a name in use.
+        """
+        reserva = self.reservar(nome)
+        if reserva.codigo >= self._fixos:
+            self._recentes.append(reserva)
+        return reserva.codigo
+
+    def reservar(self, nome: str) -> ReservaCodigo:
+        """
+        Return the reservation of a name, interning it if new.
+
+        Raises:
+            ValueError: If every code is held by a name in use.
+        """
+        codigo = self._codigos.get(nome)
+        if codigo is not None:
+            if codigo < self._fixos:
+                return self._permanentes[codigo]
+            reserva = self._reservas.get(codigo, _morta)()
+            # Still this name's code (it cannot change while reserved)
+            if reserva is not None and self._codigos.get(nome) == codigo:
+                return reserva
+        return self._reservar(nome)
+
+    def _reservar(self, nome: str) -> ReservaCodigo:
+        normalizado = normalizar_nome_tipo(nome)
+        with self._lock:
+            codigo = self._codigos.get(normalizado)
+            if codigo is not None and codigo < self._fixos:
+                reserva = self._permanentes[codigo]
+            else:
+                if codigo is None:
+                    codigo = self._novo_codigo(nome)
+                    self._nomes[codigo] = normalizado
+                    self._codigos[normalizado] = codigo
+                    self._grafias[codigo] = [normalizado]
+                reserva = self._reservas.get(codigo, _morta)()
+                if reserva is None:
+                    reserva = ReservaCodigo(codigo, normalizado)
+                    self._reservas[codigo] = weakref.ref(
+                        reserva, self._ao_liberar(codigo)
+                    )
+                self._recentes.append(reserva)
+            if (
+                nome not in self._codigos
+                and len(self._codigos) < GRAFIAS_POR_CODIGO * self.limite
+            ):
+                self._codigos[nome] = codigo
+                if codigo >= self._fixos:
+                    self._grafias[codigo].append(nome)
+        return reserva
+
+    def reter(self, codigos: Iterable[int]) -> tuple[ReservaCodigo, ...]:
+        """
+        Return reservations keeping the given codes assigned.
+
+        Args:
+            codigos: Codes in use (e.g. a soil code column).
+
+        Returns:
+            One reservation per distinct recyclable code.
+        """
+        reservas = []
+        with self._lock:
+            for codigo in {c for c in codigos if c >= self._fixos}:
+                reserva = self._reservas.get(codigo, _morta)()
+                if reserva is None and codigo in self._grafias:
+                    reserva = ReservaCodigo(codigo, self._nomes[codigo])
+                    self._reservas[codigo] = weakref.ref(
+                        reserva, self._ao_liberar(codigo)
+                    )
+                if reserva is not None:
+                    reservas.append(reserva)
+        return tuple(reservas)
+
+    def _ao_liberar(self, codigo: int) -> Callable[[weakref.ref], None]:
+        def liberar(_: weakref.ref) -> None:
+            self._mortos.append(codigo)
+
+        return liberar
+
+    def _novo_codigo(self, nome: str) -> int:
+        """Assign a free code (with the lock held)."""
+        if len(self._nomes) < self.limite:
+            self._nomes.append('')
+            return len(self._nomes) - 1
+        if not self._coletar():
+            # Let go of the recent names and try again
+            self._recentes.clear()
+            if not self._coletar():
+                raise ValueError(
+                    f'Tipo não reconhecido: {nome!r} (limite de '
+                    f'{self.limite} tipos em uso atingido).'
+                )
+        codigo = self._livres.popleft()
+        for mapeamento in self._mapeamentos:
+            mapeamento._descartar(codigo)
+        return codigo
+
+    def _coletar(self) -> bool:
+        """Free the codes whose reservations died; True if any is free."""
+        while self._mortos:
+            codigo = self._mortos.popleft()
+            ref = self._reservas.get(codigo)
+            if ref is None or ref() is not None:
+                # Already freed, or reserved again since
+                continue
+            del self._reservas[codigo]
+            for grafia in self._grafias.pop(codigo):
+                self._codigos.pop(grafia, None)
+            self._livres.append(codigo)
+        return bool(self._livres)
+
+    def nome(self, codigo: int) -> str:
+        """
+        Return the normalized name of a code.
+
+        Raises:
+            ValueError: If the code was never assigned.
+        """
+        if not 0 <= codigo < len(self._nomes):
+            raise ValueError(f'Código de tipo desconhecido: {codigo}')
+        return self._nomes[codigo]
+
+    def __len__(self) -> int:
+        return len(self._nomes)
+
+    def mapear(self, funcao: Callable[[str], T]) -> 'MapeamentoCodigos[T]':
+        """
+        Create a per-method table derived from the normalized names.
+
+        Args:
+            funcao: Maps a normalized name to the method-specific value.
+
+        Returns:
+            MapeamentoCodigos computing ``funcao`` once per code.
+        """
+        mapeamento = MapeamentoCodigos(self, funcao)
+        self._mapeamentos.add(mapeamento)
+        return mapeamento
+
+
+def _morta() -> None:
+    """Stand-in for a missing weak reference."""
+    return None
+
+
+# Placeholder of a value not computed yet
+_PENDENTE = object()
+
+
+class MapeamentoCodigos(Generic[T]):
+    """
+    Per-method lookup table indexed by type code.
+
+    Values are computed once per code, on first use, from the normalized
+    name, so the method's normalization never runs twice for a type. A
+    value is dropped when its table gives the code to another name.
+    """
+
+    def __init__(self, tabela: TabelaCodigos, funcao: Callable[[str], T]):
+        self._tabela = tabela
+        self._funcao = funcao
+        self._valores: list = []
+        self._lock = threading.Lock()
+
+    def __getitem__(self, codigo: int) -> T:
+        valores = self._valores
+        if codigo < len(valores):
+            valor = valores[codigo]
+            if valor is not _PENDENTE:
+                return valor
+        with self._lock:
+            nome = self._tabela.nome(codigo)
+            if len(valores) <= codigo:
+                valores.extend([_PENDENTE] * (codigo + 1 - len(valores)))
+            valor = valores[codigo]
+            if valor is _PENDENTE:
+                valor = valores[codigo] = self._funcao(nome)
+        return valor
+
+    def para_nome(self, nome: str) -> T:
+        """Return the value for a (possibly unnormalized) name."""
+        codigos = self._tabela._codigos
+        codigo = codigos.get(nome)
+        if codigo is not None and codigo < len(self._valores):
+            valor = self._valores[codigo]
+            # Recycled codes are unmapped first, so a second lookup
+            # confirms the value belongs to this name
+            if valor is not _PENDENTE and codigos.get(nome) == codigo:
+                return valor
+        reserva = self._tabela.reservar(nome)
+        return self[reserva.codigo]
+
+    def _descartar(self, codigo: int) -> None:
+        """Forget the value of a code given to another name."""
+        if codigo < len(self._valores):
+            self._valores[codigo] = _PENDENTE
+
+
+# Canonical soil types take the first codes, in enum order
+CODIGOS_SOLO = TabelaCodigos(tipo.to_string() for tipo in TipoSoloCanonical)
+CODIGOS_ESTACA = TabelaCodigos()
+
+
+def codigo_solo(nome: str) -> int:
+    """Return the integer code of a soil type name."""
+    return CODIGOS_SOLO.codigo(nome)
+
+
+def codigo_estaca(nome: str) -> int:
+    """Return the integer code of a pile type name."""
+    return CODIGOS_ESTACA.codigo(nome)
+
 
 # =============================================================================
 # SOIL MAPPER PROTOCOL
@@ -448,3 +813,27 @@ def is_soil_supported(solo: str, method: str) -> bool:
     """Check if a soil type is supported by a method."""
     mapper = SoilMapperRegistry.get(method)
     return mapper.supports_soil_type(solo)
+
+
+def tabela_solo_metodo(
+    method: str, context: str | None = None
+) -> list[str | None]:
+    """
+    Precompute a method's mapping for every canonical soil code.
+
+    Args:
+        method: Calculation method name in ``SoilMapperRegistry``.
+        context: Optional context for mapping.
+
+    Returns:
+        List indexed by ``TipoSoloCanonical.codigo`` with the
+        method-specific soil type, or None where it is not supported.
+    """
+    mapper = SoilMapperRegistry.get(method)
+    tabela: list[str | None] = []
+    for tipo in TipoSoloCanonical:
+        try:
+            tabela.append(mapper.map_soil_type(tipo, context))
+        except ValueError:
+            tabela.append(None)
+    return tabela
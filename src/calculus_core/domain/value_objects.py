@@ -5,8 +5,11 @@ Value objects are immutable and compared by their values rather than identity.
 They represent concepts from the domain that have no lifecycle or identity.
 """
 
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Iterable, Iterator, overload
 
 
 class FormatoEstaca(str, Enum):
@@ -78,6 +81,297 @@ class ResultadoCalculo:
         }
 
 
+class CurvaCapacidade(Sequence[ResultadoCalculo]):
+    """
+    Immutable load capacity results for a sequence of cotas, by column.
+
+    Each quantity is stored in a contiguous ``array.array('d')``, so a
+    curve costs five machine arrays instead of one validated dataclass per
+    cota. Rows are materialized as ResultadoCalculo only on access, which
+    keeps code written for ``list[ResultadoCalculo]`` working (indexing,
+    iteration, ``len`` and equality with lists).
+
+    Curves are shared between callers (memoized and coalesced results),
+    so the arrays are private and the columns are exposed as read-only
+    float64 ``memoryview`` objects.
+
+    Attributes:
+        cotas: Installation depths.
+        resistencia_ponta: Tip resistance per cota.
+        resistencia_lateral: Lateral resistance per cota.
+        capacidade_carga: Total capacity per cota.
+        capacidade_carga_adm: Allowable capacity per cota.
+
+    Example:
+        curva = calculator.calcular_curva(perfil, estaca)
+        curva[0].capacidade_carga_adm
+        df = curva.to_pandas()
+    """
+
+    COLUNAS = (
+        'cota',
+        'resistencia_ponta',
+        'resistencia_lateral',
+        'capacidade_carga',
+        'capacidade_carga_adm',
+    )
+
+    __slots__ = (
+        '_capacidade_carga',
+        '_capacidade_carga_adm',
+        '_cotas',
+        '_cotas_inteiras',
+        '_resistencia_lateral',
+        '_resistencia_ponta',
+    )
+
+    def __init__(
+        self,
+        cotas: Iterable[float],
+        resistencia_ponta: Iterable[float],
+        resistencia_lateral: Iterable[float],
+        capacidade_carga: Iterable[float],
+        capacidade_carga_adm: Iterable[float],
+    ):
+        """
+        Build a curve from its columns (always copied).
+
+        Raises:
+            ValueError: If the columns differ in length or hold values a
+                ResultadoCalculo would reject.
+        """
+        self._adotar(
+            array('d', cotas),
+            array('d', resistencia_ponta),
+            array('d', resistencia_lateral),
+            array('d', capacidade_carga),
+            array('d', capacidade_carga_adm),
+        )
+
+    @classmethod
+    def _de_arrays(cls, *colunas: array) -> 'CurvaCapacidade':
+        """Build a curve that takes over arrays nobody else holds."""
+        curva = cls.__new__(cls)
+        curva._adotar(*colunas)
+        return curva
+
+    def _adotar(
+        self,
+        cotas: array,
+        resistencia_ponta: array,
+        resistencia_lateral: array,
+        capacidade_carga: array,
+        capacidade_carga_adm: array,
+    ) -> None:
+        self._cotas = cotas
+        self._resistencia_ponta = resistencia_ponta
+        self._resistencia_lateral = resistencia_lateral
+        self._capacidade_carga = capacidade_carga
+        self._capacidade_carga_adm = capacidade_carga_adm
+
+        tamanhos = {len(coluna) for coluna in self._colunas()}
+        if len(tamanhos) > 1:
+            raise ValueError('As colunas da curva devem ter o mesmo tamanho.')
+        # Same checks as ResultadoCalculo, once per column
+        if cotas and min(cotas) < 1:
+            raise ValueError('Cota deve ser >= 1.')
+        if resistencia_ponta and min(resistencia_ponta) < 0:
+            raise ValueError('Resistência de ponta não pode ser negativa.')
+        if resistencia_lateral and min(resistencia_lateral) < 0:
+            raise ValueError('Resistência lateral não pode ser negativa.')
+        self._cotas_inteiras = all(c.is_integer() for c in cotas)
+
+    @property
+    def cotas(self) -> memoryview:
+        """Installation depths (read-only)."""
+        return memoryview(self._cotas).toreadonly()
+
+    @property
+    def resistencia_ponta(self) -> memoryview:
+        """Tip resistance per cota (read-only)."""
+        return memoryview(self._resistencia_ponta).toreadonly()
+
+    @property
+    def resistencia_lateral(self) -> memoryview:
+        """Lateral resistance per cota (read-only)."""
+        return memoryview(self._resistencia_lateral).toreadonly()
+
+    @property
+    def capacidade_carga(self) -> memoryview:
+        """Total capacity per cota (read-only)."""
+        return memoryview(self._capacidade_carga).toreadonly()
+
+    @property
+    def capacidade_carga_adm(self) -> memoryview:
+        """Allowable capacity per cota (read-only)."""
+        return memoryview(self._capacidade_carga_adm).toreadonly()
+
+    @classmethod
+    def de_resultados(
+        cls, resultados: Iterable[ResultadoCalculo]
+    ) -> 'CurvaCapacidade':
+        """Build a curve from per-cota results."""
+        construtor = ConstrutorCurva()
+        for r in resultados:
+            construtor.adicionar(
+                r.cota,
+                r.resistencia_ponta,
+                r.resistencia_lateral,
+                r.capacidade_carga,
+                r.capacidade_carga_adm,
+            )
+        return construtor.construir()
+
+    def _colunas(self) -> tuple[array, ...]:
+        return (
+            self._cotas,
+            self._resistencia_ponta,
+            self._resistencia_lateral,
+            self._capacidade_carga,
+            self._capacidade_carga_adm,
+        )
+
+    def _cota(self, indice: int) -> float:
+        cota = self._cotas[indice]
+        return int(cota) if self._cotas_inteiras else cota
+
+    def __len__(self) -> int:
+        return len(self._cotas)
+
+    @overload
+    def __getitem__(self, indice: int) -> ResultadoCalculo: ...
+
+    @overload
+    def __getitem__(self, indice: slice) -> 'CurvaCapacidade': ...
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            # Slicing an array copies it
+            return CurvaCapacidade._de_arrays(
+                *(coluna[indice] for coluna in self._colunas())
+            )
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError('Índice fora da faixa da curva.')
+        return ResultadoCalculo(
+            cota=self._cota(indice),
+            resistencia_ponta=self._resistencia_ponta[indice],
+            resistencia_lateral=self._resistencia_lateral[indice],
+            capacidade_carga=self._capacidade_carga[indice],
+            capacidade_carga_adm=self._capacidade_carga_adm[indice],
+        )
+
+    def __iter__(self) -> Iterator[ResultadoCalculo]:
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CurvaCapacidade):
+            return self._colunas() == other._colunas()
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f'CurvaCapacidade({len(self)} cotas)'
+
+    def to_dict_of_lists(self) -> dict[str, list]:
+        """
+        Export the columns as plain lists.
+
+        Returns:
+            Mapping of column name (as in ``ResultadoCalculo.to_dict``)
+            to list of values.
+        """
+        dados = {
+            nome: coluna.tolist()
+            for nome, coluna in zip(self.COLUNAS, self._colunas())
+        }
+        if self._cotas_inteiras:
+            dados['cota'] = [int(c) for c in self._cotas]
+        return dados
+
+    def to_dicts(self) -> list[dict]:
+        """Export one dictionary per cota (``ResultadoCalculo.to_dict``)."""
+        colunas = self.to_dict_of_lists()
+        return [
+            dict(zip(self.COLUNAS, linha))
+            for linha in zip(*(colunas[nome] for nome in self.COLUNAS))
+        ]
+
+    def buffers(self) -> dict[str, memoryview]:
+        """
+        Expose the columns through the buffer protocol without copying.
+
+        Returns:
+            Mapping of column name to a read-only ``memoryview`` of
+            float64 values.
+        """
+        return {
+            nome: memoryview(coluna).toreadonly()
+            for nome, coluna in zip(self.COLUNAS, self._colunas())
+        }
+
+    def to_pandas(self) -> Any:
+        """
+        Export the curve as a pandas DataFrame.
+
+        Returns:
+            DataFrame with one row per cota and the ``COLUNAS`` columns.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        try:
+            import pandas as pd
+        except ImportError as exc:
+            raise ImportError(
+                'pandas não está instalado. Instale com: pip install pandas'
+            ) from exc
+        return pd.DataFrame(self.to_dict_of_lists(), columns=self.COLUNAS)
+
+
+class ConstrutorCurva:
+    """
+    Accumulates per-cota values and builds a CurvaCapacidade.
+
+    Used by the single-pass ``calcular_curva`` implementations to append
+    into the column arrays directly.
+    """
+
+    __slots__ = ('_colunas',)
+
+    def __init__(self) -> None:
+        self._colunas = tuple(array('d') for _ in CurvaCapacidade.COLUNAS)
+
+    def adicionar(
+        self,
+        cota: float,
+        resistencia_ponta: float,
+        resistencia_lateral: float,
+        capacidade_carga: float,
+        capacidade_carga_adm: float,
+    ) -> None:
+        """Append the values of one cota."""
+        cotas, rp, rl, q, qadm = self._colunas
+        cotas.append(cota)
+        rp.append(resistencia_ponta)
+        rl.append(resistencia_lateral)
+        q.append(capacidade_carga)
+        qadm.append(capacidade_carga_adm)
+
+    def construir(self) -> CurvaCapacidade:
+        """Validate the columns and return the curve."""
+        colunas = self._colunas
+        # The curve takes over the arrays; later rows start a new curve
+        self._colunas = tuple(array('d') for _ in CurvaCapacidade.COLUNAS)
+        return CurvaCapacidade._de_arrays(*colunas)
+
+
 @dataclass(frozen=True)
 class FatoresF1F2:
     """Value object for F1 and F2 factors."""
@@ -2,9 +2,10 @@
 Entrypoints Layer - External Interfaces
 
 This package contains the entry points for external consumers:
-- CLI: Command-line interface
+- CLI: Command-line interface (calculus-app, calculus-core)
+- Batch: Headless batch runs over files of borings
 - Streamlit App: Web-based user interface
-- (Future) API: REST API endpoints
+- Server: HTTP/JSON API (calculus-serve)
 
 Entrypoints should:
 - Handle user input/output
@@ -13,6 +14,7 @@ Entrypoints should:
 - NOT contain business logic
 """
 
-from .cli import run_app
+from .cli import main, run_app
+from .server import run_server
 
-__all__ = ['run_app']
+__all__ = ['main', 'run_app', 'run_server']
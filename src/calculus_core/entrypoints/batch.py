@@ -0,0 +1,469 @@
+"""
+Batch Entry Point
+
+Headless batch runs over directories of borings (``calculus-core batch``).
+
+Borings are read from CSV files (SPT or CPT, recognized by their
+columns) and from profile archives (``.ccpf``), given directly, as
+directories, or listed in manifest files (one path per line, relative
+to the manifest; ``#`` starts a comment). CPT soundings are converted to
+equivalent SPT profiles.
+
+Only the standard library is used. Files are parsed where the boring is
+calculated, at most a bounded number of borings are in flight, and each
+boring's rows are written as soon as it is done, so memory does not grow
+with the number or size of the inputs.
+
+Exit status:
+    0  Every boring was calculated.
+    1  At least one boring failed (its error is in the output).
+    2  Invalid arguments or no borings found.
+
+Example:
+    $ calculus-core batch sondagens/ --cotas 8 10 12 --workers 4 \\
+        --saida resultados.csv
+"""
+
+import argparse
+import csv
+import functools
+import json
+import os
+import sys
+import unicodedata
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+from calculus_core.adapters.repository import ARCHIVE_EXTENSION
+from calculus_core.domain.model import PerfilSPT
+from calculus_core.service_layer.services import (
+    COLUNAS_RESULTADO,
+    iterar_obra,
+)
+
+EXTENSAO_CSV = '.csv'
+EXTENSOES_MANIFESTO = ('.lst', '.manifest')
+
+# Accepted header names (normalized) of each column
+ALIASES_COLUNAS = {
+    'profundidade': (
+        'profundidade',
+        'profundidade_m',
+        'prof',
+        'prof_m',
+        'z',
+        'depth',
+    ),
+    'n_spt': ('n_spt', 'nspt', 'spt', 'n', 'golpes'),
+    'solo': ('solo', 'tipo_solo', 'tipo_de_solo', 'soil'),
+    'espessura': ('espessura', 'espessura_m', 'espessura_camada'),
+    'qc': ('qc', 'qc_mpa'),
+    'fs': ('fs', 'fs_kpa'),
+}
+
+CODIGO_SUCESSO = 0
+CODIGO_FALHA_PARCIAL = 1
+CODIGO_USO = 2
+
+# =============================================================================
+# INPUT
+# =============================================================================
+
+
+def _normalizar(nome: str) -> str:
+    """'Profundidade (m)' -> 'profundidade_m'."""
+    ascii_ = (
+        unicodedata.normalize('NFKD', nome)
+        .encode('ascii', 'ignore')
+        .decode()
+        .lower()
+    )
+    return '_'.join(''.join(c if c.isalnum() else ' ' for c in ascii_).split())
+
+
+def _indices_colunas(cabecalho: list[str]) -> dict[str, int]:
+    normalizados = [_normalizar(nome) for nome in cabecalho]
+    indices = {}
+    for coluna, aliases in ALIASES_COLUNAS.items():
+        for alias in aliases:
+            if alias in normalizados:
+                indices[coluna] = normalizados.index(alias)
+                break
+    return indices
+
+
+def _numero(texto: str, decimal_virgula: bool) -> float:
+    texto = texto.strip()
+    if decimal_virgula:
+        texto = texto.replace(',', '.')
+    return float(texto)
+
+
+def ler_sondagem_csv(
+    caminho: str | os.PathLike,
+    *,
+    correlacao: str = 'robertson_1983',
+    intervalo: float = 1.0,
+    solo_padrao: str | None = None,
+) -> PerfilSPT:
+    """
+    Read one boring from a CSV file, converting CPT soundings to SPT.
+
+    Files with ``qc`` and ``fs`` columns are CPT; files with an N_SPT
+    column are SPT. Comma or semicolon separators are accepted; with
+    semicolons, decimals may use a comma. Rows are streamed into the
+    profile builder (or the CPT converter) without keeping the file.
+
+    Args:
+        caminho: CSV file; its stem names the boring.
+        correlacao: CPT to SPT correlation.
+        intervalo: SPT sampling interval for CPT conversion (m).
+        solo_padrao: Soil for SPT files without a soil column.
+
+    Returns:
+        The SPT profile.
+
+    Raises:
+        ValueError: If the columns are not recognized or a row is invalid.
+    """
+    from calculus_core.domain.soil_investigation import CPTtoSPTConverter
+
+    caminho = Path(caminho)
+    nome = caminho.stem
+    with open(caminho, newline='', encoding='utf-8-sig') as arquivo:
+        primeira = arquivo.readline()
+        delimitador = ';' if primeira.count(';') > primeira.count(',') else ','
+        decimal_virgula = delimitador == ';'
+        cabecalho = next(csv.reader([primeira], delimiter=delimitador), [])
+        colunas = _indices_colunas(cabecalho)
+        leitor = csv.reader(arquivo, delimiter=delimitador)
+
+        def valores(*nomes: str) -> Iterator[list[float]]:
+            for numero, linha in enumerate(leitor, start=2):
+                if not any(campo.strip() for campo in linha):
+                    continue
+                try:
+                    yield [
+                        _numero(linha[colunas[n]], decimal_virgula)
+                        for n in nomes
+                    ]
+                except (IndexError, ValueError):
+                    raise ValueError(
+                        f'{caminho.name}, linha {numero}: valor inválido.'
+                    ) from None
+
+        if 'qc' in colunas and 'fs' in colunas and 'profundidade' in colunas:
+            conversor = CPTtoSPTConverter(nome_correlacao=correlacao)
+            return conversor.convert(
+                (tuple(v) for v in valores('profundidade', 'qc', 'fs')),
+                intervalo=intervalo,
+                nome_sondagem=nome,
+            )
+
+        if 'n_spt' not in colunas or 'profundidade' not in colunas:
+            raise ValueError(
+                f'{caminho.name}: colunas não reconhecidas '
+                f'(esperado profundidade e n_spt, ou profundidade, qc e fs).'
+            )
+        if 'solo' not in colunas and solo_padrao is None:
+            raise ValueError(
+                f'{caminho.name}: coluna de solo ausente (use --solo-padrao).'
+            )
+
+        def linhas_spt() -> Iterator[tuple]:
+            for numero, linha in enumerate(leitor, start=2):
+                if not any(campo.strip() for campo in linha):
+                    continue
+                try:
+                    espessura = (
+                        _numero(linha[colunas['espessura']], decimal_virgula)
+                        if 'espessura' in colunas
+                        and linha[colunas['espessura']].strip()
+                        else None
+                    )
+                    yield (
+                        _numero(
+                            linha[colunas['profundidade']], decimal_virgula
+                        ),
+                        int(_numero(linha[colunas['n_spt']], decimal_virgula)),
+                        linha[colunas['solo']].strip()
+                        if 'solo' in colunas
+                        else solo_padrao,
+                        espessura,
+                    )
+                except (IndexError, ValueError):
+                    raise ValueError(
+                        f'{caminho.name}, linha {numero}: valor inválido.'
+                    ) from None
+
+        return (
+            PerfilSPT.builder(nome_sondagem=nome)
+            .estender(linhas_spt())
+            .construir()
+        )
+
+
+@dataclass(frozen=True)
+class CarregadorCSV:
+    """Picklable loader of a CSV boring (runs in the worker)."""
+
+    caminho: str
+    correlacao: str = 'robertson_1983'
+    intervalo: float = 1.0
+    solo_padrao: str | None = None
+
+    def __call__(self) -> PerfilSPT:
+        return ler_sondagem_csv(
+            self.caminho,
+            correlacao=self.correlacao,
+            intervalo=self.intervalo,
+            solo_padrao=self.solo_padrao,
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _abrir_arquivo_perfis(caminho: str) -> Any:
+    from calculus_core.adapters.repository import ProfileArchive
+
+    return ProfileArchive(caminho)
+
+
+@dataclass(frozen=True)
+class CarregadorArquivoPerfis:
+    """Picklable loader of one boring of a profile archive."""
+
+    caminho: str
+    nome: str
+
+    def __call__(self) -> PerfilSPT:
+        return _abrir_arquivo_perfis(self.caminho).get(self.nome)
+
+
+def listar_sondagens(
+    entradas: list[str],
+    *,
+    correlacao: str = 'robertson_1983',
+    intervalo: float = 1.0,
+    solo_padrao: str | None = None,
+) -> Iterator[tuple[str, Any]]:
+    """
+    Enumerate the borings of files, directories and manifests lazily.
+
+    Args:
+        entradas: Paths to CSV files, profile archives, directories or
+            manifests.
+        correlacao: CPT to SPT correlation for CPT files.
+        intervalo: SPT sampling interval for CPT conversion (m).
+        solo_padrao: Soil for SPT files without a soil column.
+
+    Yields:
+        (boring name, loader) pairs.
+
+    Raises:
+        ValueError: If a path does not exist.
+    """
+    opcoes = {
+        'correlacao': correlacao,
+        'intervalo': intervalo,
+        'solo_padrao': solo_padrao,
+    }
+    for entrada in entradas:
+        caminho = Path(entrada)
+        if caminho.is_dir():
+            arquivos = sorted(
+                p
+                for p in caminho.iterdir()
+                if p.is_file()
+                and p.suffix.lower() in (EXTENSAO_CSV, ARCHIVE_EXTENSION)
+            )
+            yield from listar_sondagens([str(p) for p in arquivos], **opcoes)
+        elif not caminho.is_file():
+            raise ValueError(f'Arquivo ou diretório não encontrado: {entrada}')
+        elif caminho.suffix.lower() == ARCHIVE_EXTENSION:
+            for nome in _abrir_arquivo_perfis(str(caminho)).names():
+                yield nome, CarregadorArquivoPerfis(str(caminho), nome)
+        elif caminho.suffix.lower() in EXTENSOES_MANIFESTO:
+            with open(caminho, encoding='utf-8') as manifesto:
+                for linha in manifesto:
+                    item = linha.split('#', 1)[0].strip()
+                    if item:
+                        yield from listar_sondagens(
+                            [str(caminho.parent / item)], **opcoes
+                        )
+        else:
+            yield caminho.stem, CarregadorCSV(str(caminho), **opcoes)
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+
+class EscritorCSV:
+    """Write result rows as CSV, one boring at a time."""
+
+    def __init__(self, arquivo: IO[str]):
+        self._arquivo = arquivo
+        self._escritor = csv.DictWriter(
+            arquivo, fieldnames=('sondagem', *COLUNAS_RESULTADO)
+        )
+        self._escritor.writeheader()
+
+    def escrever(self, linhas: list[dict]) -> None:
+        self._escritor.writerows(linhas)
+        self._arquivo.flush()
+
+
+class EscritorJSONL:
+    """Write result rows as JSON Lines, one boring at a time."""
+
+    def __init__(self, arquivo: IO[str]):
+        self._arquivo = arquivo
+
+    def escrever(self, linhas: list[dict]) -> None:
+        for linha in linhas:
+            self._arquivo.write(json.dumps(linha, ensure_ascii=False))
+            self._arquivo.write('\n')
+        self._arquivo.flush()
+
+
+ESCRITORES = {'csv': EscritorCSV, 'jsonl': EscritorJSONL}
+
+
+# =============================================================================
+# COMMAND
+# =============================================================================
+
+
+def configurar_argumentos(parser: argparse.ArgumentParser) -> None:
+    """Add the ``batch`` options to a parser."""
+    parser.add_argument(
+        'entradas',
+        nargs='+',
+        help=(
+            f'Arquivos CSV/{ARCHIVE_EXTENSION}, diretórios ou manifestos '
+            '(.lst).'
+        ),
+    )
+    parser.add_argument(
+        '--cotas',
+        nargs='+',
+        type=float,
+        required=True,
+        help='Cotas de assentamento (m).',
+    )
+    parser.add_argument(
+        '--metodos', nargs='+', help='Métodos (padrão: todos).'
+    )
+    parser.add_argument(
+        '--estacas', nargs='+', help='Tipos de estaca (padrão: todos).'
+    )
+    parser.add_argument(
+        '--diametro',
+        type=float,
+        default=0.40,
+        help='Diâmetro de referência para escolher o perfil do catálogo.',
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Processos de cálculo (padrão: 1, sequencial).',
+    )
+    parser.add_argument(
+        '--saida', default='-', help='Arquivo de saída (padrão: stdout).'
+    )
+    parser.add_argument(
+        '--formato',
+        choices=sorted(ESCRITORES),
+        help='Formato de saída (padrão: pela extensão de --saida, ou csv).',
+    )
+    parser.add_argument(
+        '--correlacao',
+        default='robertson_1983',
+        help='Correlação CPT-SPT para arquivos CPT.',
+    )
+    parser.add_argument(
+        '--intervalo',
+        type=float,
+        default=1.0,
+        help='Intervalo (m) das camadas SPT geradas a partir de CPT.',
+    )
+    parser.add_argument(
+        '--solo-padrao', help='Solo para arquivos SPT sem coluna de solo.'
+    )
+
+
+def executar(args: argparse.Namespace) -> int:
+    """
+    Run a batch from parsed arguments.
+
+    Args:
+        args: Options added by ``configurar_argumentos``.
+
+    Returns:
+        Exit status (see the module docstring).
+    """
+    if args.workers < 1:
+        print('Erro: --workers deve ser positivo.', file=sys.stderr)
+        return CODIGO_USO
+    for entrada in args.entradas:
+        if not os.path.exists(entrada):
+            print(
+                f'Erro: arquivo ou diretório não encontrado: {entrada}',
+                file=sys.stderr,
+            )
+            return CODIGO_USO
+    formato = args.formato or (
+        'jsonl'
+        if args.saida.lower().endswith(('.jsonl', '.ndjson'))
+        else 'csv'
+    )
+
+    sondagens = listar_sondagens(
+        args.entradas,
+        correlacao=args.correlacao,
+        intervalo=args.intervalo,
+        solo_padrao=args.solo_padrao,
+    )
+    total = falhas = 0
+    saida = (
+        sys.stdout
+        if args.saida == '-'
+        else open(args.saida, 'w', newline='', encoding='utf-8')
+    )
+    try:
+        escritor = ESCRITORES[formato](saida)
+        for resultado in iterar_obra(
+            sondagens,
+            args.cotas,
+            args.metodos,
+            args.estacas,
+            args.diametro,
+            max_workers=args.workers,
+        ):
+            total += 1
+            if not resultado.sucesso:
+                falhas += 1
+                print(
+                    f'Erro em {resultado.sondagem}: {resultado.erro}',
+                    file=sys.stderr,
+                )
+            escritor.escrever(resultado.serializar())
+    except ValueError as e:
+        # Unknown method, missing input path, ...
+        print(f'Erro: {e}', file=sys.stderr)
+        return CODIGO_USO
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    if total == 0:
+        print('Erro: nenhuma sondagem encontrada.', file=sys.stderr)
+        return CODIGO_USO
+    print(
+        f'{total} sondagens processadas, {falhas} com erro.', file=sys.stderr
+    )
+    return CODIGO_FALHA_PARCIAL if falhas else CODIGO_SUCESSO
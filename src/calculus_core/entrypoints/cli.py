@@ -2,9 +2,16 @@
 CLI Entry Point
 
 Command-line interface for the calculus-core package.
-Launches the Streamlit web application.
+
+``calculus-app`` launches the Streamlit web application. ``calculus-core``
+groups the subcommands:
+
+    calculus-core app       Streamlit web application.
+    calculus-core batch     Headless batch over files of borings.
+    calculus-core serve     HTTP/JSON server.
 """
 
+import argparse
 import os
 import sys
 
@@ -34,5 +41,35 @@ def run_app():
     sys.exit(stcli.main())
 
 
+def main(argv: list[str] | None = None) -> None:
+    """Run a ``calculus-core`` subcommand."""
+    from calculus_core.entrypoints import batch, server
+
+    parser = argparse.ArgumentParser(
+        prog='calculus-core',
+        description='Cálculo de capacidade de carga de estacas.',
+    )
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+    subcomandos.add_parser('app', help='Interface web (Streamlit).')
+    batch.configurar_argumentos(
+        subcomandos.add_parser(
+            'batch',
+            help='Cálculo em lote de arquivos de sondagens.',
+            description='Cálculo em lote de arquivos de sondagens.',
+        )
+    )
+    server.configurar_argumentos(
+        subcomandos.add_parser('serve', help='Servidor HTTP/JSON.')
+    )
+    args = parser.parse_args(argv)
+
+    if args.comando == 'app':
+        run_app()
+    elif args.comando == 'batch':
+        sys.exit(batch.executar(args))
+    else:
+        sys.exit(server.executar(args))
+
+
 if __name__ == '__main__':
-    run_app()
+    main()
@@ -0,0 +1,448 @@
+"""
+HTTP Entry Point
+
+Local HTTP/JSON server for machine-to-machine access, built on the
+standard library (``calculus-serve``).
+
+Connections are kept alive (HTTP/1.1) and each one is served by its own
+thread. Calculation requests go through a ``CalculationCoalescer``, so
+concurrent requests on the same boring are evaluated together.
+
+Endpoints:
+    GET  /saude                 Liveness check.
+    GET  /metodos               Registered calculation methods.
+    GET  /catalogos             Summary of every pile catalog.
+    GET  /catalogos/<tipo>      Profile names of one pile type.
+    POST /calcular              One method, one pile (one cota or all).
+    POST /lote                  Every method and pile type at one cota.
+    POST /obra                  The same for several borings.
+
+A boring (``perfil``) is either an object with the columns
+``profundidades``, ``n_spt`` and ``solos`` (optionally ``espessuras``,
+``nome_sondagem``, ``confiavel``) or, when the server was started with
+``--arquivo``, the name of a boring in that profile archive.
+
+A pile (``estaca``) is either ``{"tipo", "perfil"}`` for a catalog
+profile or ``{"tipo", "processo_construcao", "formato",
+"secao_transversal"}``.
+
+Example:
+    $ calculus-serve --porta 8080
+    $ curl -X POST localhost:8080/calcular -d '{"metodo": ...}'
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Callable
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import unquote
+
+from calculus_core.adapters.repository import ARCHIVE_EXTENSION
+from calculus_core.domain.model import Estaca, PerfilSPT
+from calculus_core.service_layer.coalescing import CalculationCoalescer
+from calculus_core.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+TAMANHO_MAXIMO_CORPO = 16 * 1024 * 1024
+
+# =============================================================================
+# REQUEST PARSING
+# =============================================================================
+
+
+class ErroRequisicao(ValueError):
+    """Invalid request; answered with HTTP 400."""
+
+
+def _campo(dados: dict, nome: str) -> Any:
+    if nome not in dados:
+        raise ErroRequisicao(f'Campo obrigatório ausente: {nome}')
+    return dados[nome]
+
+
+def _numero(valor: Any, nome: str) -> float:
+    # bool is an int subclass, but true/false are not depths
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+        raise ErroRequisicao(f'{nome} deve ser um número.')
+    return valor
+
+
+def _texto(valor: Any, nome: str) -> str:
+    if not isinstance(valor, str):
+        raise ErroRequisicao(f'{nome} deve ser um texto.')
+    return valor
+
+
+def _lista_textos(valor: Any, nome: str) -> list[str] | None:
+    if valor is None:
+        return None
+    if not isinstance(valor, list) or not all(
+        isinstance(item, str) for item in valor
+    ):
+        raise ErroRequisicao(f'{nome} deve ser uma lista de textos.')
+    return valor
+
+
+def _cotas(valor: Any) -> float | list[float]:
+    if isinstance(valor, list):
+        return [_numero(cota, 'cotas') for cota in valor]
+    return _numero(valor, 'cotas')
+
+
+def ler_perfil(dados: Any, arquivo: Any = None) -> PerfilSPT:
+    """
+    Build an SPT profile from its JSON form.
+
+    Args:
+        dados: Column object, or a boring name when ``arquivo`` is set.
+        arquivo: Optional ProfileArchive to look boring names up in.
+
+    Returns:
+        The profile.
+
+    Raises:
+        ValueError: If the profile is malformed or unknown.
+    """
+    if isinstance(dados, str):
+        if arquivo is None:
+            raise ErroRequisicao(
+                'Servidor iniciado sem arquivo de perfis; '
+                'envie as colunas da sondagem.'
+            )
+        perfil = arquivo.get(dados)
+        if not isinstance(perfil, PerfilSPT):
+            raise ErroRequisicao(f'Sondagem {dados} não é um perfil SPT.')
+        return perfil
+    if not isinstance(dados, dict):
+        raise ErroRequisicao('Perfil deve ser um objeto ou um nome.')
+
+    atributos = {
+        nome: dados[nome]
+        for nome in ('nome_sondagem', 'confiavel')
+        if nome in dados
+    }
+    try:
+        return PerfilSPT.from_arrays(
+            _campo(dados, 'profundidades'),
+            _campo(dados, 'n_spt'),
+            _campo(dados, 'solos'),
+            dados.get('espessuras'),
+            **atributos,
+        )
+    except (TypeError, ValueError) as e:
+        raise ErroRequisicao(f'Perfil inválido: {e}') from None
+
+
+def ler_estaca(dados: Any) -> Estaca:
+    """
+    Build a prototype pile from its JSON form.
+
+    Args:
+        dados: Catalog reference or explicit geometry.
+
+    Returns:
+        The pile (at cota 1; requests give the cota separately).
+
+    Raises:
+        ErroRequisicao: If the pile is malformed or unknown.
+    """
+    from calculus_core.domain.pile_types import EstacaFactory
+
+    if not isinstance(dados, dict):
+        raise ErroRequisicao('Estaca deve ser um objeto.')
+    try:
+        if 'perfil' in dados:
+            return EstacaFactory.criar_de_catalogo(
+                _campo(dados, 'tipo'), dados['perfil'], 1
+            )
+        return Estaca(
+            tipo=_campo(dados, 'tipo'),
+            processo_construcao=_campo(dados, 'processo_construcao'),
+            formato=_campo(dados, 'formato'),
+            secao_transversal=_campo(dados, 'secao_transversal'),
+            cota_assentamento=1,
+        )
+    except ErroRequisicao:
+        raise
+    except (KeyError, TypeError, ValueError) as e:
+        raise ErroRequisicao(f'Estaca inválida: {e}') from None
+
+
+# =============================================================================
+# ROUTES
+# =============================================================================
+
+
+def _saude(servidor: 'CalculusServer', corpo: Any) -> Any:
+    return {'status': 'ok'}
+
+
+def _metodos(servidor: 'CalculusServer', corpo: Any) -> Any:
+    from calculus_core.domain.method_registry import CalculationMethodRegistry
+
+    return [
+        {
+            'id': info.id,
+            'nome': info.name,
+            'versao': info.version,
+            'descricao': info.description,
+            'referencia': info.reference,
+            'autores': info.authors,
+            'tipos_estaca': info.supported_pile_types,
+            'tipos_solo': info.supported_soil_types,
+        }
+        for info in CalculationMethodRegistry.list_all()
+    ]
+
+
+def _catalogos(servidor: 'CalculusServer', corpo: Any) -> Any:
+    from calculus_core.domain.pile_catalogs import resumo_catalogos
+
+    return resumo_catalogos()
+
+
+def _catalogo(servidor: 'CalculusServer', corpo: Any, tipo: str) -> Any:
+    from calculus_core.domain.pile_catalogs import listar_perfis_por_tipo
+
+    perfis = listar_perfis_por_tipo(tipo)
+    if not perfis:
+        raise ErroRequisicao(f'Tipo de estaca sem catálogo: {tipo}')
+    return perfis
+
+
+def _calcular(servidor: 'CalculusServer', corpo: Any) -> Any:
+    perfil = ler_perfil(_campo(corpo, 'perfil'), servidor.arquivo)
+    estaca = ler_estaca(_campo(corpo, 'estaca'))
+    metodo = _texto(_campo(corpo, 'metodo'), 'metodo')
+    cota = corpo.get('cota')
+    if cota is not None:
+        cota = _numero(cota, 'cota')
+    resultado = servidor.coalescer.calcular(perfil, metodo, estaca, cota)
+    if cota is None:
+        return resultado.to_dicts()
+    return resultado.to_dict()
+
+
+def _lote(servidor: 'CalculusServer', corpo: Any) -> Any:
+    from calculus_core.service_layer.services import (
+        calcular_todos_metodos_todas_estacas,
+        serializar_resultados,
+    )
+
+    perfil = ler_perfil(_campo(corpo, 'perfil'), servidor.arquivo)
+    return serializar_resultados(
+        calcular_todos_metodos_todas_estacas(
+            perfil,
+            _numero(_campo(corpo, 'cota'), 'cota'),
+            _lista_textos(corpo.get('metodos'), 'metodos'),
+            _lista_textos(corpo.get('tipos_estaca'), 'tipos_estaca'),
+            _numero(
+                corpo.get('diametro_referencia', 0.40), 'diametro_referencia'
+            ),
+        )
+    )
+
+
+def _obra(servidor: 'CalculusServer', corpo: Any) -> Any:
+    from calculus_core.service_layer.services import calcular_obra
+
+    sondagens = _campo(corpo, 'sondagens')
+    if not isinstance(sondagens, list):
+        raise ErroRequisicao('sondagens deve ser uma lista.')
+    return calcular_obra(
+        [ler_perfil(dados, servidor.arquivo) for dados in sondagens],
+        _cotas(_campo(corpo, 'cotas')),
+        _lista_textos(corpo.get('metodos'), 'metodos'),
+        _lista_textos(corpo.get('tipos_estaca'), 'tipos_estaca'),
+        _numero(corpo.get('diametro_referencia', 0.40), 'diametro_referencia'),
+    ).serializar()
+
+
+Rota = Callable[..., Any]
+
+ROTAS_GET: dict[str, Rota] = {
+    '/saude': _saude,
+    '/metodos': _metodos,
+    '/catalogos': _catalogos,
+}
+
+ROTAS_POST: dict[str, Rota] = {
+    '/calcular': _calcular,
+    '/lote': _lote,
+    '/obra': _obra,
+}
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+
+class CalculusRequestHandler(BaseHTTPRequestHandler):
+    """JSON request handler with persistent connections."""
+
+    protocol_version = 'HTTP/1.1'
+    server: 'CalculusServer'
+
+    def do_GET(self) -> None:
+        caminho = self.path.split('?', 1)[0].rstrip('/') or '/'
+        rota = ROTAS_GET.get(caminho)
+        argumentos: tuple = ()
+        if rota is None and caminho.startswith('/catalogos/'):
+            rota = _catalogo
+            argumentos = (unquote(caminho.removeprefix('/catalogos/')),)
+        self._despachar(rota, None, argumentos)
+
+    def do_POST(self) -> None:
+        caminho = self.path.split('?', 1)[0].rstrip('/')
+        try:
+            corpo = self._ler_corpo()
+        except ErroRequisicao as e:
+            # The body may be unread; do not reuse the connection
+            self.close_connection = True
+            self._responder(HTTPStatus.BAD_REQUEST, {'erro': str(e)})
+            return
+        self._despachar(ROTAS_POST.get(caminho), corpo)
+
+    def _ler_corpo(self) -> Any:
+        try:
+            tamanho = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            raise ErroRequisicao('Content-Length inválido.') from None
+        if tamanho < 0:
+            # read(-1) would block until the client closes the connection
+            raise ErroRequisicao('Content-Length inválido.')
+        if tamanho > TAMANHO_MAXIMO_CORPO:
+            raise ErroRequisicao('Corpo da requisição muito grande.')
+        try:
+            corpo = json.loads(self.rfile.read(tamanho) or b'{}')
+        except ValueError as e:
+            raise ErroRequisicao(f'JSON inválido: {e}') from None
+        if not isinstance(corpo, dict):
+            raise ErroRequisicao('O corpo deve ser um objeto JSON.')
+        return corpo
+
+    def _despachar(
+        self, rota: Rota | None, corpo: Any, argumentos: tuple = ()
+    ) -> None:
+        if rota is None:
+            self._responder(
+                HTTPStatus.NOT_FOUND,
+                {'erro': f'Rota não encontrada: {self.path}'},
+            )
+            return
+        try:
+            resposta = rota(self.server, corpo, *argumentos)
+        except ValueError as e:
+            # Domain validation errors (and ErroRequisicao)
+            self._responder(HTTPStatus.BAD_REQUEST, {'erro': str(e)})
+        except Exception:
+            logger.exception('Erro ao processar %s', self.path)
+            self._responder(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {'erro': 'Erro interno.'}
+            )
+        else:
+            self._responder(HTTPStatus.OK, resposta)
+
+    def _responder(self, status: HTTPStatus, dados: Any) -> None:
+        conteudo = json.dumps(dados, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(conteudo)))
+        self.end_headers()
+        self.wfile.write(conteudo)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug('%s - %s', self.address_string(), format % args)
+
+
+class CalculusServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server sharing one coalescer between connections.
+
+    Attributes:
+        coalescer: Groups concurrent calculations by boring.
+        arquivo: Optional ProfileArchive for requests that name borings.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        endereco: tuple[str, int],
+        *,
+        janela: float = 0.002,
+        arquivo: Any = None,
+    ):
+        """
+        Bind the server.
+
+        Args:
+            endereco: (host, port); port 0 picks a free one.
+            janela: Coalescing window in seconds.
+            arquivo: Optional ProfileArchive.
+        """
+        super().__init__(endereco, CalculusRequestHandler)
+        self.coalescer = CalculationCoalescer(janela)
+        self.arquivo = arquivo
+
+
+def configurar_argumentos(parser: argparse.ArgumentParser) -> None:
+    """Add the server options to a parser."""
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8000)
+    parser.add_argument(
+        '--janela',
+        type=float,
+        default=0.002,
+        help='Janela de agrupamento de requisições, em segundos.',
+    )
+    parser.add_argument(
+        '--arquivo',
+        help=(
+            f'Arquivo de perfis ({ARCHIVE_EXTENSION}) para requisições '
+            'por nome.'
+        ),
+    )
+
+
+def executar(args: argparse.Namespace) -> int:
+    """Serve until interrupted, from parsed arguments."""
+    arquivo = None
+    if args.arquivo:
+        from calculus_core.adapters.repository import ProfileArchive
+
+        arquivo = ProfileArchive(args.arquivo)
+
+    servidor = CalculusServer(
+        (args.host, args.porta), janela=args.janela, arquivo=arquivo
+    )
+    host, porta = servidor.server_address[:2]
+    print(f'calculus-serve em http://{host}:{porta}', file=sys.stderr)
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        if arquivo is not None:
+            arquivo.close()
+    return 0
+
+
+def run_server(argv: list[str] | None = None) -> None:
+    """Run the HTTP server until interrupted (``calculus-serve``)."""
+    parser = argparse.ArgumentParser(
+        prog='calculus-serve',
+        description='Servidor HTTP/JSON de cálculo de capacidade de carga.',
+    )
+    configurar_argumentos(parser)
+    sys.exit(executar(parser.parse_args(argv)))
+
+
+if __name__ == '__main__':
+    run_server()
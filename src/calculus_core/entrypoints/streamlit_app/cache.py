@@ -0,0 +1,232 @@
+"""
+Cached resources and calculations for the Calculus-Core Streamlit App.
+
+Streamlit reruns a page script on every interaction, once per user
+session. Calculators, method metadata and catalogs are shared resources
+(``st.cache_resource``); calculation results are cached data
+(``st.cache_data``) keyed by the profile fingerprint
+(``PerfilSPT.impressao_digital``), the pile and method parameters and the
+registry version. Calculators and method metadata are keyed by the
+registry version too. Identical work is then done once per server
+instead of once per rerun and per user.
+
+Profiles are passed to the cached functions as ``_perfil``, which
+Streamlit does not hash; the fingerprint stands in for them in the key.
+"""
+
+import streamlit as st
+
+from calculus_core.bootstrap import get_all_calculators
+from calculus_core.domain.calculation import MetodoCalculo
+from calculus_core.domain.method_registry import (
+    CalculationMethodInfo,
+    CalculationMethodRegistry,
+)
+from calculus_core.domain.model import PerfilSPT
+from calculus_core.domain.pile_types import EstacaFactory
+from calculus_core.service_layer import (
+    CalculationRequest,
+    CalculationService,
+    calcular_todos_metodos_todas_estacas,
+    calcular_todos_metodos_uma_estaca,
+    calcular_um_metodo_todas_estacas,
+    serializar_resultados,
+)
+
+# Cached calculations kept per function (least recently used dropped)
+MAX_RESULTADOS = 256
+
+# =============================================================================
+# RESOURCES (shared objects)
+# =============================================================================
+
+
+def obter_calculadoras() -> dict[str, MetodoCalculo]:
+    """Calculators by display name, shared by every session."""
+    return _calculadoras(CalculationMethodRegistry.version())
+
+
+def obter_metodos() -> list[CalculationMethodInfo]:
+    """Metadata of the registered methods."""
+    return _metodos(CalculationMethodRegistry.version())
+
+
+# Keyed by the registry version (only the current one is kept), so a
+# method registered again is picked up on the next rerun
+
+
+@st.cache_resource(max_entries=1)
+def _calculadoras(versao: int) -> dict[str, MetodoCalculo]:
+    return get_all_calculators()
+
+
+@st.cache_resource(max_entries=1)
+def _metodos(versao: int) -> list[CalculationMethodInfo]:
+    return CalculationMethodRegistry.list_all()
+
+
+@st.cache_data
+def listar_tipos_estaca() -> list[str]:
+    """Pile types with a catalog."""
+    return EstacaFactory.listar_tipos_estaca()
+
+
+@st.cache_data
+def listar_perfis_estaca(tipo_estaca: str) -> list[str]:
+    """Catalog profiles of a pile type."""
+    return EstacaFactory.listar_perfis_por_tipo(tipo_estaca)
+
+
+@st.cache_data
+def obter_info_perfil(tipo_estaca: str, nome_perfil: str) -> dict:
+    """Details of a catalog profile."""
+    return EstacaFactory.obter_info_perfil(tipo_estaca, nome_perfil)
+
+
+# =============================================================================
+# CALCULATIONS (cached by profile fingerprint)
+# =============================================================================
+
+
+def calcular_curva(
+    perfil: PerfilSPT, metodo: str, tipo_estaca: str, nome_perfil: str
+) -> tuple[dict[str, list] | None, str | None]:
+    """
+    Capacity curve of a catalog pile for one method.
+
+    Args:
+        perfil: Active SPT profile.
+        metodo: Method display name (key of ``obter_calculadoras``).
+        tipo_estaca: Pile type.
+        nome_perfil: Catalog profile name.
+
+    Returns:
+        (curve columns, None) on success, or (None, error message).
+    """
+    return _curva(
+        perfil.impressao_digital,
+        perfil,
+        metodo,
+        tipo_estaca,
+        nome_perfil,
+        CalculationMethodRegistry.version(),
+    )
+
+
+def comparar_metodos(
+    perfil: PerfilSPT, tipo_estaca: str, nome_perfil: str, cota: float
+) -> list[dict]:
+    """Serialized ``calcular_todos_metodos_uma_estaca`` results."""
+    return _comparar_metodos(
+        perfil.impressao_digital,
+        perfil,
+        tipo_estaca,
+        nome_perfil,
+        cota,
+        CalculationMethodRegistry.version(),
+    )
+
+
+def comparar_estacas(
+    perfil: PerfilSPT, metodo_id: str, cota: float, diametro: float
+) -> list[dict]:
+    """Serialized ``calcular_um_metodo_todas_estacas`` results."""
+    return _comparar_estacas(
+        perfil.impressao_digital,
+        perfil,
+        metodo_id,
+        cota,
+        diametro,
+        CalculationMethodRegistry.version(),
+    )
+
+
+def matriz_global(
+    perfil: PerfilSPT, cota: float, diametro: float
+) -> list[dict]:
+    """Serialized ``calcular_todos_metodos_todas_estacas`` results."""
+    return _matriz_global(
+        perfil.impressao_digital,
+        perfil,
+        cota,
+        diametro,
+        CalculationMethodRegistry.version(),
+    )
+
+
+# The ``versao`` arguments only key the caches: results change when a
+# method is registered again.
+
+
+@st.cache_data(max_entries=MAX_RESULTADOS, show_spinner=False)
+def _curva(
+    impressao: str,
+    _perfil: PerfilSPT,
+    metodo: str,
+    tipo_estaca: str,
+    nome_perfil: str,
+    versao: int,
+) -> tuple[dict[str, list] | None, str | None]:
+    estaca = EstacaFactory.criar_de_catalogo(
+        tipo_estaca, nome_perfil, cota_assentamento=1
+    )
+    request = CalculationRequest(
+        perfil_spt=_perfil,
+        tipo_estaca=estaca.tipo,
+        processo_construcao=estaca.processo_construcao,
+        formato=estaca.formato,
+        secao_transversal=estaca.secao_transversal,
+        cota_assentamento=None,  # Calculate all depths
+        estaca_prototype=estaca,  # Use prototype for catalog piles
+    )
+    service = CalculationService(_calculadoras(versao)[metodo])
+    result = service.calculate_all_depths(request)
+    if not result.success:
+        return None, result.error
+    return result.resultados.to_dict_of_lists(), None
+
+
+@st.cache_data(max_entries=MAX_RESULTADOS, show_spinner=False)
+def _comparar_metodos(
+    impressao: str,
+    _perfil: PerfilSPT,
+    tipo_estaca: str,
+    nome_perfil: str,
+    cota: float,
+    versao: int,
+) -> list[dict]:
+    estaca = EstacaFactory.criar_de_catalogo(tipo_estaca, nome_perfil, cota)
+    return serializar_resultados(
+        calcular_todos_metodos_uma_estaca(_perfil, estaca)
+    )
+
+
+@st.cache_data(max_entries=MAX_RESULTADOS, show_spinner=False)
+def _comparar_estacas(
+    impressao: str,
+    _perfil: PerfilSPT,
+    metodo_id: str,
+    cota: float,
+    diametro: float,
+    versao: int,
+) -> list[dict]:
+    return serializar_resultados(
+        calcular_um_metodo_todas_estacas(
+            _perfil, metodo_id, cota, diametro_referencia=diametro
+        )
+    )
+
+
+@st.cache_data(max_entries=MAX_RESULTADOS, show_spinner=False)
+def _matriz_global(
+    impressao: str,
+    _perfil: PerfilSPT,
+    cota: float,
+    diametro: float,
+    versao: int,
+) -> list[dict]:
+    return serializar_resultados(
+        calcular_todos_metodos_todas_estacas(
+            _perfil, cota, diametro_referencia=diametro
+        )
+    )
@@ -0,0 +1,329 @@
+"""
+Vectorized ingestion of SPT/CPT tables for the Calculus-Core Streamlit App.
+
+Uploaded CSV files and the manual editor arrive as pandas DataFrames.
+Instead of walking them with ``iterrows()`` (one Series, one dict lookup
+and one measurement object per row), each column is mapped, cast and
+validated in bulk, every invalid row is reported in the same pass, and
+the resulting arrays go straight into the bulk constructors
+(``PerfilSPT.from_arrays``, ``PerfilCPTColunar.from_arrays``).
+
+Example:
+    df = pd.read_csv(arquivo)
+    resultado = importar_cpt(df, 'prof', 'qc', 'fs', nome_sondagem='CPT-01')
+    if not resultado.sucesso:
+        for erro in resultado.erros:
+            print(erro)
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from calculus_core.domain.model import PerfilSPT
+from calculus_core.domain.soil_investigation import PerfilCPTColunar
+from calculus_core.entrypoints.streamlit_app.constants import (
+    SOLOS_VALIDOS_MAP,
+)
+
+
+@dataclass(frozen=True)
+class ErroLinha:
+    """
+    Invalid value found in a table row.
+
+    Attributes:
+        linha: 1-based position of the row in the table (header excluded).
+        coluna: Column holding the value.
+        mensagem: What is wrong with it.
+    """
+
+    linha: int
+    coluna: str
+    mensagem: str
+
+    def __str__(self) -> str:
+        return f'Linha {self.linha} ({self.coluna}): {self.mensagem}'
+
+
+@dataclass
+class ResultadoImportacao:
+    """
+    Outcome of importing a table.
+
+    Attributes:
+        perfil: Built profile, or None if any row is invalid.
+        erros: Every invalid value, ordered by row.
+    """
+
+    perfil: Any = None
+    erros: list[ErroLinha] = field(default_factory=list)
+
+    @property
+    def sucesso(self) -> bool:
+        """Whether the profile was built."""
+        return self.perfil is not None
+
+
+# =============================================================================
+# COLUMN HELPERS
+# =============================================================================
+
+
+def _coluna(df: pd.DataFrame, nome: str) -> pd.Series:
+    """Column of the table, with a clear error when it is missing."""
+    if nome not in df.columns:
+        raise ValueError(f'Coluna não encontrada: {nome}')
+    return df[nome]
+
+
+def _numerica(serie: pd.Series) -> pd.Series:
+    """Cast a column to float; unreadable values become NaN."""
+    if not is_numeric_dtype(serie):
+        # Decimal comma, as in spreadsheets exported with pt-BR locale
+        serie = serie.astype(str).str.strip().str.replace(',', '.')
+    return pd.to_numeric(serie, errors='coerce').astype(float)
+
+
+def _vazia(serie: pd.Series) -> np.ndarray:
+    """Mask of missing or blank cells."""
+    vazia = serie.isna()
+    if not is_numeric_dtype(serie):
+        vazia |= serie.astype(str).str.strip() == ''
+    return vazia.to_numpy()
+
+
+class _Validacao:
+    """Collects the invalid rows of each check, without a loop per row."""
+
+    def __init__(self, ignoradas: np.ndarray):
+        self._ignoradas = ignoradas
+        self._erros: list[tuple[int, int, ErroLinha]] = []
+        self._checagens = 0
+
+    def checar(
+        self,
+        invalidas: np.ndarray,
+        coluna: str,
+        mensagem: str,
+        valores: pd.Series | None = None,
+    ) -> None:
+        """
+        Record the rows failing a check.
+
+        Args:
+            invalidas: Mask of rows failing the check.
+            coluna: Column name reported in the errors.
+            mensagem: Error message (``{valor}`` is replaced by the cell).
+            valores: Original column, used to fill ``{valor}``.
+        """
+        invalidas = invalidas & ~self._ignoradas
+        self._checagens += 1
+        for posicao in np.flatnonzero(invalidas):
+            texto = mensagem
+            if valores is not None:
+                texto = mensagem.format(valor=valores.iloc[posicao])
+            self._erros.append(
+                (
+                    posicao,
+                    self._checagens,
+                    ErroLinha(int(posicao) + 1, coluna, texto),
+                )
+            )
+
+    def erros(self) -> list[ErroLinha]:
+        """Errors ordered by row, then by check."""
+        return [erro for *_, erro in sorted(self._erros, key=lambda e: e[:2])]
+
+
+def _checar_numero(
+    validacao: _Validacao,
+    original: pd.Series,
+    valores: pd.Series,
+    coluna: str,
+    mensagem_negativo: str,
+) -> np.ndarray:
+    """Report missing, unreadable and negative values of a column."""
+    vazia = _vazia(original)
+    nan = valores.isna().to_numpy()
+    validacao.checar(vazia, coluna, 'Valor ausente.')
+    validacao.checar(
+        nan & ~vazia, coluna, "Valor inválido: '{valor}'", original
+    )
+    validacao.checar(
+        ~nan & (valores < 0).to_numpy(), coluna, mensagem_negativo
+    )
+    return nan
+
+
+# =============================================================================
+# SPT
+# =============================================================================
+
+
+def importar_spt(
+    df: pd.DataFrame,
+    coluna_profundidade: str,
+    coluna_nspt: str,
+    coluna_solo: str | None = None,
+    *,
+    solo_padrao: str | None = None,
+    solo_desconhecido: str | None = None,
+    mapa_solos: Mapping[str, str] = SOLOS_VALIDOS_MAP,
+    nome_sondagem: str = 'SP-01',
+) -> ResultadoImportacao:
+    """
+    Build an SPT profile from a table, validating every row at once.
+
+    Soil names are the labels of ``mapa_solos`` or the domain identifiers
+    themselves. Blank rows (e.g. added but not filled in the editor) are
+    skipped.
+
+    Args:
+        df: Table with one measurement per row, in any order.
+        coluna_profundidade: Column with depths (m).
+        coluna_nspt: Column with SPT blow counts.
+        coluna_solo: Column with soil names, or None to use
+            ``solo_padrao`` for every row.
+        solo_padrao: Soil name applied when there is no soil column.
+        solo_desconhecido: Soil identifier for unknown names, or None to
+            report them as errors.
+        mapa_solos: Display name to soil identifier.
+        nome_sondagem: Boring name of the profile.
+
+    Returns:
+        ResultadoImportacao with the profile, or with the row errors.
+
+    Raises:
+        ValueError: If a column is missing or the table has no rows.
+    """
+    solos_conhecidos = {**{v: v for v in mapa_solos.values()}, **mapa_solos}
+    prof_original = _coluna(df, coluna_profundidade)
+    nspt_original = _coluna(df, coluna_nspt)
+    if coluna_solo is not None:
+        solo_original = _coluna(df, coluna_solo)
+    else:
+        if solo_padrao is None:
+            raise ValueError('Informe a coluna de solo ou o solo padrão.')
+        solo_original = pd.Series(solo_padrao, index=df.index, dtype=object)
+
+    vazias = _vazia(prof_original) & _vazia(nspt_original)
+    if coluna_solo is not None:
+        vazias &= _vazia(solo_original)
+    if vazias.all():
+        raise ValueError('Nenhuma medida encontrada na tabela.')
+
+    profundidades = _numerica(prof_original)
+    nspt = _numerica(nspt_original)
+    solos = solo_original.astype(str).str.strip().map(solos_conhecidos)
+    if solo_desconhecido is not None:
+        solos = solos.fillna(solo_desconhecido)
+
+    validacao = _Validacao(vazias)
+    _checar_numero(
+        validacao,
+        prof_original,
+        profundidades,
+        coluna_profundidade,
+        'Profundidade não pode ser negativa.',
+    )
+    nspt_nan = _checar_numero(
+        validacao,
+        nspt_original,
+        nspt,
+        coluna_nspt,
+        'N_SPT não pode ser negativo.',
+    )
+    validacao.checar(
+        ~nspt_nan & (nspt >= 0).to_numpy() & (nspt != nspt.round()).to_numpy(),
+        coluna_nspt,
+        'N_SPT deve ser inteiro: {valor}',
+        nspt_original,
+    )
+    validacao.checar(
+        solos.isna().to_numpy(),
+        coluna_solo or 'solo',
+        "Tipo de solo inválido: '{valor}'",
+        solo_original,
+    )
+
+    erros = validacao.erros()
+    if erros:
+        return ResultadoImportacao(erros=erros)
+
+    validas = ~vazias
+    perfil = PerfilSPT.from_arrays(
+        profundidades.to_numpy()[validas].tolist(),
+        nspt.to_numpy()[validas].astype(int).tolist(),
+        solos.to_numpy()[validas].tolist(),
+        nome_sondagem=nome_sondagem,
+    )
+    return ResultadoImportacao(perfil=perfil)
+
+
+# =============================================================================
+# CPT
+# =============================================================================
+
+
+def importar_cpt(
+    df: pd.DataFrame,
+    coluna_profundidade: str,
+    coluna_qc: str,
+    coluna_fs: str,
+    *,
+    nome_sondagem: str = 'CPT-01',
+) -> ResultadoImportacao:
+    """
+    Build a columnar CPT profile from a table, validating every row at once.
+
+    Blank rows are skipped. The readings go straight into the columns of
+    a ``PerfilCPTColunar``, without a MedidaCPT per row.
+
+    Args:
+        df: Table with one reading per row, in any order.
+        coluna_profundidade: Column with depths (m).
+        coluna_qc: Column with cone tip resistances (MPa).
+        coluna_fs: Column with sleeve frictions (kPa).
+        nome_sondagem: Boring name of the profile.
+
+    Returns:
+        ResultadoImportacao with the profile, or with the row errors.
+
+    Raises:
+        ValueError: If a column is missing or the table has no rows.
+    """
+    colunas = (coluna_profundidade, coluna_qc, coluna_fs)
+    originais = [_coluna(df, nome) for nome in colunas]
+    vazias = np.logical_and.reduce([_vazia(s) for s in originais])
+    if vazias.all():
+        raise ValueError('Nenhuma medida encontrada na tabela.')
+
+    valores = [_numerica(s) for s in originais]
+    validacao = _Validacao(vazias)
+    for nome, mensagem, original, serie in zip(
+        colunas,
+        (
+            'Profundidade não pode ser negativa.',
+            'qc não pode ser negativo.',
+            'fs não pode ser negativo.',
+        ),
+        originais,
+        valores,
+    ):
+        _checar_numero(validacao, original, serie, nome, mensagem)
+
+    erros = validacao.erros()
+    if erros:
+        return ResultadoImportacao(erros=erros)
+
+    validas = ~vazias
+    profundidades, qc, fs = (s.to_numpy()[validas].tolist() for s in valores)
+    perfil = PerfilCPTColunar.from_arrays(
+        profundidades, qc, fs, nome_sondagem=nome_sondagem
+    )
+    return ResultadoImportacao(perfil=perfil)
@@ -7,11 +7,15 @@ import altair as alt
 import pandas as pd
 import streamlit as st
 
-from calculus_core.domain.model import PerfilSPT
 from calculus_core.entrypoints.streamlit_app.constants import (
     EXEMPLO_SPT,
     SOLOS_VALIDOS_MAP,
 )
+from calculus_core.entrypoints.streamlit_app.ingestao import (
+    ResultadoImportacao,
+    importar_cpt,
+    importar_spt,
+)
 
 # =============================================================================
 # SETUP
@@ -28,6 +32,21 @@ if 'perfil_spt' not in st.session_state:
 
 # Imported from constants.py
 
+# Row errors listed under an invalid import
+MAX_ERROS_EXIBIDOS = 20
+
+
+def mostrar_erros(resultado: ResultadoImportacao) -> None:
+    """Show the row errors of a failed import."""
+    erros = resultado.erros
+    linhas = [f'- {erro}' for erro in erros[:MAX_ERROS_EXIBIDOS]]
+    if len(erros) > MAX_ERROS_EXIBIDOS:
+        linhas.append(f'- ... e mais {len(erros) - MAX_ERROS_EXIBIDOS}')
+    st.error(
+        f'{len(erros)} valor(es) inválido(s) na tabela:\n' + '\n'.join(linhas)
+    )
+
+
 # =============================================================================
 # PAGE LAYOUT
 # =============================================================================
@@ -62,20 +81,19 @@ with tab_manual:
 
             # Update profile immediately
             try:
-                perfil = PerfilSPT(nome_sondagem='Exemplo Padrão')
-                medidas = []
-                for _, row in st.session_state.spt_data.iterrows():
-                    # Map solo string back to ID using the init map logic
-                    solo_id = SOLOS_VALIDOS_MAP.get(
-                        row['solo'], 'br_solo_residual_geral'
-                    )
-                    medidas.append(
-                        (float(row['prof']), int(row['n_spt']), solo_id)
-                    )
-
-                perfil.adicionar_medidas(medidas)
-                st.session_state.perfil_spt = perfil
-                st.toast('Perfil resetado com sucesso!', icon='✅')
+                resultado = importar_spt(
+                    st.session_state.spt_data,
+                    'prof',
+                    'n_spt',
+                    'solo',
+                    solo_desconhecido='br_solo_residual_geral',
+                    nome_sondagem='Exemplo Padrão',
+                )
+                if resultado.sucesso:
+                    st.session_state.perfil_spt = resultado.perfil
+                    st.toast('Perfil resetado com sucesso!', icon='✅')
+                else:
+                    mostrar_erros(resultado)
 
             except Exception as e:
                 st.error(f'Erro ao regenerar perfil padrão: {e}')
@@ -109,27 +127,22 @@ with tab_manual:
             width='stretch',
         ):
             try:
-                perfil = PerfilSPT(nome_sondagem='Sondagem Manual')
-                medidas = []
-
-                # Ordenar por profundidade
-                df_sorted = edited_df.sort_values(by='prof')
-
-                for _, row in df_sorted.iterrows():
-                    # Get normalized identifier from map
-                    solo_id = SOLOS_VALIDOS_MAP.get(row['solo'])
-                    if not solo_id:
-                        st.error(f'Tipo de solo inválido: {row["solo"]}')
-                        st.stop()
-
-                    medidas.append(
-                        (float(row['prof']), int(row['n_spt']), solo_id)
-                    )
+                # Unknown soil names are reported, not replaced
+                resultado = importar_spt(
+                    edited_df,
+                    'prof',
+                    'n_spt',
+                    'solo',
+                    nome_sondagem='Sondagem Manual',
+                )
+                if not resultado.sucesso:
+                    mostrar_erros(resultado)
+                    st.stop()
 
-                perfil.adicionar_medidas(medidas)
-                st.session_state.perfil_spt = perfil
+                st.session_state.perfil_spt = resultado.perfil
                 st.toast('Perfil processado com sucesso!', icon='✅')
-                st.session_state.spt_data = df_sorted  # Save sorted back
+                # Save sorted back
+                st.session_state.spt_data = edited_df.sort_values(by='prof')
 
             except Exception as e:
                 st.error(f'Erro ao processar perfil: {str(e)}')
@@ -274,32 +287,21 @@ with tab_spt_csv:
 
             if st.button('✅ Processar CSV SPT', type='primary'):
                 try:
-                    perfil = PerfilSPT(nome_sondagem=uploaded_spt.name)
-                    medidas = []
-
-                    for _, row in df_spt_upload.iterrows():
-                        prof = float(row[c_prof])
-                        nspt = int(row[c_nspt])
-
-                        if use_solo_col:
-                            raw_solo = row[c_solo]
-                            # Try exact match or fallback
-                            solo_id = SOLOS_VALIDOS_MAP.get(
-                                raw_solo, 'br_solo_residual_geral'
-                            )
-                        else:
-                            solo_id = SOLOS_VALIDOS_MAP.get(default_soil_type)
-
-                        medidas.append((prof, nspt, solo_id))
-
-                    perfil.adicionar_medidas(medidas)
-                    st.session_state.perfil_spt = perfil
-
-                    # Update manual editor data too for continuity
-                    # Reverse map for display? Or just keep raw?
-                    # Simplify: Just update the profile object.
-
-                    st.toast('Perfil SPT carregado!', icon='✅')
+                    # Unknown soil names fall back to residual soil
+                    resultado = importar_spt(
+                        df_spt_upload,
+                        c_prof,
+                        c_nspt,
+                        c_solo,
+                        solo_padrao=default_soil_type,
+                        solo_desconhecido='br_solo_residual_geral',
+                        nome_sondagem=uploaded_spt.name,
+                    )
+                    if resultado.sucesso:
+                        st.session_state.perfil_spt = resultado.perfil
+                        st.toast('Perfil SPT carregado!', icon='✅')
+                    else:
+                        mostrar_erros(resultado)
 
                 except Exception as e:
                     st.error(f'Erro ao importar: {e}')
@@ -314,7 +316,6 @@ with tab_spt_csv:
 # =============================================================================
 with tab_cpt:
     from calculus_core.domain.soil_investigation import (
-        PerfilCPT,
         converter_cpt_para_spt,
     )
 
@@ -373,19 +374,18 @@ with tab_cpt:
                     key='btn_cpt_convert',
                 ):
                     try:
-                        cpt = PerfilCPT(nome_sondagem=uploaded_cpt.name)
-                        medidas = []
-
-                        for _, row in df_cpt.iterrows():
-                            medidas.append(
-                                (
-                                    float(row[coluna_profundidade]),
-                                    float(row[coluna_qc]),
-                                    float(row[coluna_fs]),
-                                )
-                            )
-
-                        cpt.adicionar_medidas(medidas)
+                        resultado = importar_cpt(
+                            df_cpt,
+                            coluna_profundidade,
+                            coluna_qc,
+                            coluna_fs,
+                            nome_sondagem=uploaded_cpt.name,
+                        )
+                        if not resultado.sucesso:
+                            mostrar_erros(resultado)
+                            st.stop()
+
+                        cpt = resultado.perfil
                         st.session_state.perfil_cpt = cpt  # Store raw CPT
 
                         # Convert
@@ -410,12 +410,14 @@ with tab_cpt:
 
         # Show CPT Raw if available
         if st.session_state.get('perfil_cpt'):
-            cpt_obj = st.session_state.perfil_cpt
-            data_cpt = [
-                {'z': m.profundidade, 'qc': m.qc, 'fs': m.fs}
-                for m in cpt_obj._medidas
-            ]
-            df_cpt_viz = pd.DataFrame(data_cpt)
+            colunas_cpt = st.session_state.perfil_cpt.colunas()
+            df_cpt_viz = pd.DataFrame(
+                {
+                    'z': colunas_cpt.profundidades,
+                    'qc': colunas_cpt.qc,
+                    'fs': colunas_cpt.fs,
+                }
+            )
 
             base = alt.Chart(df_cpt_viz).encode(
                 y=alt.Y('z', scale=alt.Scale(reverse=True), title='Prof (m)')
@@ -6,9 +6,14 @@ import altair as alt
 import pandas as pd
 import streamlit as st
 
-from calculus_core.bootstrap import get_all_calculators
-from calculus_core.domain.pile_types import EstacaFactory
-from calculus_core.service_layer import CalculationRequest, CalculationService
+from calculus_core.domain.value_objects import CurvaCapacidade
+from calculus_core.entrypoints.streamlit_app.cache import (
+    calcular_curva,
+    listar_perfis_estaca,
+    listar_tipos_estaca,
+    obter_calculadoras,
+    obter_info_perfil,
+)
 
 # =============================================================================
 # SETUP
@@ -36,24 +41,20 @@ with coluna_configuracao:
 
     with st.container(border=True):
         # Pile Type Selection
-        tipos_disponiveis = EstacaFactory.listar_tipos_estaca()
+        tipos_disponiveis = listar_tipos_estaca()
         tipo_selecionado = st.selectbox(
             'Tipo de Fundação', tipos_disponiveis, index=0
         )
 
         # Profile Selection
-        perfis_disponiveis = EstacaFactory.listar_perfis_por_tipo(
-            tipo_selecionado
-        )
+        perfis_disponiveis = listar_perfis_estaca(tipo_selecionado)
         perfil_selecionado = st.selectbox(
             'Perfil Comercial', perfis_disponiveis
         )
 
         # Helper Info
         try:
-            info = EstacaFactory.obter_info_perfil(
-                tipo_selecionado, perfil_selecionado
-            )
+            info = obter_info_perfil(tipo_selecionado, perfil_selecionado)
             d = info.get('dimensao_principal_m', 0)
             if d == 0:
                 d = info.get('diametro_m', 0)
@@ -64,7 +65,7 @@ with coluna_configuracao:
         st.markdown('---')
 
         # Method Selection
-        metodos = list(get_all_calculators().keys())
+        metodos = list(obter_calculadoras().keys())
         metodos_selecionados = st.multiselect(
             'Métodos de Cálculo', metodos, default=[metodos[0]]
         )
@@ -80,37 +81,29 @@ with coluna_resultados:
         results_data = []
 
         try:
-            # Create a reference pile (prototype)
-            estaca_ref = EstacaFactory.criar_de_catalogo(
-                tipo_selecionado, perfil_selecionado, cota_assentamento=1
-            )
-
-            request = CalculationRequest(
-                perfil_spt=st.session_state.perfil_spt,
-                tipo_estaca=estaca_ref.tipo,
-                processo_construcao=estaca_ref.processo_construcao,
-                formato=estaca_ref.formato,
-                secao_transversal=estaca_ref.secao_transversal,
-                cota_assentamento=None,  # Calculate all depths
-                estaca_prototype=estaca_ref,  # Use prototype for catalog piles
-            )
-
             for metodo in metodos_selecionados:
-                calc = get_all_calculators()[metodo]
-                service = CalculationService(calc)
-
-                # Execute calculation using the service
-                result = service.calculate_all_depths(request)
+                # Cached by profile fingerprint, pile and method
+                curva, erro = calcular_curva(
+                    st.session_state.perfil_spt,
+                    metodo,
+                    tipo_selecionado,
+                    perfil_selecionado,
+                )
 
-                if result.success:
-                    for r in result.resultados:
-                        r_dict = r.to_dict()
-                        r_dict['Método'] = metodo
-                        results_data.append(r_dict)
+                if erro is None:
+                    df_metodo = pd.DataFrame(
+                        curva, columns=CurvaCapacidade.COLUNAS
+                    )
+                    df_metodo['Método'] = metodo
+                    results_data.append(df_metodo)
                 else:
-                    st.error(f'Erro no método {metodo}: {result.error}')
+                    st.error(f'Erro no método {metodo}: {erro}')
 
-            df_res = pd.DataFrame(results_data)
+            df_res = (
+                pd.concat(results_data, ignore_index=True)
+                if results_data
+                else pd.DataFrame()
+            )
 
             if not df_res.empty:
                 # Chart
@@ -6,13 +6,13 @@ import altair as alt
 import pandas as pd
 import streamlit as st
 
-from calculus_core.domain.method_registry import CalculationMethodRegistry
-from calculus_core.domain.pile_types import EstacaFactory
-from calculus_core.service_layer import (
-    calcular_todos_metodos_todas_estacas,
-    calcular_todos_metodos_uma_estaca,
-    calcular_um_metodo_todas_estacas,
-    serializar_resultados,
+from calculus_core.entrypoints.streamlit_app.cache import (
+    comparar_estacas,
+    comparar_metodos,
+    listar_perfis_estaca,
+    listar_tipos_estaca,
+    matriz_global,
+    obter_metodos,
 )
 
 # =============================================================================
@@ -42,7 +42,7 @@ else:
 # =============================================================================
 
 # Map Display Name -> ID
-METHODS_INFO = CalculationMethodRegistry.list_all()
+METHODS_INFO = obter_metodos()
 NAME_TO_ID = {m.name: m.id for m in METHODS_INFO}
 ID_TO_NAME = {m.id: m.name for m in METHODS_INFO}
 
@@ -73,13 +73,13 @@ with tab1:
 
     with coluna_configuracao:
         with st.container(border=True):
-            tipos = EstacaFactory.listar_tipos_estaca()
+            tipos = listar_tipos_estaca()
             tipo_estaca_selecionada = st.selectbox(
                 'Tipo de Estaca', tipos, key='batch_t'
             )
             perfil_estaca_selecionado = st.selectbox(
                 'Perfil Comercial',
-                EstacaFactory.listar_perfis_por_tipo(tipo_estaca_selecionada),
+                listar_perfis_estaca(tipo_estaca_selecionada),
                 key='batch_p',
             )
             cota = st.number_input(
@@ -99,14 +99,12 @@ with tab1:
     with coluna_resultados:
         if run_methods:
             with st.spinner('Calculando...'):
-                estaca = EstacaFactory.criar_de_catalogo(
-                    tipo_estaca_selecionada, perfil_estaca_selecionado, cota
-                )
-                resultados = calcular_todos_metodos_uma_estaca(
-                    st.session_state.perfil_spt, estaca
+                dados = comparar_metodos(
+                    st.session_state.perfil_spt,
+                    tipo_estaca_selecionada,
+                    perfil_estaca_selecionado,
+                    cota,
                 )
-
-                dados = serializar_resultados(resultados)
                 df = pd.DataFrame(dados)
 
                 # Add Human Readable Name
@@ -191,14 +189,12 @@ with tab2:
         if run_piles:
             with st.spinner('Analisando todos os catálogos...'):
                 try:
-                    resultados = calcular_um_metodo_todas_estacas(
+                    dados = comparar_estacas(
                         st.session_state.perfil_spt,
                         metodo_id,  # Pass ID, not name
                         cota_viabilidade,
-                        diametro_referencia=diametro_referencia,
+                        diametro_referencia,
                     )
-
-                    dados = serializar_resultados(resultados)
                     df = pd.DataFrame(dados)
                     df = df.dropna(subset=['capacidade_carga_adm'])
 
@@ -282,13 +278,9 @@ with tab3:
     with coluna_resultados:
         if run_global:
             with st.spinner('Processando matriz complexa...'):
-                resultados = calcular_todos_metodos_todas_estacas(
-                    st.session_state.perfil_spt,
-                    cota_global,
-                    diametro_referencia=diametro_global,
+                dados = matriz_global(
+                    st.session_state.perfil_spt, cota_global, diametro_global
                 )
-
-                dados = serializar_resultados(resultados)
                 df = pd.DataFrame(dados)
                 df['metodo_nome'] = df['metodo'].map(ID_TO_NAME)
 
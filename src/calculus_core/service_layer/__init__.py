@@ -4,12 +4,19 @@ Service Layer Package
 Application services (use cases) that orchestrate domain operations.
 """
 
+from .async_services import AsyncCalculationService
+from .coalescing import CalculationCoalescer, EstatisticasAgrupamento
 from .services import (
+    COLUNAS_RESULTADO,
     BatchResult,
     CalculationRequest,
     CalculationResult,
     # Core classes
     CalculationService,
+    ProgressoObra,
+    ResultadoObra,
+    ResultadoSondagem,
+    calcular_obra,
     calcular_todos_metodos_todas_estacas,
     # Batch calculation functions
     calcular_todos_metodos_uma_estaca,
@@ -17,12 +24,16 @@ from .services import (
     # Single calculation functions
     calculate_pile_capacity,
     calculate_pile_capacity_by_depth,
+    iterar_obra,
     serializar_resultados,
 )
 
 __all__ = [
     # Core classes
     'CalculationService',
+    'AsyncCalculationService',
+    'CalculationCoalescer',
+    'EstatisticasAgrupamento',
     'CalculationRequest',
     'CalculationResult',
     'BatchResult',
@@ -34,4 +45,11 @@ __all__ = [
     'calcular_um_metodo_todas_estacas',
     'calcular_todos_metodos_todas_estacas',
     'serializar_resultados',
+    'COLUNAS_RESULTADO',
+    # Site (multi-boring) API
+    'calcular_obra',
+    'iterar_obra',
+    'ResultadoObra',
+    'ResultadoSondagem',
+    'ProgressoObra',
 ]
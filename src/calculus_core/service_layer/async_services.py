@@ -0,0 +1,293 @@
+"""
+Asynchronous Application Services
+
+asyncio front end for the calculation use cases.
+
+The calculations are CPU-bound, so calling ``CalculationService`` from a
+coroutine would block the event loop. ``AsyncCalculationService`` runs
+them on an executor instead and awaits the result, with two concurrency
+limits:
+
+- interactive calls (single depth, all depths) share ``max_concurrency``
+  slots;
+- batch calls share ``max_batch_concurrency`` slots (default 1) and run
+  one method at a time, so a large batch never takes more than its own
+  slots and leaves the rest of the executor to interactive calls.
+
+Calls are cancelled through their asyncio task. Work that has not
+started is dropped; a chunk already running finishes in the background
+and keeps its slot until then, so the limits always hold. A cancelled
+batch stops at the next method.
+
+Example:
+    async with AsyncCalculationService(service) as async_service:
+        result = await async_service.calculate_all_depths(request)
+"""
+
+import asyncio
+import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from calculus_core.domain.model import PerfilSPT
+from calculus_core.service_layer.services import (
+    BatchResult,
+    CalculationRequest,
+    CalculationResult,
+    CalculationService,
+    calcular_um_metodo_todas_estacas,
+)
+
+T = TypeVar('T')
+
+
+class AsyncCalculationService:
+    """
+    asyncio wrapper around a CalculationService.
+
+    By default calculations run on a thread pool owned by the service
+    (shut down by ``close``). A ``ProcessPoolExecutor`` can be given
+    instead for parallel calculations together with ``metodo``: calls
+    then send only the method ID and the request, and each worker
+    resolves the calculator from its own registry. Without ``metodo``
+    the bound service is sent, which only works with threads.
+
+    Usage:
+        async_service = AsyncCalculationService(service, max_concurrency=8)
+        result = await async_service.calculate_single_depth(request)
+    """
+
+    def __init__(
+        self,
+        service: CalculationService,
+        *,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+        max_concurrency: int | None = None,
+        max_batch_concurrency: int = 1,
+        metodo: str | None = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            service: Synchronous service that does the calculations.
+            executor: Executor to run calculations on (not shut down by
+                ``close``). If None, a thread pool is created on first use.
+            max_workers: Size of the thread pool when no executor is
+                given, or the worker count of ``executor``.
+            max_concurrency: Interactive calls running at once (default:
+                ``max_workers``, or the CPU count).
+            max_batch_concurrency: Batch calls running at once.
+            metodo: Registered method ID of the service's calculator.
+                Required to run interactive calls on a process pool.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError('Número de workers deve ser positivo.')
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError('Limite de concorrência deve ser positivo.')
+        if max_batch_concurrency <= 0:
+            raise ValueError('Limite de concorrência deve ser positivo.')
+        self._service = service
+        self._metodo = metodo
+        self._executor = executor
+        self._proprio = executor is None
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency
+        self._max_batch_concurrency = max_batch_concurrency
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaforos: tuple[asyncio.Semaphore, asyncio.Semaphore]
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    @property
+    def executor(self) -> Executor:
+        """Executor the calculations run on."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix='calculus-core',
+            )
+        return self._executor
+
+    @property
+    def max_concurrency(self) -> int:
+        """Interactive calls allowed to run at once."""
+        if self._max_concurrency is not None:
+            return self._max_concurrency
+        return self._max_workers or os.cpu_count() or 1
+
+    def close(self) -> None:
+        """Shut down the owned thread pool, dropping queued work."""
+        if self._proprio and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> 'AsyncCalculationService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Use cases
+    # -------------------------------------------------------------------------
+
+    async def calculate_single_depth(
+        self, request: CalculationRequest
+    ) -> CalculationResult:
+        """
+        Calculate pile capacity at a single depth.
+
+        Args:
+            request: Calculation parameters with cota_assentamento set.
+
+        Returns:
+            CalculationResult with single result or error.
+        """
+        if self._metodo is None:
+            return await self._executar(
+                False, self._service.calculate_single_depth, request
+            )
+        return await self._executar(
+            False, _calcular_uma_cota, self._metodo, request
+        )
+
+    async def calculate_all_depths(
+        self, request: CalculationRequest
+    ) -> CalculationResult:
+        """
+        Calculate pile capacity at all valid depths.
+
+        Args:
+            request: Calculation parameters.
+
+        Returns:
+            CalculationResult with results for all depths or error.
+        """
+        if self._metodo is None:
+            return await self._executar(
+                False, self._service.calculate_all_depths, request
+            )
+        return await self._executar(
+            False, _calcular_todas_cotas, self._metodo, request
+        )
+
+    async def calculate_batch(
+        self,
+        perfil_spt: PerfilSPT,
+        cota_assentamento: float,
+        metodos: list[str] | None = None,
+        tipos_estaca: list[str] | None = None,
+        diametro_referencia: float = 0.40,
+    ) -> list[BatchResult]:
+        """
+        Calculate all methods for all pile types (full matrix).
+
+        Same results as ``calcular_todos_metodos_todas_estacas``; each
+        method runs as a separate executor call in the batch lane.
+
+        Args:
+            perfil_spt: SPT profile.
+            cota_assentamento: Installation depth.
+            metodos: Optional list of method IDs. If None, uses all.
+            tipos_estaca: Optional list of pile types. If None, uses all.
+            diametro_referencia: Target diameter to select profiles.
+
+        Returns:
+            List of BatchResult with all combinations.
+
+        Raises:
+            ValueError: If a method is unknown.
+        """
+        from calculus_core.domain.method_registry import (
+            CalculationMethodRegistry,
+        )
+
+        if metodos is None:
+            metodos = CalculationMethodRegistry.list_ids()
+
+        resultados: list[BatchResult] = []
+        for metodo in metodos:
+            resultados.extend(
+                await self._executar(
+                    True,
+                    calcular_um_metodo_todas_estacas,
+                    perfil_spt,
+                    metodo,
+                    cota_assentamento,
+                    tipos_estaca,
+                    diametro_referencia,
+                )
+            )
+        return resultados
+
+    # -------------------------------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------------------------------
+
+    def _semaforo(self, lote: bool) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop; recreated for a new one
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaforos = (
+                asyncio.Semaphore(self.max_concurrency),
+                asyncio.Semaphore(self._max_batch_concurrency),
+            )
+        return self._semaforos[lote]
+
+    async def _executar(
+        self, lote: bool, funcao: Callable[..., T], *args: Any
+    ) -> T:
+        """Run ``funcao`` on the executor within a lane's limit."""
+        semaforo = self._semaforo(lote)
+        loop = asyncio.get_running_loop()
+        await semaforo.acquire()
+        try:
+            futuro = self.executor.submit(funcao, *args)
+        except BaseException:
+            semaforo.release()
+            raise
+
+        # The slot is freed when the work ends, not when the caller
+        # stops waiting, so cancelled calls cannot exceed the limit
+        def liberar(_: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(semaforo.release)
+            except RuntimeError:
+                # Event loop already closed
+                pass
+
+        futuro.add_done_callback(liberar)
+        return await asyncio.wrap_future(futuro)
+
+
+# =============================================================================
+# WORKER FUNCTIONS (module level, so process pools can pickle them)
+# =============================================================================
+
+
+def _calcular_uma_cota(
+    metodo: str, request: CalculationRequest
+) -> CalculationResult:
+    """Single-depth calculation with the worker's shared calculator."""
+    from calculus_core.domain.method_registry import CalculationMethodRegistry
+
+    calculator = CalculationMethodRegistry.get_calculator_instance(metodo)
+    return CalculationService(calculator).calculate_single_depth(request)
+
+
+def _calcular_todas_cotas(
+    metodo: str, request: CalculationRequest
+) -> CalculationResult:
+    """All-depths calculation with the worker's shared calculator."""
+    from calculus_core.domain.method_registry import CalculationMethodRegistry
+
+    calculator = CalculationMethodRegistry.get_calculator_instance(metodo)
+    return CalculationService(calculator).calculate_all_depths(request)
@@ -0,0 +1,265 @@
+"""
+Request Coalescing
+
+Micro-batching of concurrent calculation requests on the same boring.
+
+A server handling one thread per request would prepare the profile and
+walk its layers once per request, even when hundreds of requests target
+the same boring. ``CalculationCoalescer`` groups the requests that
+arrive within a short window by profile fingerprint
+(``PerfilSPT.impressao_digital``) and evaluates each group once:
+
+- the group shares one profile instance, so every method prepares its
+  per-layer coefficients once (``MetodoCalculo.perfil_preparado``);
+- requests for the same method and pile geometry at several cotas are
+  answered from a single ``calcular_curva`` pass;
+- identical requests share one result.
+
+The first request of a group leads it: it waits for the window, then
+evaluates the whole group in its own thread while the others wait for
+their results. Recently seen profiles are kept, so a boring keeps its
+prepared tables across windows. The coalescer keeps a columnar copy of
+each profile, not the caller's object, so a profile modified after its
+request never answers for its old fingerprint.
+
+Example:
+    coalescer = CalculationCoalescer(janela=0.002)
+    resultado = coalescer.calcular(perfil, 'aoki_velloso_1975', estaca, 10)
+"""
+
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from calculus_core.domain.calculation.base import MetodoCalculo
+from calculus_core.domain.calculation.memo import CacheLRU
+from calculus_core.domain.model import (
+    Estaca,
+    PerfilSPT,
+    PerfilSPTColunar,
+    chave_estaca,
+)
+from calculus_core.domain.value_objects import (
+    CurvaCapacidade,
+    ResultadoCalculo,
+)
+
+
+@dataclass(frozen=True)
+class EstatisticasAgrupamento:
+    """
+    Counters of a coalescer.
+
+    Attributes:
+        pedidos: Requests received.
+        grupos: Groups evaluated (one per boring and window).
+        curvas: ``calcular_curva`` passes run.
+        calculos: Single-cota ``calcular`` calls run.
+    """
+
+    pedidos: int
+    grupos: int
+    curvas: int
+    calculos: int
+
+
+@dataclass
+class _Pedido:
+    metodo: str
+    estaca: Estaca
+    cota: float | None
+    futuro: Future = field(default_factory=Future)
+
+
+@dataclass
+class _Grupo:
+    perfil: PerfilSPT
+    pedidos: list[_Pedido] = field(default_factory=list)
+
+
+class CalculationCoalescer:
+    """
+    Thread-safe coalescer of calculation requests by boring.
+
+    Attributes:
+        janela: Seconds a group stays open for more requests.
+    """
+
+    def __init__(self, janela: float = 0.002, perfis_recentes: int = 256):
+        """
+        Initialize the coalescer.
+
+        Args:
+            janela: Seconds a group stays open for more requests (0
+                evaluates each request as it arrives, still sharing the
+                prepared profile).
+            perfis_recentes: Profiles kept between windows.
+
+        Raises:
+            ValueError: If a limit is invalid.
+        """
+        if janela < 0:
+            raise ValueError('Janela de agrupamento não pode ser negativa.')
+        self.janela = janela
+        self._perfis: CacheLRU[PerfilSPT] = CacheLRU(perfis_recentes)
+        self._abertos: dict[str, _Grupo] = {}
+        self._lock = threading.Lock()
+        self._pedidos = 0
+        self._grupos = 0
+        self._curvas = 0
+        self._calculos = 0
+
+    def calcular(
+        self,
+        perfil_spt: PerfilSPT,
+        metodo: str,
+        estaca: Estaca,
+        cota: float | None = None,
+    ) -> ResultadoCalculo | CurvaCapacidade:
+        """
+        Calculate one request, evaluated together with its group.
+
+        Args:
+            perfil_spt: SPT profile.
+            metodo: Method ID.
+            estaca: Pile (its cota is ignored when ``cota`` is given).
+            cota: Installation depth, or None for every cota.
+
+        Returns:
+            ResultadoCalculo for a cota, or CurvaCapacidade for all.
+
+        Raises:
+            ValueError: If the calculation fails.
+        """
+        return self.submeter(perfil_spt, metodo, estaca, cota).result()
+
+    def submeter(
+        self,
+        perfil_spt: PerfilSPT,
+        metodo: str,
+        estaca: Estaca,
+        cota: float | None = None,
+    ) -> Future:
+        """
+        Queue a request and return the future of its result.
+
+        The calling thread evaluates the group when it opens one, so this
+        blocks for the window (and the evaluation) in that case.
+
+        Args:
+            perfil_spt: SPT profile.
+            metodo: Method ID.
+            estaca: Pile (its cota is ignored when ``cota`` is given).
+            cota: Installation depth, or None for every cota.
+
+        Returns:
+            Future resolved with the result or the calculation error.
+        """
+        chave = perfil_spt.impressao_digital
+        pedido = _Pedido(metodo, estaca, cota)
+        with self._lock:
+            self._pedidos += 1
+            grupo = self._abertos.get(chave)
+            lider = grupo is None
+            if lider:
+                perfil = self._perfis.obter(
+                    chave, lambda: PerfilSPTColunar.de_perfil(perfil_spt)
+                )
+                grupo = self._abertos[chave] = _Grupo(perfil)
+            grupo.pedidos.append(pedido)
+
+        if lider:
+            if self.janela:
+                time.sleep(self.janela)
+            with self._lock:
+                del self._abertos[chave]
+                self._grupos += 1
+            try:
+                self._avaliar(grupo)
+            except BaseException as e:
+                # Never leave the group's other threads waiting
+                for outro in grupo.pedidos:
+                    if not outro.futuro.done():
+                        outro.futuro.set_exception(e)
+                if not isinstance(e, Exception):
+                    raise
+        return pedido.futuro
+
+    def estatisticas(self) -> EstatisticasAgrupamento:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return EstatisticasAgrupamento(
+                pedidos=self._pedidos,
+                grupos=self._grupos,
+                curvas=self._curvas,
+                calculos=self._calculos,
+            )
+
+    def _avaliar(self, grupo: _Grupo) -> None:
+        """Answer every request of a closed group."""
+        from calculus_core.domain.method_registry import (
+            CalculationMethodRegistry,
+        )
+
+        # Same method and geometry: one curve serves every cota
+        por_estaca: dict[tuple, list[_Pedido]] = defaultdict(list)
+        for pedido in grupo.pedidos:
+            por_estaca[
+                (pedido.metodo, chave_estaca(pedido.estaca)[:-1])
+            ].append(pedido)
+
+        for (metodo, _), pedidos in por_estaca.items():
+            try:
+                calc = CalculationMethodRegistry.get_calculator_instance(
+                    metodo
+                )
+                self._responder(calc, grupo.perfil, pedidos)
+            except Exception as e:
+                for pedido in pedidos:
+                    if not pedido.futuro.done():
+                        pedido.futuro.set_exception(e)
+
+    def _responder(
+        self, calc: MetodoCalculo, perfil: PerfilSPT, pedidos: list[_Pedido]
+    ) -> None:
+        """Answer requests sharing a method and pile geometry."""
+        cotas = {pedido.cota for pedido in pedidos}
+        curva = None
+        erro_curva = None
+        indices: dict[float, int] = {}
+        if None in cotas or len(cotas) > 1:
+            try:
+                curva = calc.calcular_curva(perfil, pedidos[0].estaca)
+                indices = {cota: i for i, cota in enumerate(curva.cotas)}
+            except Exception as e:
+                # Cotas above a failing layer can still be calculated
+                erro_curva = e
+            with self._lock:
+                self._curvas += 1
+
+        resultados: dict[float, ResultadoCalculo] = {}
+        for pedido in pedidos:
+            try:
+                if pedido.cota is None:
+                    if erro_curva is not None:
+                        raise erro_curva
+                    pedido.futuro.set_result(curva)
+                    continue
+                resultado = resultados.get(pedido.cota)
+                if resultado is None:
+                    indice = indices.get(float(pedido.cota))
+                    if indice is not None:
+                        resultado = curva[indice]
+                    else:
+                        # Off the curve (e.g. fractional cota): per cota
+                        resultado = calc.calcular(
+                            perfil, pedido.estaca.na_cota(pedido.cota)
+                        )
+                        with self._lock:
+                            self._calculos += 1
+                    resultados[pedido.cota] = resultado
+                pedido.futuro.set_result(resultado)
+            except Exception as e:
+                pedido.futuro.set_exception(e)
@@ -12,8 +12,14 @@ Following Cosmic Python principles:
 - Services can be easily tested with mocked dependencies
 """
 
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, as_completed
 from dataclasses import dataclass, field
-from typing import Literal
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Literal
 
 from calculus_core.domain.calculation.base import MetodoCalculo
 from calculus_core.domain.model import Estaca, PerfilSPT
@@ -47,7 +53,7 @@ class CalculationResult:
     """
 
     success: bool
-    resultados: list[ResultadoCalculo] = field(default_factory=list)
+    resultados: Sequence[ResultadoCalculo] = field(default_factory=list)
     error: str | None = None
 
 
@@ -151,24 +157,21 @@ class CalculationService:
             cota_parada = self._calculator.cota_parada(request.perfil_spt)
             self._logger.debug('Cota de parada identificada: %s', cota_parada)
 
-            resultados = []
-
-            for cota in range(1, cota_parada + 1):
-                if request.estaca_prototype:
-                    estaca = request.estaca_prototype.na_cota(cota)
-                else:
-                    estaca = Estaca(
-                        tipo=request.tipo_estaca,
-                        processo_construcao=request.processo_construcao,
-                        formato=request.formato,
-                        secao_transversal=request.secao_transversal,
-                        cota_assentamento=cota,
-                    )
-
-                resultado = self._calculator.calcular(
-                    request.perfil_spt, estaca
+            if request.estaca_prototype:
+                estaca = request.estaca_prototype
+            else:
+                estaca = Estaca(
+                    tipo=request.tipo_estaca,
+                    processo_construcao=request.processo_construcao,
+                    formato=request.formato,
+                    secao_transversal=request.secao_transversal,
+                    cota_assentamento=1,
                 )
-                resultados.append(resultado)
+
+            # Single pass over the profile (cloned at each cota)
+            resultados = self._calculator.calcular_curva(
+                request.perfil_spt, estaca
+            )
 
             self._logger.info(
                 'Cálculo finalizado para %d cotas.', len(resultados)
@@ -248,17 +251,7 @@ def calculate_pile_capacity_by_depth(
     Returns:
         List of dictionaries with calculation results for each depth.
     """
-    cota_parada = calculator.cota_parada(perfil_spt)
-    resultados = []
-
-    for cota in range(1, cota_parada + 1):
-        # Polymorphic creation of pile at new depth
-        nova_estaca = estaca.na_cota(cota)
-
-        resultado = calculator.calcular(perfil_spt, nova_estaca)
-        resultados.append(resultado.to_dict())
-
-    return resultados
+    return calculator.calcular_curva(perfil_spt, estaca).to_dicts()
 
 
 # =============================================================================
@@ -299,12 +292,14 @@ def calcular_todos_metodos_uma_estaca(
         >>> for r in resultados:
         ...     print(f"{r.metodo}: {r.resultado.capacidade_carga:.0f} kN")
     """
-    from calculus_core.domain.method_registry import CalculationMethodRegistry
+    from calculus_core.domain.method_registry import (
+        CalculationMethodRegistry,
+    )
 
     resultados = []
     for method_id in CalculationMethodRegistry.list_ids():
         try:
-            calc = CalculationMethodRegistry.create_calculator(method_id)
+            calc = CalculationMethodRegistry.get_calculator_instance(method_id)
             resultado = calc.calcular(perfil_spt, estaca)
             resultados.append(
                 BatchResult(
@@ -356,20 +351,53 @@ def calcular_um_metodo_todas_estacas(
         ...     perfil, 'decourt_quaresma_1978', 10, diametro_referencia=0.5
         ... )
     """
-    from calculus_core.domain.method_registry import CalculationMethodRegistry
+    from calculus_core.domain.method_registry import (
+        CalculationMethodRegistry,
+    )
+
+    return _calcular_estacas(
+        perfil_spt,
+        metodo,
+        CalculationMethodRegistry.get_calculator_instance(metodo),
+        cota_assentamento,
+        _estacas_representativas(
+            tipos_estaca, cota_assentamento, diametro_referencia
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class _EstacaRepresentativa:
+    """Catalog pile chosen for a pile type (or why none could be built)."""
+
+    tipo: str
+    rotulo: str | None = None
+    estaca: Estaca | None = None
+    erro: str | None = None
+
+
+def _estacas_representativas(
+    tipos_estaca: list[str] | None,
+    cota_assentamento: float,
+    diametro_referencia: float,
+) -> list[_EstacaRepresentativa]:
+    """
+    Pick, for each pile type, the catalog profile closest to a diameter.
+
+    The choice depends only on the catalogs, so batch APIs make it once
+    and reuse it for every method and boring.
+    """
     from calculus_core.domain.pile_catalogs import (
         listar_perfis_por_tipo,
         listar_tipos_estaca,
-        obter_perfil,
+        perfil_mais_proximo,
     )
     from calculus_core.domain.pile_types import EstacaFactory
 
     if tipos_estaca is None:
         tipos_estaca = listar_tipos_estaca()
 
-    calc = CalculationMethodRegistry.create_calculator(metodo)
-    resultados = []
-
+    estacas = []
     for tipo in tipos_estaca:
         try:
             # 1. Get all profiles for this type
@@ -377,31 +405,9 @@ def calcular_um_metodo_todas_estacas(
             if not perfis:
                 continue
 
-            # 2. Find best matching profile (closest diameter)
-            melhor_perfil_nome = None
-            menor_diff = float('inf')
-
-            for nome in perfis:
-                p = obter_perfil(tipo, nome)
-
-                # Extract diameter from profile object
-                d = getattr(
-                    p,
-                    'diametro',
-                    getattr(
-                        p,
-                        'dimensao_principal',
-                        getattr(p, 'diametro_fuste', None),
-                    ),
-                )
-
-                if d is None:
-                    continue
-
-                diff = abs(d - diametro_referencia)
-                if diff < menor_diff:
-                    menor_diff = diff
-                    melhor_perfil_nome = nome
+            # 2. Find best matching profile (closest diameter, bisected
+            # in the type's precomputed index)
+            melhor_perfil_nome = perfil_mais_proximo(tipo, diametro_referencia)
 
             if not melhor_perfil_nome:
                 # Fallback: take the first one if no diameter found
@@ -411,13 +417,43 @@ def calcular_um_metodo_todas_estacas(
             estaca = EstacaFactory.criar_de_catalogo(
                 tipo, melhor_perfil_nome, cota_assentamento
             )
+            estacas.append(
+                _EstacaRepresentativa(
+                    tipo,
+                    rotulo=f'{estaca.tipo} ({melhor_perfil_nome})',
+                    estaca=estaca,
+                )
+            )
 
-            # 4. Calculate
-            resultado = calc.calcular(perfil_spt, estaca)
+        except Exception as e:
+            estacas.append(_EstacaRepresentativa(tipo, erro=str(e)))
+
+    return estacas
+
+
+def _calcular_estacas(
+    perfil_spt: PerfilSPT,
+    metodo: str,
+    calc: MetodoCalculo,
+    cota_assentamento: float,
+    estacas: list[_EstacaRepresentativa],
+) -> list[BatchResult]:
+    """Run one method over the representative piles of each type."""
+    resultados = []
+
+    for item in estacas:
+        tipo = item.tipo
+        try:
+            if item.estaca is None:
+                raise ValueError(item.erro)
+
+            # 4. Calculate (unsupported piles fail with the method's
+            # own message, which may name a soil or depth problem first)
+            resultado = calc.calcular(perfil_spt, item.estaca)
             resultados.append(
                 BatchResult(
                     metodo=metodo,
-                    estaca=f'{estaca.tipo} ({melhor_perfil_nome})',
+                    estaca=item.rotulo,
                     cota=cota_assentamento,
                     resultado=resultado,
                 )
@@ -442,39 +478,157 @@ def calcular_todos_metodos_todas_estacas(
     metodos: list[str] | None = None,
     tipos_estaca: list[str] | None = None,
     diametro_referencia: float = 0.40,
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
 ) -> list[BatchResult]:
     """
     Calculate all methods for all pile types (full matrix).
 
+    By default the combinations run one after another in the calling
+    process. Passing ``max_workers`` (greater than 1) runs them on a
+    ``ProcessPoolExecutor`` created for this call, whose workers receive
+    the profile once, at start-up. Passing ``executor`` uses an existing
+    pool instead (it is not shut down); the profile then travels with each
+    chunk, and there is one chunk per worker (``max_workers``, or the CPU
+    count). Either way the results come back in the same order as the
+    sequential run.
+
+    Methods registered at runtime are only visible to workers started with
+    the ``fork`` method; built-in methods are always available.
+
     Args:
         perfil_spt: SPT profile.
         cota_assentamento: Installation depth.
         metodos: Optional list of method IDs. If None, uses all.
         tipos_estaca: Optional list of pile types. If None, uses all.
         diametro_referencia: Target diameter to select profiles.
+        executor: Optional executor to run the chunks on.
+        max_workers: Number of worker processes when no executor is given
+            (default: sequential), or the worker count of ``executor``
+            (default: the CPU count).
 
     Returns:
         List of BatchResult with all combinations.
     """
     from calculus_core.domain.method_registry import CalculationMethodRegistry
+    from calculus_core.domain.pile_catalogs import listar_tipos_estaca
 
     if metodos is None:
         metodos = CalculationMethodRegistry.list_ids()
 
-    resultados = []
-    for metodo in metodos:
-        batch = calcular_um_metodo_todas_estacas(
-            perfil_spt,
-            metodo,
-            cota_assentamento,
-            tipos_estaca,
-            diametro_referencia,
-        )
-        resultados.extend(batch)
+    if executor is None and (max_workers is None or max_workers <= 1):
+        resultados = []
+        for metodo in metodos:
+            batch = calcular_um_metodo_todas_estacas(
+                perfil_spt,
+                metodo,
+                cota_assentamento,
+                tipos_estaca,
+                diametro_referencia,
+            )
+            resultados.extend(batch)
+        return resultados
+
+    if tipos_estaca is None:
+        tipos_estaca = listar_tipos_estaca()
+    combinacoes = [(m, t) for m in metodos for t in tipos_estaca]
+    if not combinacoes:
+        return []
+
+    if executor is not None:
+        trabalhadores = max_workers or os.cpu_count() or 1
+        futuros = [
+            executor.submit(
+                _calcular_combinacoes,
+                lote,
+                cota_assentamento,
+                diametro_referencia,
+                perfil_spt,
+            )
+            for lote in _dividir(combinacoes, trabalhadores)
+        ]
+        return [r for futuro in futuros for r in futuro.result()]
+
+    # Imported here: loading multiprocessing is only worth it for a pool
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Several chunks per worker balance uneven methods; the profile is
+    # already in every worker, so extra chunks cost only the pair list.
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_inicializar_trabalhador,
+        initargs=(perfil_spt,),
+    ) as pool:
+        futuros = [
+            pool.submit(
+                _calcular_combinacoes,
+                lote,
+                cota_assentamento,
+                diametro_referencia,
+            )
+            for lote in _dividir(combinacoes, max_workers * 4)
+        ]
+        return [r for futuro in futuros for r in futuro.result()]
+
+
+# Profile installed in each worker process by _inicializar_trabalhador
+_perfil_trabalhador: PerfilSPT | None = None
+
 
+def _inicializar_trabalhador(perfil_spt: PerfilSPT) -> None:
+    global _perfil_trabalhador  # noqa: PLW0603
+    _perfil_trabalhador = perfil_spt
+
+
+def _dividir(
+    combinacoes: list[tuple[str, str]], partes: int
+) -> list[list[tuple[str, str]]]:
+    """Split combinations into at most ``partes`` contiguous chunks."""
+    tamanho = -(-len(combinacoes) // max(partes, 1))
+    return [
+        combinacoes[i : i + tamanho]
+        for i in range(0, len(combinacoes), tamanho)
+    ]
+
+
+def _calcular_combinacoes(
+    combinacoes: list[tuple[str, str]],
+    cota_assentamento: float,
+    diametro_referencia: float,
+    perfil_spt: PerfilSPT | None = None,
+) -> list[BatchResult]:
+    """Run a chunk of (method, pile type) pairs in a worker process."""
+    if perfil_spt is None:
+        perfil_spt = _perfil_trabalhador
+    resultados: list[BatchResult] = []
+    # Consecutive pairs of the same method share one calculator
+    for metodo, pares in groupby(combinacoes, key=itemgetter(0)):
+        resultados.extend(
+            calcular_um_metodo_todas_estacas(
+                perfil_spt,
+                metodo,
+                cota_assentamento,
+                [tipo for _, tipo in pares],
+                diametro_referencia,
+            )
+        )
     return resultados
 
 
+# Keys of the rows built by serializar_resultados, in order
+COLUNAS_RESULTADO = (
+    'metodo',
+    'estaca',
+    'cota',
+    'erro',
+    'resistencia_ponta',
+    'resistencia_lateral',
+    'capacidade_carga',
+    'capacidade_carga_adm',
+)
+
+
 def serializar_resultados(resultados: list[BatchResult]) -> list[dict]:
     """
     Convert batch results to a list of flat dictionaries.
@@ -525,3 +679,456 @@ def serializar_resultados(resultados: list[BatchResult]) -> list[dict]:
         dados.append(row)
 
     return dados
+
+
+# =============================================================================
+# SITE (MULTI-BORING) BATCH API
+# =============================================================================
+
+
+@dataclass
+class ResultadoSondagem:
+    """
+    Batch results of one boring of a site.
+
+    Attributes:
+        sondagem: Boring name.
+        resultados: Results for every (cota, method, pile type).
+        erro: Why the boring could not be calculated (None on success).
+    """
+
+    sondagem: str
+    resultados: list[BatchResult] = field(default_factory=list)
+    erro: str | None = None
+
+    @property
+    def sucesso(self) -> bool:
+        """Whether the boring was calculated."""
+        return self.erro is None
+
+    def serializar(self) -> list[dict]:
+        """
+        Flatten the results into rows with a leading ``sondagem`` key.
+
+        Returns:
+            The rows of ``serializar_resultados``, or, for a failed
+            boring, a single row whose ``erro`` is the boring's error and
+            whose other fields are None.
+        """
+        if self.erro is not None:
+            return [
+                {
+                    'sondagem': self.sondagem,
+                    **dict.fromkeys(COLUNAS_RESULTADO),
+                    'erro': self.erro,
+                }
+            ]
+        return [
+            {'sondagem': self.sondagem, **linha}
+            for linha in serializar_resultados(self.resultados)
+        ]
+
+
+@dataclass(frozen=True)
+class ProgressoObra:
+    """
+    Progress of a site calculation, reported after each boring.
+
+    Attributes:
+        sondagem: Boring that has just finished.
+        concluidas: Borings finished so far.
+        total: Borings in the site.
+        erro: Error of the finished boring (None on success).
+    """
+
+    sondagem: str
+    concluidas: int
+    total: int
+    erro: str | None = None
+
+
+class ResultadoObra(Mapping[str, ResultadoSondagem]):
+    """
+    Result table of a site, keyed by boring name.
+
+    Borings keep the order they were given in, whatever order they
+    finished in.
+    """
+
+    def __init__(self, sondagens: Iterable[ResultadoSondagem]):
+        self._sondagens = {r.sondagem: r for r in sondagens}
+
+    def __getitem__(self, sondagem: str) -> ResultadoSondagem:
+        return self._sondagens[sondagem]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sondagens)
+
+    def __len__(self) -> int:
+        return len(self._sondagens)
+
+    def __repr__(self) -> str:
+        return (
+            f'ResultadoObra(sondagens={len(self)}, falhas={len(self.falhas)})'
+        )
+
+    @property
+    def falhas(self) -> dict[str, str]:
+        """Error message of each boring that could not be calculated."""
+        return {
+            nome: r.erro
+            for nome, r in self._sondagens.items()
+            if r.erro is not None
+        }
+
+    def serializar(self) -> list[dict]:
+        """
+        Flatten the table, one row per result plus one per failed boring.
+
+        Returns:
+            The rows of ``ResultadoSondagem.serializar`` for every boring.
+        """
+        return [
+            linha for r in self._sondagens.values() for linha in r.serializar()
+        ]
+
+
+@dataclass(frozen=True)
+class _PlanoObra:
+    """Methods and prepared catalog piles shared by every boring."""
+
+    metodos: tuple[str, ...]
+    estacas: tuple[tuple[float, list[_EstacaRepresentativa]], ...]
+
+
+def calcular_obra(
+    sondagens: Mapping[str, PerfilSPT] | Iterable[PerfilSPT],
+    cotas: float | Iterable[float],
+    metodos: list[str] | None = None,
+    tipos_estaca: list[str] | None = None,
+    diametro_referencia: float = 0.40,
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    progresso: Callable[[ProgressoObra], None] | None = None,
+) -> ResultadoObra:
+    """
+    Calculate every method and pile type for all the borings of a site.
+
+    Each boring gets the same results as
+    ``calcular_todos_metodos_todas_estacas`` at each cota, concatenated
+    in cota order. The catalog piles are chosen once for the whole site,
+    and each process reuses one calculator per method (with its prepared
+    coefficient tables) for all the borings it handles.
+
+    Borings are the unit of work: with ``max_workers`` (greater than 1)
+    they are spread over a ``ProcessPoolExecutor`` created for this call,
+    or over ``executor`` if one is given (it is not shut down). A boring
+    that fails is recorded with its error and the others carry on.
+
+    ``sondagens`` may be a mapping of name to profile, an iterable of
+    profiles (named by ``nome_sondagem``), or a profile repository with
+    ``names()`` and ``get(nome)`` such as ``ProfileArchive``; a repository
+    is opened by each worker and borings are loaded where they run.
+
+    Args:
+        sondagens: Borings of the site.
+        cotas: Installation depth, or depths, to calculate.
+        metodos: Optional list of method IDs. If None, uses all.
+        tipos_estaca: Optional list of pile types. If None, uses all.
+        diametro_referencia: Target diameter to select profiles.
+        executor: Optional executor to run the borings on.
+        max_workers: Number of worker processes when no executor is given
+            (default: sequential).
+        progresso: Called in the calling thread each time a boring
+            finishes.
+
+    Returns:
+        ResultadoObra keyed by boring name, in input order.
+
+    Raises:
+        ValueError: If a method is unknown or two borings share a name.
+
+    Example:
+        >>> obra = calcular_obra(perfis, cotas=[8, 10, 12], max_workers=4)
+        >>> obra['SP-01'].resultados[0].resultado.capacidade_carga
+        >>> obra.falhas
+    """
+    plano = _planejar_obra(cotas, metodos, tipos_estaca, diametro_referencia)
+    nomes, perfis, repositorio = _abrir_sondagens(sondagens)
+
+    concluidos: dict[str, ResultadoSondagem] = {}
+
+    def concluir(resultado: ResultadoSondagem) -> None:
+        concluidos[resultado.sondagem] = resultado
+        if progresso is not None:
+            progresso(
+                ProgressoObra(
+                    sondagem=resultado.sondagem,
+                    concluidas=len(concluidos),
+                    total=len(nomes),
+                    erro=resultado.erro,
+                )
+            )
+
+    if executor is None and (max_workers is None or max_workers <= 1):
+        for nome in nomes:
+            concluir(
+                _calcular_sondagem(nome, perfis.get(nome), plano, repositorio)
+            )
+        return ResultadoObra(concluidos[nome] for nome in nomes)
+
+    if executor is not None:
+        futuros = {
+            executor.submit(
+                _calcular_sondagem,
+                nome,
+                perfis.get(nome),
+                plano,
+                repositorio,
+            ): nome
+            for nome in nomes
+        }
+        _coletar(futuros, concluir)
+        return ResultadoObra(concluidos[nome] for nome in nomes)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The plan (and repository) reach each worker once, at start-up;
+    # tasks carry only the boring
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_inicializar_obra,
+        initargs=(plano, repositorio),
+    ) as pool:
+        futuros = {
+            pool.submit(_calcular_sondagem, nome, perfis.get(nome)): nome
+            for nome in nomes
+        }
+        _coletar(futuros, concluir)
+    return ResultadoObra(concluidos[nome] for nome in nomes)
+
+
+def iterar_obra(
+    sondagens: Iterable[tuple[str, PerfilSPT | Callable[[], PerfilSPT]]],
+    cotas: float | Iterable[float],
+    metodos: list[str] | None = None,
+    tipos_estaca: list[str] | None = None,
+    diametro_referencia: float = 0.40,
+    *,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    pendentes: int | None = None,
+) -> Iterator[ResultadoSondagem]:
+    """
+    Calculate a stream of borings, yielding each result in input order.
+
+    The streaming form of ``calcular_obra`` for sites too large to hold
+    in memory: borings are read from ``sondagens`` only as workers free
+    up, at most ``pendentes`` of them are in flight, and each result is
+    yielded (and can be written out and dropped) as soon as it and the
+    ones before it are done.
+
+    Each boring is a ``(nome, perfil)`` pair, where ``perfil`` may also
+    be a picklable callable that loads the profile. Loaders run where
+    the boring is calculated, so in parallel runs only the loader is
+    sent to the workers, and a loader that fails is that boring's error.
+
+    Args:
+        sondagens: (name, profile or loader) pairs.
+        cotas: Installation depth, or depths, to calculate.
+        metodos: Optional list of method IDs. If None, uses all.
+        tipos_estaca: Optional list of pile types. If None, uses all.
+        diametro_referencia: Target diameter to select profiles.
+        executor: Optional executor to run the borings on.
+        max_workers: Number of worker processes when no executor is given
+            (default: sequential), or the worker count of ``executor``
+            (default: the CPU count).
+        pendentes: Maximum borings in flight (default: twice the number
+            of workers).
+
+    Yields:
+        ResultadoSondagem for each boring, in input order.
+
+    Raises:
+        ValueError: If a method is unknown.
+    """
+    plano = _planejar_obra(cotas, metodos, tipos_estaca, diametro_referencia)
+
+    if executor is None and (max_workers is None or max_workers <= 1):
+        for nome, perfil in sondagens:
+            yield _calcular_sondagem(nome, perfil, plano)
+        return
+
+    if executor is not None:
+        trabalhadores = max_workers or os.cpu_count() or 1
+        yield from _em_ordem(
+            (
+                (
+                    nome,
+                    executor.submit(_calcular_sondagem, nome, perfil, plano),
+                )
+                for nome, perfil in sondagens
+            ),
+            pendentes or 2 * trabalhadores,
+        )
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_inicializar_obra,
+        initargs=(plano, None),
+    )
+    try:
+        yield from _em_ordem(
+            (
+                (nome, pool.submit(_calcular_sondagem, nome, perfil))
+                for nome, perfil in sondagens
+            ),
+            pendentes or 2 * max_workers,
+        )
+    finally:
+        # Also reached when the consumer stops early
+        pool.shutdown(cancel_futures=True)
+
+
+def _planejar_obra(
+    cotas: float | Iterable[float],
+    metodos: list[str] | None,
+    tipos_estaca: list[str] | None,
+    diametro_referencia: float,
+) -> '_PlanoObra':
+    """Validate the methods and choose the catalog piles of a site."""
+    from calculus_core.domain.method_registry import (
+        CalculationMethodRegistry,
+    )
+
+    if metodos is None:
+        metodos = CalculationMethodRegistry.list_ids()
+    for metodo in metodos:
+        # Unknown methods are a caller error, not a per-boring one
+        CalculationMethodRegistry.get(metodo)
+
+    if isinstance(cotas, (int, float)):
+        cotas = [cotas]
+    return _PlanoObra(
+        metodos=tuple(metodos),
+        estacas=tuple(
+            (
+                cota,
+                _estacas_representativas(
+                    tipos_estaca, cota, diametro_referencia
+                ),
+            )
+            for cota in cotas
+        ),
+    )
+
+
+def _em_ordem(
+    tarefas: Iterator[tuple[str, Any]], pendentes: int
+) -> Iterator[ResultadoSondagem]:
+    """Yield task results in submission order, keeping a bounded window."""
+    fila: deque[tuple[str, Any]] = deque()
+    for tarefa in tarefas:
+        fila.append(tarefa)
+        if len(fila) >= max(pendentes, 1):
+            yield _resultado_futuro(*fila.popleft())
+    while fila:
+        yield _resultado_futuro(*fila.popleft())
+
+
+def _resultado_futuro(nome: str, futuro: Any) -> ResultadoSondagem:
+    try:
+        return futuro.result()
+    except Exception as e:
+        # e.g. a worker died or the boring could not be pickled
+        return ResultadoSondagem(nome, erro=str(e))
+
+
+def _abrir_sondagens(
+    sondagens: Any,
+) -> tuple[list[str], dict[str, PerfilSPT], Any]:
+    """Return (names, in-memory profiles, repository) for a site."""
+    if hasattr(sondagens, 'names') and hasattr(sondagens, 'get'):
+        return list(sondagens.names()), {}, sondagens
+    if isinstance(sondagens, Mapping):
+        return list(sondagens), dict(sondagens), None
+    perfis: dict[str, PerfilSPT] = {}
+    for perfil in sondagens:
+        if perfil.nome_sondagem in perfis:
+            raise ValueError(f'Sondagem duplicada: {perfil.nome_sondagem}')
+        perfis[perfil.nome_sondagem] = perfil
+    return list(perfis), perfis, None
+
+
+def _coletar(
+    futuros: dict[Any, str],
+    concluir: Callable[[ResultadoSondagem], None],
+) -> None:
+    """Hand each boring to ``concluir`` as soon as its future is done."""
+    for futuro in as_completed(futuros):
+        concluir(_resultado_futuro(futuros[futuro], futuro))
+
+
+# Plan and repository installed in each worker process by _inicializar_obra
+_plano_trabalhador: _PlanoObra | None = None
+_repositorio_trabalhador: Any = None
+
+
+def _inicializar_obra(plano: _PlanoObra, repositorio: Any) -> None:
+    global _plano_trabalhador, _repositorio_trabalhador  # noqa: PLW0603
+    _plano_trabalhador = plano
+    _repositorio_trabalhador = repositorio
+
+
+def _calcular_sondagem(
+    nome: str,
+    perfil_spt: PerfilSPT | None = None,
+    plano: _PlanoObra | None = None,
+    repositorio: Any = None,
+) -> ResultadoSondagem:
+    """
+    Calculate one boring, turning any failure into its error.
+
+    The profile is given directly, as a loader to call, or (when None)
+    looked up by name in ``repositorio``.
+    """
+    from calculus_core.domain.method_registry import (
+        CalculationMethodRegistry,
+    )
+
+    if plano is None:
+        plano = _plano_trabalhador
+        repositorio = _repositorio_trabalhador
+    try:
+        if perfil_spt is None:
+            perfil_spt = repositorio.get(nome)
+        elif callable(perfil_spt):
+            perfil_spt = perfil_spt()
+        if not isinstance(perfil_spt, PerfilSPT):
+            raise ValueError(
+                f'Sondagem {nome} não é um perfil SPT '
+                f'({type(perfil_spt).__name__}).'
+            )
+        calculadoras = {
+            metodo: CalculationMethodRegistry.get_calculator_instance(metodo)
+            for metodo in plano.metodos
+        }
+        resultados: list[BatchResult] = []
+        for cota, estacas in plano.estacas:
+            for metodo in plano.metodos:
+                resultados.extend(
+                    _calcular_estacas(
+                        perfil_spt,
+                        metodo,
+                        calculadoras[metodo],
+                        cota,
+                        estacas,
+                    )
+                )
+        return ResultadoSondagem(nome, resultados)
+    except Exception as e:
+        return ResultadoSondagem(nome, erro=str(e))
@@ -0,0 +1,74 @@
+"""
+Lazy Package Exports
+
+Helpers for packages whose public names are imported on first access.
+
+A package ``__init__`` lists where each public name lives and installs the
+returned module-level ``__getattr__`` / ``__dir__`` (PEP 562). The defining
+module is imported only when one of its names is first used, and the value
+is then stored in the package namespace so later lookups are plain
+attribute access.
+
+Example:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {'.model': ('Estaca', 'PerfilSPT')},
+    )
+"""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, tuple[str, ...]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for a lazily exporting package.
+
+    Args:
+        package: The package ``__name__``.
+        exports: Module path (absolute, or relative to ``package``) to the
+            public names it defines.
+
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package.
+
+    Raises:
+        ValueError: If a name is exported by more than one module.
+    """
+    origem: dict[str, str] = {}
+    for modulo, nomes in exports.items():
+        for nome in nomes:
+            if nome in origem:
+                raise ValueError(f'Nome exportado em duplicidade: {nome}')
+            origem[nome] = modulo
+
+    def __getattr__(nome: str) -> Any:
+        namespace = sys.modules[package].__dict__
+        modulo = origem.get(nome)
+        if modulo is None and nome.startswith('__'):
+            raise AttributeError(
+                f'module {package!r} has no attribute {nome!r}'
+            )
+        if modulo is not None:
+            valor = getattr(importlib.import_module(modulo, package), nome)
+        else:
+            # Subpackages/submodules stay reachable as attributes
+            try:
+                valor = importlib.import_module(f'{package}.{nome}')
+            except ModuleNotFoundError as exc:
+                if exc.name != f'{package}.{nome}':
+                    raise
+                raise AttributeError(
+                    f'module {package!r} has no attribute {nome!r}'
+                ) from None
+        namespace[nome] = valor
+        return valor
+
+    def __dir__() -> list[str]:
+        namespace = sys.modules[package].__dict__
+        return sorted(set(namespace) | set(origem))
+
+    return __getattr__, __dir__
@@ -5,6 +5,8 @@ These tests verify that coefficient providers work correctly
 and implement the expected protocols.
 """
 
+import pickle
+
 import pytest
 
 from calculus_core.adapters.coefficients import (
@@ -13,6 +15,17 @@ from calculus_core.adapters.coefficients import (
     DecourtQuaresma1978Provider,
     Teixeira1996Provider,
 )
+from calculus_core.adapters.repository import (
+    ARCHIVE_EXTENSION,
+    ProfileArchive,
+    write_profile_archive,
+)
+from calculus_core.domain.model import PerfilSPT, PerfilSPTColunar
+from calculus_core.domain.soil_investigation import (
+    PerfilCPT,
+    PerfilCPTColunar,
+    SoilTestType,
+)
 
 # =============================================================================
 # AOKI-VELLOSO PROVIDER TESTS
@@ -165,3 +178,83 @@ class TestTeixeira1996Provider:
     def test_get_beta_invalid_estaca(self, provider):
         with pytest.raises(ValueError, match='inválido'):
             provider.get_beta('microestaca')
+
+
+# =============================================================================
+# PROFILE ARCHIVE TESTS
+# =============================================================================
+
+
+class TestProfileArchive:
+    """Round trip of SPT/CPT profiles through the mmap archive."""
+
+    @pytest.fixture
+    def perfis(self):
+        spt = PerfilSPT(nome_sondagem='SP-01', confiavel=False)
+        spt.adicionar_medidas(
+            [
+                (1.0, 3, 'argila_arenosa'),
+                (2.0, 8, 'solo_exotico_arquivo', 0.5),
+                (3.0, 15, 'areia'),
+            ]
+        )
+        fracionario = PerfilSPT.from_arrays(
+            [1.0, 2.0], [2.5, 7.0], ['silte', 'areia'], nome_sondagem='SP-02'
+        )
+        cpt = PerfilCPT.from_arrays(
+            [0.02, 0.04, 0.06],
+            [1.5, 2.0, 0.0],
+            [20.0, 30.0, 0.0],
+            u2=[None, 40.0, None],
+            nome_sondagem='CPT-01',
+        )
+        return [spt, fracionario, cpt]
+
+    @pytest.fixture
+    def arquivo(self, tmp_path, perfis):
+        caminho = tmp_path / f'obra{ARCHIVE_EXTENSION}'
+        assert write_profile_archive(caminho, iter(perfis)) == 3
+        with ProfileArchive(caminho) as arquivo:
+            yield arquivo
+
+    def test_round_trip(self, arquivo, perfis):
+        assert arquivo.names() == ['SP-01', 'SP-02', 'CPT-01']
+        assert len(arquivo) == 3
+        assert 'SP-02' in arquivo
+        for original in perfis:
+            lido = arquivo.get(original.nome_sondagem)
+            assert lido.medidas == original.medidas
+            assert lido.intervalo_padrao == original.intervalo_padrao
+        spt = arquivo.get('SP-01')
+        assert isinstance(spt, PerfilSPTColunar)
+        assert spt.confiavel is False
+        assert spt.impressao_digital == perfis[0].impressao_digital
+        assert isinstance(arquivo.get('CPT-01'), PerfilCPTColunar)
+        assert arquivo.test_type('CPT-01') == SoilTestType.CPT
+
+    def test_profiles_are_lazy_and_shared(self, arquivo):
+        assert arquivo.get('SP-01') is arquivo.get('SP-01')
+        assert [p.nome_sondagem for p in arquivo.profiles()] == [
+            'SP-01',
+            'SP-02',
+            'CPT-01',
+        ]
+        with pytest.raises(ValueError, match='não encontrada'):
+            arquivo.get('SP-99')
+
+    def test_pickles_as_path(self, arquivo):
+        copia = pickle.loads(pickle.dumps(arquivo))
+        try:
+            assert copia.get('SP-02').medidas == arquivo.get('SP-02').medidas
+        finally:
+            copia.close()
+
+    def test_rejects_invalid_files(self, tmp_path, perfis):
+        invalido = tmp_path / f'invalido{ARCHIVE_EXTENSION}'
+        invalido.write_bytes(b'nao e um arquivo de perfis' * 4)
+        with pytest.raises(ValueError, match='inválido'):
+            ProfileArchive(invalido)
+        with pytest.raises(ValueError, match='duplicada'):
+            write_profile_archive(
+                tmp_path / f'dup{ARCHIVE_EXTENSION}', perfis + perfis
+            )
@@ -9,15 +9,18 @@ import pytest
 
 from calculus_core.adapters.coefficients import (
     AokiVelloso1975Provider,
+    AokiVellosoLaprovitera1988Provider,
     DecourtQuaresma1978Provider,
     Teixeira1996Provider,
 )
 from calculus_core.domain.calculation import (
     AokiVellosoCalculator,
+    CacheLRU,
     DecourtQuaresmaCalculator,
+    MetodoCalculoMemoizado,
     TeixeiraCalculator,
 )
-from calculus_core.domain.model import Estaca, PerfilSPT
+from calculus_core.domain.model import Estaca, PerfilSPT, PerfilSPTColunar
 
 # =============================================================================
 # FIXTURES
@@ -112,6 +115,38 @@ class TestAokiVellosoCalculator:
         # Tip layer is at depth 6, N_SPT = 13
         assert np == 13
 
+    def test_calcular_curva_matches_calcular(
+        self, calculator, perfil_spt, estaca_circular
+    ):
+        curva = calculator.calcular_curva(perfil_spt, estaca_circular)
+        esperado = [
+            calculator.calcular(perfil_spt, estaca_circular.na_cota(cota))
+            for cota in range(1, calculator.cota_parada(perfil_spt) + 1)
+        ]
+        assert curva == esperado
+
+    def test_calcular_curva_laprovitera_unreliable_spt(self, estaca_circular):
+        calculator = AokiVellosoCalculator(
+            AokiVellosoLaprovitera1988Provider()
+        )
+        perfil = PerfilSPT(confiavel=False)
+        perfil.adicionar_medidas(
+            [
+                (1.0, 4, 'argila', 0.5),
+                (2.0, 5, 'argila_siltosa', 1.5),
+                (3.0, 7, 'silte_arenoso'),
+                (4.0, 12, 'areia_com_pedregulhos'),
+                (5.0, 18, 'areia'),
+                (6.0, 25, 'areia'),
+            ]
+        )
+        curva = calculator.calcular_curva(perfil, estaca_circular)
+        esperado = [
+            calculator.calcular(perfil, estaca_circular.na_cota(cota))
+            for cota in range(1, calculator.cota_parada(perfil) + 1)
+        ]
+        assert curva == esperado
+
 
 # =============================================================================
 # DECOURT-QUARESMA CALCULATOR TESTS
@@ -144,6 +179,38 @@ class TestDecourtQuaresmaCalculator:
         cota = calculator.cota_parada(perfil_spt)
         assert cota == 10
 
+    def test_calcular_curva_matches_calcular(
+        self, calculator, perfil_spt, estaca_circular
+    ):
+        curva = calculator.calcular_curva(perfil_spt, estaca_circular)
+        esperado = [
+            calculator.calcular(perfil_spt, estaca_circular.na_cota(cota))
+            for cota in range(1, calculator.cota_parada(perfil_spt) + 1)
+        ]
+        assert curva == esperado
+
+    def test_calcular_curva_fractional_profile(
+        self, calculator, estaca_circular
+    ):
+        # Layers off the integer grid force the interpolated Np fallback
+        perfil = PerfilSPT()
+        perfil.adicionar_medidas(
+            [
+                (0.5, 2, 'argila'),
+                (1.0, 3, 'argila'),
+                (2.5, 6, 'argila_arenosa'),
+                (3.0, 9, 'areia'),
+                (4.5, 14, 'areia'),
+                (5.0, 20, 'areia'),
+            ]
+        )
+        curva = calculator.calcular_curva(perfil, estaca_circular)
+        esperado = [
+            calculator.calcular(perfil, estaca_circular.na_cota(cota))
+            for cota in range(1, calculator.cota_parada(perfil) + 1)
+        ]
+        assert curva == esperado
+
     def test_calcular_rp_formula(self, calculator):
         # Rp = alpha * Np * K * Area
         rp = DecourtQuaresmaCalculator.calcular_rp(
@@ -190,6 +257,41 @@ class TestTeixeiraCalculator:
         expected = 300 * 15.0 * 0.09
         assert abs(rp - expected) < 0.001
 
+    def test_calcular_curva_matches_calcular(
+        self, calculator, perfil_spt, estaca_quadrada
+    ):
+        curva = calculator.calcular_curva(perfil_spt, estaca_quadrada)
+        esperado = [
+            calculator.calcular(perfil_spt, estaca_quadrada.na_cota(cota))
+            for cota in range(1, calculator.cota_parada(perfil_spt) + 1)
+        ]
+        assert curva == esperado
+
+    def test_np_curvas_match_scalar_for_several_diameters(self, calculator):
+        # Sparse layers leave some windows empty (interpolation fallback)
+        perfil = PerfilSPT()
+        perfil.adicionar_medidas(
+            [
+                (1.0, 3, 'argila'),
+                (2.0, 5, 'argila'),
+                (4.5, 12, 'areia_siltosa'),
+                (5.0, 18, 'areia'),
+                (8.0, 30, 'areia'),
+            ]
+        )
+        cotas = [1, 2, 3, 4, 5, 6, 7]
+        diametros = [0.1, 0.3, 0.5]
+
+        curvas = calculator.calcular_np_curvas(perfil, cotas, diametros)
+        for diametro in diametros:
+            assert curvas[diametro] == [
+                calculator.calcular_np(perfil, cota, diametro)
+                for cota in cotas
+            ]
+        assert calculator.calcular_nl_curva(perfil, cotas) == [
+            calculator.calcular_nl(perfil, cota) for cota in cotas
+        ]
+
     def test_calcular_carga_adm_uses_minimum(self, calculator):
         # Q_adm = min((Rp+Rl)/2, Rp/4 + Rl/1.5)
         Rp = 100
@@ -225,3 +327,153 @@ class TestCalculatorIntegration:
             resultado = calc.calcular(perfil_spt, estaca_circular)
             assert resultado.capacidade_carga > 0
             assert resultado.capacidade_carga_adm > 0
+
+    def test_columnar_profile_gives_same_curves(
+        self, perfil_spt, estaca_circular
+    ):
+        from calculus_core.bootstrap import create_calculator
+
+        colunar = PerfilSPTColunar.de_perfil(perfil_spt)
+        for metodo in (
+            'aoki_velloso_1975',
+            'decourt_quaresma_1978',
+            'teixeira_1996',
+        ):
+            calc = create_calculator(metodo)
+            assert calc.calcular_curva(
+                colunar, estaca_circular
+            ) == calc.calcular_curva(perfil_spt, estaca_circular)
+
+
+# =============================================================================
+# PREPARED PROFILE TESTS
+# =============================================================================
+
+
+class ContadorProvider:
+    """Wraps a provider and counts the coefficient lookups."""
+
+    def __init__(self, provider):
+        self._provider = provider
+        self.chamadas = 0
+
+    def get_k(self, *args):
+        self.chamadas += 1
+        return self._provider.get_k(*args)
+
+    def get_alpha(self, *args):
+        self.chamadas += 1
+        return self._provider.get_alpha(*args)
+
+    def get_f1_f2(self, *args):
+        return self._provider.get_f1_f2(*args)
+
+
+class TestPerfilPreparado:
+    """Tests for per-profile coefficient vectors."""
+
+    def test_coefficients_resolved_once_per_profile(
+        self, perfil_spt, estaca_circular
+    ):
+        provider = ContadorProvider(AokiVelloso1975Provider())
+        calculator = AokiVellosoCalculator(provider)
+
+        calculator.calcular(perfil_spt, estaca_circular)
+        chamadas = provider.chamadas
+        for cota in range(1, 11):
+            calculator.calcular(perfil_spt, estaca_circular.na_cota(cota))
+        assert provider.chamadas == chamadas
+
+    def test_prepared_profile_rebuilt_after_mutation(
+        self, perfil_spt, estaca_circular
+    ):
+        calculator = AokiVellosoCalculator(AokiVelloso1975Provider())
+        preparado = calculator.perfil_preparado(perfil_spt)
+        assert calculator.perfil_preparado(perfil_spt) is preparado
+
+        perfil_spt.adicionar_medida(12, 40, 'areia')
+        novo = calculator.perfil_preparado(perfil_spt)
+        assert novo is not preparado
+        assert len(novo.n_spt) == 12
+
+        resultado = calculator.calcular(
+            perfil_spt, estaca_circular.na_cota(11)
+        )
+        esperado = AokiVellosoCalculator(AokiVelloso1975Provider()).calcular(
+            perfil_spt, estaca_circular.na_cota(11)
+        )
+        assert resultado == esperado
+
+    def test_unsupported_soil_raises_only_when_used(self, estaca_circular):
+        perfil = PerfilSPT()
+        perfil.adicionar_medidas(
+            [
+                (1, 3, 'argila'),
+                (2, 5, 'argila'),
+                (3, 8, 'areia'),
+                (4, 12, 'turfa'),
+                (5, 20, 'areia'),
+                (6, 25, 'areia'),
+            ]
+        )
+        calculator = AokiVellosoCalculator(AokiVelloso1975Provider())
+        assert calculator.calcular(perfil, estaca_circular.na_cota(2))
+        # Tip on the unsupported layer
+        with pytest.raises(ValueError, match='turfa'):
+            calculator.calcular(perfil, estaca_circular.na_cota(3))
+        # Unsupported layer neither at the tip nor along the shaft
+        assert calculator.calcular(perfil, estaca_circular.na_cota(4))
+        # Unsupported layer along the shaft
+        with pytest.raises(ValueError, match='turfa'):
+            calculator.calcular(perfil, estaca_circular.na_cota(5))
+
+
+# =============================================================================
+# MEMOIZED CALCULATION TESTS
+# =============================================================================
+
+
+class TestMetodoCalculoMemoizado:
+    """Tests for the LRU result cache."""
+
+    def test_repeated_query_hits_cache(self, perfil_spt, estaca_circular):
+        calculator = AokiVellosoCalculator(AokiVelloso1975Provider())
+        memo = MetodoCalculoMemoizado(calculator, tamanho_maximo=8)
+
+        primeiro = memo.calcular(perfil_spt, estaca_circular)
+        assert memo.calcular(perfil_spt, estaca_circular) is primeiro
+        assert primeiro == calculator.calcular(perfil_spt, estaca_circular)
+        assert memo.calcular_curva(
+            perfil_spt, estaca_circular
+        ) == calculator.calcular_curva(perfil_spt, estaca_circular)
+
+        estatisticas = memo.cache.estatisticas()
+        assert (estatisticas.acertos, estatisticas.falhas) == (1, 2)
+
+    def test_mutation_invalidates(self, perfil_spt, estaca_circular):
+        memo = MetodoCalculoMemoizado(
+            AokiVellosoCalculator(AokiVelloso1975Provider())
+        )
+        antes = memo.calcular(perfil_spt, estaca_circular.na_cota(10))
+        perfil_spt.adicionar_medida(12, 50, 'areia')
+        depois = memo.calcular(perfil_spt, estaca_circular.na_cota(10))
+        assert depois is not antes
+        assert memo.cache.estatisticas().acertos == 0
+
+    def test_lru_eviction_and_ttl(self):
+        agora = [0.0]
+        cache = CacheLRU(tamanho_maximo=2, ttl=10, relogio=lambda: agora[0])
+        cache.obter('a', lambda: 1)
+        cache.obter('b', lambda: 2)
+        cache.obter('a', lambda: 0)  # hit, 'a' becomes most recent
+        cache.obter('c', lambda: 3)  # evicts 'b'
+        assert cache.obter('b', lambda: 20) == 20
+        agora[0] = 11.0
+        assert cache.obter('b', lambda: 200) == 200
+        estatisticas = cache.estatisticas()
+        assert estatisticas.acertos == 1
+        assert estatisticas.tamanho == 2
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match='positivo'):
+            CacheLRU(tamanho_maximo=0)
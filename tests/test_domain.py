@@ -5,12 +5,21 @@ Essential tests for the domain model entities and value objects.
 """
 
 import math
+import pickle
 
 import pytest
 
-from calculus_core.domain.model import Estaca, MedidaSPT, PerfilSPT
+from calculus_core.domain.model import (
+    PROFUNDIDADE_TOLERANCIA,
+    Estaca,
+    MedidaSPT,
+    PerfilSPT,
+    PerfilSPTColunar,
+)
+from calculus_core.domain.soil_types import TipoSoloCanonical
 from calculus_core.domain.value_objects import (
     CoeficienteSolo,
+    CurvaCapacidade,
     ResultadoCalculo,
     TipoSolo,
 )
@@ -65,6 +74,74 @@ class TestResultadoCalculo:
             resultado.cota = 10
 
 
+class TestCurvaCapacidade:
+    """Tests for the columnar CurvaCapacidade result."""
+
+    @pytest.fixture
+    def resultados(self):
+        return [
+            ResultadoCalculo(
+                cota=cota,
+                resistencia_ponta=10.0 * cota,
+                resistencia_lateral=5.0 * cota,
+                capacidade_carga=15.0 * cota,
+                capacidade_carga_adm=7.5 * cota,
+            )
+            for cota in range(1, 5)
+        ]
+
+    def test_rows_match_results(self, resultados):
+        curva = CurvaCapacidade.de_resultados(resultados)
+        assert len(curva) == 4
+        assert curva == resultados
+        assert curva[-1] == resultados[-1]
+        assert isinstance(curva[0].cota, int)
+        assert list(curva) == resultados
+
+    def test_slice_returns_curve(self, resultados):
+        curva = CurvaCapacidade.de_resultados(resultados)
+        parte = curva[1:3]
+        assert isinstance(parte, CurvaCapacidade)
+        assert parte == resultados[1:3]
+
+    def test_exports(self, resultados):
+        curva = CurvaCapacidade.de_resultados(resultados)
+        colunas = curva.to_dict_of_lists()
+        assert colunas['cota'] == [1, 2, 3, 4]
+        assert colunas['capacidade_carga'] == [15.0, 30.0, 45.0, 60.0]
+        assert curva.to_dicts() == [r.to_dict() for r in resultados]
+        buffers = curva.buffers()
+        assert buffers['resistencia_ponta'].tolist() == [
+            10.0,
+            20.0,
+            30.0,
+            40.0,
+        ]
+        assert buffers['cota'].readonly
+
+    def test_columns_are_read_only(self, resultados):
+        from array import array
+
+        cotas = array('d', [1, 2])
+        curva = CurvaCapacidade(cotas, [1.0, 2.0], [1.0, 2.0], [2, 4], [1, 2])
+        # Arrays passed in are copied, not adopted
+        cotas[0] = 0.5
+        assert curva[0].cota == 1
+        with pytest.raises(TypeError):
+            curva.cotas[0] = 0.5
+        assert curva.capacidade_carga.tolist() == [2.0, 4.0]
+        construida = CurvaCapacidade.de_resultados(resultados)
+        assert pickle.loads(pickle.dumps(construida)) == construida
+
+    def test_validates_columns(self):
+        with pytest.raises(ValueError, match='mesmo tamanho'):
+            CurvaCapacidade([1, 2], [1.0], [1.0], [2.0], [1.0])
+        with pytest.raises(ValueError, match='Cota deve ser >= 1'):
+            CurvaCapacidade([0], [1.0], [1.0], [2.0], [1.0])
+        with pytest.raises(ValueError, match='ponta não pode ser negativa'):
+            CurvaCapacidade([1], [-1.0], [1.0], [0.0], [0.0])
+
+
 class TestCoeficienteSolo:
     """Tests for CoeficienteSolo value object."""
 
@@ -118,6 +195,12 @@ class TestEstaca:
                 cota_assentamento=5,
             )
 
+    def test_chave_hashable(self):
+        estaca = Estaca('escavada', 'escavada', 'circular', 0.4, 5)
+        mesma = Estaca('escavada', 'escavada', 'circular', 0.4, 5)
+        assert {estaca.chave: 1}[mesma.chave] == 1
+        assert estaca.na_cota(6).chave != estaca.chave
+
 
 class TestMedidaSPT:
     """Tests for MedidaSPT value object."""
@@ -175,6 +258,114 @@ class TestPerfilSPT:
         media = perfil.obter_n_spt_intervalo(1.0, 4.0, 'media')
         assert media == 12.5  # (5+10+15+20) / 4
 
+    def test_obter_media_n_spt_intervalos_matches_scalar(self, perfil):
+        # Ascending, empty (interpolated), reversed and backtracking windows
+        intervalos = [
+            (0.5, 1.5),
+            (1.2, 1.8),
+            (1.0, 4.0),
+            (3.5, 2.0),
+            (2.5, 4.5),
+            (1.0, 2.0),
+        ]
+        assert perfil.obter_media_n_spt_intervalos(intervalos) == [
+            perfil.obter_n_spt_intervalo(inicio, fim, 'media')
+            for inicio, fim in intervalos
+        ]
+
+    def test_depth_index_matches_linear_scan(self):
+        perfil = PerfilSPT()
+        perfil.adicionar_medidas(
+            [
+                (0.5, 2, 'argila'),
+                (1.0, 5, 'argila'),
+                (1.001, 6, 'argila'),
+                (2.0, 10, 'areia'),
+                (2.0, 11, 'silte'),
+                (3.25, 15, 'areia'),
+            ]
+        )
+        medidas = perfil.medidas
+        consultas = [0.0, 0.5, 0.9995, 1.0, 1.0004, 1.001, 1.0012, 1.5]
+        consultas += [1.9991, 2.0, 2.0009, 2.625, 3.0, 3.2499, 3.25]
+        for prof in consultas:
+            exatas = [
+                m
+                for m in medidas
+                if abs(m.profundidade - prof) < PROFUNDIDADE_TOLERANCIA
+            ]
+            assert (prof in perfil) == bool(exatas)
+
+            arredondada = round(prof, 3)
+            esperada = next(
+                (
+                    m
+                    for m in medidas
+                    if abs(m.profundidade - arredondada)
+                    < PROFUNDIDADE_TOLERANCIA
+                ),
+                None,
+            ) or min(medidas, key=lambda m: abs(m.profundidade - arredondada))
+            assert perfil.obter_medida(prof, 'mais_proxima') is esperada
+
+    def test_from_arrays_matches_adicionar_medidas(self, perfil):
+        bulk = PerfilSPT.from_arrays(
+            [4.0, 2.0, 1.0, 3.0],
+            [20, 10, 5, 15],
+            ['areia', 'areia', 'argila', 'areia'],
+            nome_sondagem='SP-01',
+        )
+        assert bulk.medidas == perfil.medidas
+        assert bulk.obter_medida(2.0, 'exata').N_SPT == 10
+
+    def test_builder_keeps_insertion_order_for_equal_depths(self):
+        perfil = (
+            PerfilSPT.builder(intervalo_padrao=0.5)
+            .adicionar(2.0, 10, 'areia')
+            .estender([(1.0, 5, 'argila'), (2.0, 12, 'silte', 0.5)])
+            .construir()
+        )
+        assert perfil.intervalo_padrao == 0.5
+        assert [m.N_SPT for m in perfil] == [5, 10, 12]
+        assert perfil[2].espessura_camada == 0.5
+
+    def test_builder_is_single_use(self):
+        construtor = PerfilSPT.builder().adicionar(1.0, 5, 'argila')
+        construtor.construir()
+        with pytest.raises(ValueError, match='já construído'):
+            construtor.construir()
+
+    def test_from_arrays_rejects_invalid_rows(self):
+        with pytest.raises(ValueError, match='mesmo tamanho'):
+            PerfilSPT.from_arrays([1.0, 2.0], [5], ['argila', 'areia'])
+        with pytest.raises(ValueError, match='negativo'):
+            PerfilSPT.from_arrays([1.0], [-1], ['argila'])
+
+    def test_medidas_is_read_only_snapshot(self, perfil):
+        medidas = perfil.medidas
+        assert medidas == list(perfil)
+        assert medidas[-1].profundidade == 4.0
+        assert [m.N_SPT for m in medidas[1:3]] == [10, 15]
+        with pytest.raises(TypeError):
+            medidas[0] = medidas[1]
+        assert not hasattr(medidas, 'append')
+
+        perfil.adicionar_medida(2.5, 12, 'areia')
+        assert len(medidas) == 4
+        assert len(perfil.medidas) == 5
+
+    def test_depth_range_views(self, perfil):
+        assert [m.profundidade for m in perfil.medidas_entre(1.5, 3.0)] == [
+            2.0,
+            3.0,
+        ]
+        assert [m.profundidade for m in perfil.medidas_acima(3.0)] == [
+            1.0,
+            2.0,
+        ]
+        assert len(perfil.medidas_acima(1.0)) == 0
+        assert len(perfil.medidas_entre(1.2, 1.8)) == 0
+
     def test_iterar_profundidades(self):
         perfil = PerfilSPT(intervalo_padrao=0.5)
         perfil.adicionar_medidas(
@@ -189,3 +380,123 @@ class TestPerfilSPT:
     def test_impenetravel_beyond_profile(self, perfil):
         medida = perfil.obter_medida(5.0)
         assert medida.is_impenetravel
+
+
+class TestImpressaoDigital:
+    """Tests for the profile content fingerprint."""
+
+    @staticmethod
+    def _perfil(classe=PerfilSPT, nome='SP-01'):
+        return classe.from_arrays(
+            [1, 2, 3],
+            [4, 8, 12],
+            ['argila', 'areia', 'areia'],
+            nome_sondagem=nome,
+        )
+
+    def test_same_content_same_fingerprint(self):
+        a = self._perfil()
+        assert (
+            a.impressao_digital == self._perfil(nome='SP-02').impressao_digital
+        )
+        assert a.impressao_digital == (
+            self._perfil(PerfilSPTColunar).impressao_digital
+        )
+
+    def test_changes_after_mutation(self):
+        perfil = self._perfil()
+        antes = perfil.impressao_digital
+        perfil.adicionar_medida(4, 20, 'areia')
+        assert perfil.impressao_digital != antes
+        perfil.confiavel = False
+        assert perfil.impressao_digital != antes
+
+
+class TestPerfilSPTColunar:
+    """Tests for the columnar PerfilSPT backend."""
+
+    DADOS = [
+        (3.0, 15, 'areia', 0.5),
+        (1.0, 5, 'argila'),
+        (2.0, 10, 'areia'),
+        (4.0, 20, 'areia_com_pedregulhos'),
+    ]
+
+    @pytest.fixture
+    def perfis(self):
+        perfil = PerfilSPT(nome_sondagem='SP-01')
+        perfil.adicionar_medidas(self.DADOS)
+        colunar = PerfilSPTColunar(nome_sondagem='SP-01')
+        colunar.adicionar_medidas(self.DADOS)
+        return perfil, colunar
+
+    def test_same_api_as_list_backend(self, perfis):
+        perfil, colunar = perfis
+        assert len(colunar) == len(perfil)
+        assert colunar.medidas == perfil.medidas
+        assert list(colunar) == list(perfil)
+        assert colunar[-1] == perfil[-1]
+        assert 2.0 in colunar
+        assert 2.5 not in colunar
+        assert colunar.profundidades_disponiveis() == [1.0, 2.0, 3.0, 4.0]
+        for estrategia in ('mais_proxima', 'anterior', 'interpolar'):
+            for profundidade in (0.5, 1.0, 2.4, 3.6, 4.5):
+                assert colunar.obter_medida(
+                    profundidade, estrategia
+                ) == perfil.obter_medida(profundidade, estrategia)
+        assert colunar.obter_n_spt_intervalo(1.5, 3.5) == 12.5
+
+    def test_columns(self, perfis):
+        _, colunar = perfis
+        colunas = colunar.colunas()
+        assert list(colunas.profundidades) == [1.0, 2.0, 3.0, 4.0]
+        assert colunas.n_spt.typecode == 'q'
+        assert list(colunas.n_spt) == [5, 10, 15, 20]
+        assert colunas.codigos_solo[0] == TipoSoloCanonical.ARGILA.codigo
+        assert [colunas.tipo_solo(i) for i in range(len(colunas))] == [
+            'argila',
+            'areia',
+            'areia',
+            'areia_com_pedregulhos',
+        ]
+        assert math.isnan(colunas.espessuras[0])
+        assert colunas.espessuras[2] == 0.5
+        assert colunar[2].espessura_camada == 0.5
+
+    def test_adicionar_medida_keeps_order(self, perfis):
+        _, colunar = perfis
+        colunar.adicionar_medida(2.5, 12, 'silte')
+        assert colunar.profundidades_disponiveis() == [
+            1.0,
+            2.0,
+            2.5,
+            3.0,
+            4.0,
+        ]
+        assert colunar.obter_medida(2.5, 'exata').tipo_solo == 'silte'
+
+    def test_builder_builds_columnar_profile(self, perfis):
+        perfil, _ = perfis
+        colunar = PerfilSPTColunar.builder().estender(self.DADOS).construir()
+        assert isinstance(colunar, PerfilSPTColunar)
+        assert colunar.medidas == perfil.medidas
+
+    def test_de_perfil(self, perfis):
+        perfil, _ = perfis
+        colunar = PerfilSPTColunar.de_perfil(perfil)
+        assert colunar.nome_sondagem == perfil.nome_sondagem
+        assert colunar.medidas == perfil.medidas
+
+    def test_list_backend_columns_invalidated_on_mutation(self, perfis):
+        perfil, _ = perfis
+        assert len(perfil.colunas()) == 4
+        perfil.adicionar_medida(5.0, 30, 'areia')
+        assert len(perfil.colunas()) == 5
+
+    def test_para_numpy_shares_memory(self, perfis):
+        np = pytest.importorskip('numpy')
+        _, colunar = perfis
+        vetores = colunar.colunas().para_numpy()
+        assert vetores['n_spt'].dtype == np.int64
+        assert vetores['profundidades'].tolist() == [1.0, 2.0, 3.0, 4.0]
+        assert not vetores['n_spt'].flags.writeable
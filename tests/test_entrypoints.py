@@ -0,0 +1,420 @@
+"""
+Tests for the Entrypoints
+
+HTTP/JSON server (calculus-serve), headless batch CLI
+(calculus-core batch) and the table ingestion of the Streamlit app.
+"""
+
+import csv
+import http.client
+import json
+import threading
+
+import pytest
+
+from calculus_core.adapters.repository import (
+    ARCHIVE_EXTENSION,
+    write_profile_archive,
+)
+from calculus_core.entrypoints.batch import ler_sondagem_csv
+from calculus_core.entrypoints.cli import main
+from calculus_core.entrypoints.server import CalculusServer
+from calculus_core.service_layer import (
+    calcular_todos_metodos_todas_estacas,
+    serializar_resultados,
+)
+
+PERFIL = {
+    'nome_sondagem': 'SP-01',
+    'profundidades': list(range(1, 13)),
+    'n_spt': [3, 3, 5, 6, 8, 13, 17, 25, 27, 32, 36, 40],
+    'solos': ['argila_arenosa'] * 5 + ['areia_argilosa'] * 4 + ['areia'] * 3,
+}
+
+ESTACA = {
+    'tipo': 'pré_moldada',
+    'processo_construcao': 'deslocamento',
+    'formato': 'circular',
+    'secao_transversal': 0.3,
+}
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def servidor():
+    """Server on a free local port, shut down after the test."""
+    servidor = CalculusServer(('127.0.0.1', 0), janela=0)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    yield servidor
+    servidor.shutdown()
+    servidor.server_close()
+
+
+@pytest.fixture
+def conexao(servidor):
+    conexao = http.client.HTTPConnection(*servidor.server_address[:2])
+    yield conexao
+    conexao.close()
+
+
+def requisitar(conexao, metodo, caminho, corpo=None):
+    conexao.request(
+        metodo,
+        caminho,
+        body=None if corpo is None else json.dumps(corpo),
+        headers={'Content-Type': 'application/json'},
+    )
+    resposta = conexao.getresponse()
+    return resposta.status, json.loads(resposta.read())
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+
+class TestServidorHTTP:
+    """Routes answer JSON over one persistent connection."""
+
+    def test_keep_alive_routes(self, conexao):
+        assert requisitar(conexao, 'GET', '/saude') == (200, {'status': 'ok'})
+        status, metodos = requisitar(conexao, 'GET', '/metodos')
+        assert status == 200
+        assert 'aoki_velloso_1975' in {m['id'] for m in metodos}
+        status, perfis = requisitar(conexao, 'GET', '/catalogos/pre_moldada')
+        assert status == 200
+        assert perfis
+
+        status, resultado = requisitar(
+            conexao,
+            'POST',
+            '/calcular',
+            {
+                'metodo': 'aoki_velloso_1975',
+                'perfil': PERFIL,
+                'estaca': ESTACA,
+                'cota': 8,
+            },
+        )
+        assert status == 200
+        assert resultado['cota'] == 8
+        status, curva = requisitar(
+            conexao,
+            'POST',
+            '/calcular',
+            {
+                'metodo': 'aoki_velloso_1975',
+                'perfil': PERFIL,
+                'estaca': ESTACA,
+            },
+        )
+        assert status == 200
+        assert curva[7] == resultado
+
+    def test_batch_matches_service(self, conexao):
+        from calculus_core.domain.model import PerfilSPT
+
+        status, linhas = requisitar(
+            conexao,
+            'POST',
+            '/lote',
+            {'perfil': PERFIL, 'cota': 8, 'metodos': ['teixeira_1996']},
+        )
+        perfil = PerfilSPT.from_arrays(
+            PERFIL['profundidades'], PERFIL['n_spt'], PERFIL['solos']
+        )
+        assert status == 200
+        assert linhas == serializar_resultados(
+            calcular_todos_metodos_todas_estacas(
+                perfil, 8, metodos=['teixeira_1996']
+            )
+        )
+
+    def test_errors_keep_connection_usable(self, conexao):
+        status, corpo = requisitar(conexao, 'GET', '/inexistente')
+        assert status == 404
+        status, corpo = requisitar(
+            conexao, 'POST', '/calcular', {'perfil': PERFIL}
+        )
+        assert status == 400
+        assert 'estaca' in corpo['erro']
+        status, corpo = requisitar(
+            conexao,
+            'POST',
+            '/calcular',
+            {
+                'metodo': 'inexistente',
+                'perfil': PERFIL,
+                'estaca': ESTACA,
+                'cota': 8,
+            },
+        )
+        assert status == 400
+        assert 'não encontrado' in corpo['erro']
+        assert requisitar(conexao, 'GET', '/saude')[0] == 200
+
+    @pytest.mark.parametrize(
+        ('rota', 'corpo', 'mensagem'),
+        [
+            ('/calcular', {'metodo': 5, 'estaca': ESTACA}, 'metodo'),
+            ('/lote', {'cota': '8'}, 'cota'),
+            ('/lote', {'cota': 8, 'metodos': 'teixeira_1996'}, 'metodos'),
+            ('/lote', {'cota': 8, 'tipos_estaca': [1]}, 'tipos_estaca'),
+            ('/obra', {'cotas': [5, '8']}, 'cotas'),
+            ('/obra', {'cotas': 8, 'sondagens': [5]}, 'Perfil'),
+        ],
+    )
+    def test_invalid_fields_are_rejected(self, conexao, rota, corpo, mensagem):
+        corpo = {'perfil': PERFIL, 'sondagens': [PERFIL], **corpo}
+        status, resposta = requisitar(conexao, 'POST', rota, corpo)
+        assert status == 400
+        assert mensagem in resposta['erro']
+
+    def test_negative_content_length_is_rejected(self, servidor):
+        # Without the check the server would wait for the connection to
+        # close; the timeout turns that into a failure
+        conexao = http.client.HTTPConnection(
+            *servidor.server_address[:2], timeout=5
+        )
+        try:
+            conexao.putrequest('POST', '/calcular')
+            conexao.putheader('Content-Length', '-1')
+            conexao.endheaders()
+            resposta = conexao.getresponse()
+            assert resposta.status == 400
+            assert 'Content-Length' in json.loads(resposta.read())['erro']
+        finally:
+            conexao.close()
+
+    def test_catalog_type_is_unquoted(self, conexao):
+        status, perfis = requisitar(
+            conexao, 'GET', '/catalogos/pr%C3%A9_moldada'
+        )
+        assert status == 200
+        assert (
+            perfis == requisitar(conexao, 'GET', '/catalogos/pre_moldada')[1]
+        )
+
+
+# =============================================================================
+# BATCH CLI
+# =============================================================================
+
+
+@pytest.fixture
+def pasta_sondagens(tmp_path):
+    """One SPT (semicolon, decimal comma), one CPT and one invalid file."""
+    pasta = tmp_path / 'sondagens'
+    pasta.mkdir()
+    linhas = ['Profundidade (m);N_SPT;Tipo de Solo']
+    for prof, n, solo in zip(
+        PERFIL['profundidades'], PERFIL['n_spt'], PERFIL['solos']
+    ):
+        linhas.append(f'{prof},0;{n};{solo}')
+    (pasta / 'SP-01.csv').write_text('\n'.join(linhas), encoding='utf-8')
+    cpt = ['prof,qc,fs'] + [
+        f'{i * 0.2:.1f},{2 + i * 0.1:.2f},{20 + i}' for i in range(1, 61)
+    ]
+    (pasta / 'CPT-01.csv').write_text('\n'.join(cpt), encoding='utf-8')
+    (pasta / 'RUIM.csv').write_text('a,b\n1,2\n', encoding='utf-8')
+    return pasta
+
+
+def executar_cli(argv):
+    with pytest.raises(SystemExit) as saida:
+        main(argv)
+    return saida.value.code
+
+
+class TestBatchCLI:
+    """calculus-core batch streams results and reports failures."""
+
+    def test_reads_spt_csv(self, pasta_sondagens):
+        perfil = ler_sondagem_csv(pasta_sondagens / 'SP-01.csv')
+        assert perfil.nome_sondagem == 'SP-01'
+        assert [m.N_SPT for m in perfil.medidas] == PERFIL['n_spt']
+
+    def test_partial_failure_exit_status(self, pasta_sondagens, tmp_path):
+        saida = tmp_path / 'resultados.csv'
+        codigo = executar_cli(
+            [
+                'batch',
+                str(pasta_sondagens),
+                '--cotas',
+                '5',
+                '8',
+                '--metodos',
+                'aoki_velloso_1975',
+                '--estacas',
+                'pre_moldada',
+                '--workers',
+                '2',
+                '--saida',
+                str(saida),
+            ]
+        )
+        assert codigo == 1
+        with open(saida, newline='', encoding='utf-8') as arquivo:
+            linhas = list(csv.DictReader(arquivo))
+        assert [r['sondagem'] for r in linhas] == [
+            'CPT-01',
+            'CPT-01',
+            'RUIM',
+            'SP-01',
+            'SP-01',
+        ]
+        assert 'colunas não reconhecidas' in linhas[2]['erro']
+        assert float(linhas[4]['capacidade_carga']) > 0
+
+    def test_manifest_to_jsonl(self, pasta_sondagens, tmp_path):
+        manifesto = pasta_sondagens / 'obra.lst'
+        manifesto.write_text('# obra\nSP-01.csv\n', encoding='utf-8')
+        saida = tmp_path / 'resultados.jsonl'
+        codigo = executar_cli(
+            [
+                'batch',
+                str(manifesto),
+                '--cotas',
+                '8',
+                '--metodos',
+                'teixeira_1996',
+                '--saida',
+                str(saida),
+            ]
+        )
+        assert codigo == 0
+        linhas = [
+            json.loads(linha) for linha in saida.read_text().splitlines()
+        ]
+        assert linhas
+        assert {r['sondagem'] for r in linhas} == {'SP-01'}
+
+    def test_reads_profile_archives(self, pasta_sondagens, tmp_path):
+        perfil = ler_sondagem_csv(pasta_sondagens / 'SP-01.csv')
+        perfil.nome_sondagem = 'SP-02'
+        pasta = tmp_path / 'arquivos'
+        pasta.mkdir()
+        write_profile_archive(pasta / f'obra{ARCHIVE_EXTENSION}', [perfil])
+        saida = tmp_path / 'resultados.jsonl'
+        codigo = executar_cli(
+            [
+                'batch',
+                str(pasta),
+                '--cotas',
+                '8',
+                '--metodos',
+                'teixeira_1996',
+                '--saida',
+                str(saida),
+            ]
+        )
+        assert codigo == 0
+        linhas = [
+            json.loads(linha) for linha in saida.read_text().splitlines()
+        ]
+        assert linhas
+        assert {r['sondagem'] for r in linhas} == {'SP-02'}
+
+    def test_usage_errors(self, tmp_path):
+        assert executar_cli(['batch', str(tmp_path), '--cotas', '8']) == 2
+        assert (
+            executar_cli(
+                ['batch', str(tmp_path / 'x'), '--cotas', '8', '--saida', '-']
+            )
+            == 2
+        )
+
+
+# =============================================================================
+# STREAMLIT TABLE INGESTION
+# =============================================================================
+
+
+@pytest.fixture
+def ingestao():
+    """Ingestion module (needs the optional pandas dependency)."""
+    pytest.importorskip('pandas')
+    from calculus_core.entrypoints.streamlit_app import ingestao
+
+    return ingestao
+
+
+class TestIngestaoTabelas:
+    """Tables are validated in bulk and built with one constructor call."""
+
+    def test_spt_table(self, ingestao):
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                'prof': ['2,0', '1.0', None],
+                'n_spt': [8, 4, None],
+                'solo': ['Areia', 'argila_siltosa', None],
+            }
+        )
+        resultado = ingestao.importar_spt(
+            df, 'prof', 'n_spt', 'solo', nome_sondagem='SP-01'
+        )
+        assert resultado.sucesso
+        assert [
+            (m.profundidade, m.N_SPT, m.tipo_solo)
+            for m in resultado.perfil.medidas
+        ] == [(1.0, 4, 'argila_siltosa'), (2.0, 8, 'areia')]
+
+    def test_spt_row_errors_in_one_pass(self, ingestao):
+        import pandas as pd
+
+        df = pd.DataFrame(
+            {
+                'prof': [1.0, -2.0, 'x', 4.0],
+                'n_spt': [4, 5.5, 6, None],
+                'solo': ['Areia', 'Areia', 'Turfa', 'Areia'],
+            }
+        )
+        resultado = ingestao.importar_spt(df, 'prof', 'n_spt', 'solo')
+        assert not resultado.sucesso
+        assert [str(erro) for erro in resultado.erros] == [
+            'Linha 2 (prof): Profundidade não pode ser negativa.',
+            'Linha 2 (n_spt): N_SPT deve ser inteiro: 5.5',
+            "Linha 3 (prof): Valor inválido: 'x'",
+            "Linha 3 (solo): Tipo de solo inválido: 'Turfa'",
+            'Linha 4 (n_spt): Valor ausente.',
+        ]
+        fallback = ingestao.importar_spt(
+            df.iloc[[0, 2]].assign(prof=[1.0, 3.0]),
+            'prof',
+            'n_spt',
+            'solo',
+            solo_desconhecido='br_solo_residual_geral',
+        )
+        assert fallback.perfil.obter_medida(3.0).tipo_solo == (
+            'br_solo_residual_geral'
+        )
+
+    def test_cpt_table(self, ingestao):
+        import pandas as pd
+
+        from calculus_core.domain.soil_investigation import PerfilCPTColunar
+
+        df = pd.DataFrame(
+            {
+                'prof': [0.4, 0.2, 0.6],
+                'qc': [2.0, 1.5, -1.0],
+                'fs': [15, 10, 20],
+            }
+        )
+        resultado = ingestao.importar_cpt(df, 'prof', 'qc', 'fs')
+        assert [str(erro) for erro in resultado.erros] == [
+            'Linha 3 (qc): qc não pode ser negativo.'
+        ]
+        resultado = ingestao.importar_cpt(df.iloc[:2], 'prof', 'qc', 'fs')
+        assert isinstance(resultado.perfil, PerfilCPTColunar)
+        assert list(resultado.perfil.colunas().profundidades) == [0.2, 0.4]
+
+        with pytest.raises(ValueError, match='Coluna não encontrada'):
+            ingestao.importar_cpt(df, 'prof', 'qc', 'u2')
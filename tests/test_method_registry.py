@@ -4,10 +4,22 @@ Method Registry Tests
 Essential tests for the calculation method registry.
 """
 
+import os
+import subprocess
+import sys
+import types
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
 import pytest
 
+import calculus_core
+from calculus_core.domain import method_registry
+from calculus_core.domain.calculation import TeixeiraCalculator
 from calculus_core.domain.method_registry import (
+    CalculationMethodInfo,
     CalculationMethodRegistry,
+    LazyCalculatorFactory,
     get_calculator,
     list_available_methods,
 )
@@ -52,3 +64,151 @@ class TestConvenienceFunctions:
         methods = list_available_methods()
         assert len(methods) >= 4
         assert all('id' in m for m in methods)
+
+
+class TestInstanciaCompartilhada:
+    """Tests for the shared calculator instances used by batches."""
+
+    def test_calculator_instance_is_shared(self):
+        a = CalculationMethodRegistry.get_calculator_instance('teixeira_1996')
+        b = CalculationMethodRegistry.get_calculator_instance('teixeira_1996')
+        assert a is b
+
+    def test_instance_dropped_on_registration(self):
+        calc = CalculationMethodRegistry.get_calculator_instance(
+            'teixeira_1996'
+        )
+        info = CalculationMethodRegistry.get('teixeira_1996')
+        CalculationMethodRegistry.register(info)
+        assert (
+            CalculationMethodRegistry.get_calculator_instance('teixeira_1996')
+            is not calc
+        )
+
+
+class TestCarregamentoSobDemanda:
+    """Importing the package defers calculators, catalogs and registry."""
+
+    @staticmethod
+    def _executar(codigo):
+        raiz = str(Path(calculus_core.__file__).parent.parent)
+        ambiente = {**os.environ, 'PYTHONPATH': raiz}
+        saida = subprocess.run(
+            [sys.executable, '-c', codigo],
+            capture_output=True,
+            text=True,
+            env=ambiente,
+            check=True,
+        )
+        return saida.stdout.split()
+
+    def test_package_import_is_lightweight(self):
+        carregados = self._executar(
+            'import sys, calculus_core\n'
+            'print(*sorted(m for m in sys.modules if "calculus" in m))'
+        )
+        assert 'calculus_core.domain.method_registry' not in carregados
+        assert 'calculus_core.domain.pile_catalogs' not in carregados
+        assert 'calculus_core.domain.calculation' not in carregados
+
+    def test_registry_populated_on_first_use(self):
+        saida = self._executar(
+            'import sys\n'
+            'from calculus_core.domain import method_registry as m\n'
+            'R = m.CalculationMethodRegistry\n'
+            'print(len(R._methods),'
+            ' "calculus_core.adapters.coefficients" in sys.modules)\n'
+            'print(len(R.list_ids()))'
+        )
+        assert saida == ['0', 'False', '4']
+
+    def test_lazy_names_resolve(self):
+        for nome in calculus_core.__all__:
+            assert getattr(calculus_core, nome) is not None
+        assert set(calculus_core.__all__) <= set(dir(calculus_core))
+        with pytest.raises(AttributeError):
+            calculus_core.nao_existe
+
+
+class TestPluginsEntryPoints:
+    """Methods discovered through the calculus_core.methods group."""
+
+    @pytest.fixture
+    def plugin(self, monkeypatch):
+        chamadas = {'metadados': 0, 'fabrica': 0}
+
+        def criar():
+            chamadas['fabrica'] += 1
+            return get_calculator('teixeira_1996')
+
+        def metadados():
+            chamadas['metadados'] += 1
+            return CalculationMethodInfo(
+                id='plugin_teste_2024',
+                name='Plugin de Teste (2024)',
+                version='2024',
+                description='Método de teste.',
+                reference='Teste.',
+                authors=['Teste'],
+                supported_pile_types=['all'],
+                supported_soil_types=['all'],
+                calculator_factory='plugin_ficticio:criar',
+            )
+
+        modulo = types.ModuleType('plugin_ficticio')
+        modulo.criar = criar
+        modulo.metadados = metadados
+        monkeypatch.setitem(sys.modules, 'plugin_ficticio', modulo)
+        pontos = [
+            EntryPoint(
+                'plugin_teste_2024',
+                'plugin_ficticio:metadados',
+                method_registry.ENTRY_POINT_GROUP,
+            ),
+            EntryPoint(
+                'plugin_quebrado',
+                'modulo_inexistente_xyz:INFO',
+                method_registry.ENTRY_POINT_GROUP,
+            ),
+            EntryPoint(
+                'teixeira_1996',
+                'plugin_ficticio:metadados',
+                method_registry.ENTRY_POINT_GROUP,
+            ),
+        ]
+        monkeypatch.setattr(
+            method_registry, 'entry_points', lambda group: pontos
+        )
+        yield chamadas
+        for nome in ('plugin_teste_2024', 'plugin_quebrado'):
+            CalculationMethodRegistry.unregister(nome)
+
+    def test_discovery_defers_loading(self, plugin):
+        novos = CalculationMethodRegistry.discover_plugins()
+        assert novos == ['plugin_teste_2024', 'plugin_quebrado']
+        assert CalculationMethodRegistry.is_registered('plugin_teste_2024')
+        assert 'plugin_teste_2024' in CalculationMethodRegistry.list_ids()
+        assert plugin == {'metadados': 0, 'fabrica': 0}
+
+        info = CalculationMethodRegistry.get('plugin_teste_2024')
+        assert isinstance(info.calculator_factory, LazyCalculatorFactory)
+        assert plugin == {'metadados': 1, 'fabrica': 0}
+
+        calc = CalculationMethodRegistry.create_calculator('plugin_teste_2024')
+        assert isinstance(calc, TeixeiraCalculator)
+        assert plugin == {'metadados': 1, 'fabrica': 1}
+
+    def test_builtin_wins_and_broken_plugin_is_skipped(self, plugin):
+        CalculationMethodRegistry.discover_plugins()
+        infos = CalculationMethodRegistry.list_all()
+        assert 'plugin_quebrado' not in [m.id for m in infos]
+        assert (
+            CalculationMethodRegistry.get('teixeira_1996').name
+            == 'Teixeira (1996)'
+        )
+        with pytest.raises(ValueError, match='não encontrado'):
+            CalculationMethodRegistry.get('plugin_quebrado')
+
+    def test_invalid_factory_path(self):
+        with pytest.raises(ValueError, match='modulo:atributo'):
+            LazyCalculatorFactory('sem_separador')
@@ -12,8 +12,14 @@ from calculus_core.domain.pile_catalogs import (
     CATALOGO_HELICE_CONTINUA,
     CATALOGO_PRE_MOLDADAS,
     CATALOGO_RAIZ,
+    CATALOGOS,
+    buscar_perfil_por_diametro,
+    diametro_efetivo,
+    listar_perfis_por_tipo,
     listar_tipos_estaca,
+    obter_indice_diametros,
     obter_perfil,
+    perfil_mais_proximo,
     resumo_catalogos,
 )
 from calculus_core.domain.pile_types import EstacaFactory
@@ -79,3 +85,55 @@ class TestCatalogUtilities:
         assert len(resumo) >= 6
         for tipo, perfis in resumo.items():
             assert len(perfis) >= 1
+
+
+class TestIndiceDiametros:
+    """Tests for the sorted per-type diameter index."""
+
+    @staticmethod
+    def _varredura_linear(tipo, diametro):
+        melhor, menor_diff = None, float('inf')
+        for nome, perfil in CATALOGOS[tipo].items():
+            d = diametro_efetivo(perfil)
+            if d is not None and abs(d - diametro) < menor_diff:
+                melhor, menor_diff = nome, abs(d - diametro)
+        return melhor
+
+    @pytest.mark.parametrize('tipo', sorted(CATALOGOS))
+    def test_nearest_matches_linear_scan(self, tipo):
+        for milimetros in range(0, 1500, 5):
+            diametro = milimetros / 1000
+            assert perfil_mais_proximo(
+                tipo, diametro
+            ) == self._varredura_linear(tipo, diametro)
+
+    def test_aliases(self):
+        assert perfil_mais_proximo('Hélice', 0.5) == 'HELICE_500'
+        assert listar_perfis_por_tipo('CFA') == list(CATALOGO_HELICE_CONTINUA)
+        assert obter_perfil('ômega', 'OMEGA_310').diametro == 0.31
+
+    def test_spelling_variants_are_not_stored(self):
+        from calculus_core.domain import pile_catalogs
+
+        tamanho = len(pile_catalogs._TIPOS_CATALOGO)
+        for grafia in ('Pre-Moldada', 'PRE moldada', 'pre-MOLDADA'):
+            assert listar_perfis_por_tipo(grafia) == list(
+                CATALOGO_PRE_MOLDADAS
+            )
+        assert len(pile_catalogs._TIPOS_CATALOGO) == tamanho
+
+    def test_range_query(self):
+        nomes = obter_indice_diametros('escavada').no_intervalo(0.5, 0.8)
+        diametros = [CATALOGO_ESCAVADAS[n].diametro for n in nomes]
+        assert diametros == sorted(diametros)
+        assert all(0.5 <= d <= 0.8 for d in diametros)
+
+    def test_buscar_por_diametro(self):
+        # Two 800 mm profiles: the first in the catalog wins
+        perfil = buscar_perfil_por_diametro('escavada', 0.79)
+        assert perfil is CATALOGO_ESCAVADAS['ESCAVADA_800_REV']
+        assert buscar_perfil_por_diametro('escavada', 5.0) is None
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError, match='não encontrado'):
+            perfil_mais_proximo('tubulao', 0.5)
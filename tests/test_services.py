@@ -0,0 +1,498 @@
+"""
+Tests for the Service Layer
+
+Batch calculation APIs over the registered methods and pile catalogs.
+"""
+
+import asyncio
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import pytest
+
+from calculus_core.adapters.repository import (
+    ARCHIVE_EXTENSION,
+    write_profile_archive,
+)
+from calculus_core.bootstrap import (
+    create_async_calculation_service,
+    create_calculation_service,
+)
+from calculus_core.domain.method_registry import CalculationMethodRegistry
+from calculus_core.domain.model import Estaca, PerfilSPT, PerfilSPTColunar
+from calculus_core.domain.soil_investigation import PerfilCPT
+from calculus_core.service_layer import (
+    AsyncCalculationService,
+    CalculationCoalescer,
+    CalculationRequest,
+    calcular_obra,
+    calcular_todos_metodos_todas_estacas,
+    calcular_todos_metodos_uma_estaca,
+    iterar_obra,
+)
+
+METODOS_NATIVOS = [
+    'aoki_velloso_1975',
+    'aoki_velloso_laprovitera_1988',
+    'decourt_quaresma_1978',
+    'teixeira_1996',
+]
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def perfil_spt():
+    """SPT profile deep enough for every catalog pile at cota 8."""
+    return PerfilSPT.from_arrays(
+        list(range(1, 13)),
+        [3, 3, 5, 6, 8, 13, 17, 25, 27, 32, 36, 40],
+        ['argila_arenosa'] * 5 + ['areia_argilosa'] * 4 + ['areia'] * 3,
+        nome_sondagem='SP-01',
+    )
+
+
+# =============================================================================
+# PARALLEL BATCH
+# =============================================================================
+
+
+class TestCalculoParalelo:
+    """Process/executor execution keeps the sequential results."""
+
+    def test_process_pool_matches_sequential(self, perfil_spt):
+        sequencial = calcular_todos_metodos_todas_estacas(
+            perfil_spt, 8, metodos=METODOS_NATIVOS
+        )
+        paralelo = calcular_todos_metodos_todas_estacas(
+            perfil_spt, 8, metodos=METODOS_NATIVOS, max_workers=2
+        )
+        assert paralelo == sequencial
+
+    def test_external_executor_matches_sequential(self, perfil_spt):
+        metodos = ['aoki_velloso_1975', 'teixeira_1996']
+        sequencial = calcular_todos_metodos_todas_estacas(
+            perfil_spt, 8, metodos=metodos
+        )
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            paralelo = calcular_todos_metodos_todas_estacas(
+                perfil_spt, 8, metodos=metodos, executor=executor
+            )
+        assert [(r.metodo, r.estaca) for r in paralelo] == [
+            (r.metodo, r.estaca) for r in sequencial
+        ]
+        assert paralelo == sequencial
+
+    def test_external_executor_chunks_per_worker(self, perfil_spt):
+        submetidos = []
+
+        class ExecutorContador(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                submetidos.append(args[0])
+                return super().submit(*args, **kwargs)
+
+        with ExecutorContador(max_workers=4) as executor:
+            calcular_todos_metodos_todas_estacas(
+                perfil_spt,
+                8,
+                metodos=['teixeira_1996'],
+                executor=executor,
+                max_workers=3,
+            )
+        assert len(submetidos) == 3
+
+    def test_unknown_method_raises(self, perfil_spt):
+        with pytest.raises(ValueError, match='não encontrado'):
+            calcular_todos_metodos_todas_estacas(
+                perfil_spt, 8, metodos=['inexistente'], max_workers=2
+            )
+
+    def test_unsupported_pile_keeps_method_message(self):
+        # Teixeira has no hélice contínua coefficients, but its own error
+        # names the unsupported soil first; batches must report that
+        perfil = PerfilSPT.from_arrays(
+            [1, 2, 3, 4], [5, 8, 10, 12], ['turfa'] * 4
+        )
+        estaca = Estaca('hélice_contínua', 'escavada', 'circular', 0.4, 3)
+        calc = CalculationMethodRegistry.create_calculator('teixeira_1996')
+        with pytest.raises(ValueError, match='solo') as erro:
+            calc.calcular(perfil, estaca)
+        [resultado] = [
+            r
+            for r in calcular_todos_metodos_uma_estaca(perfil, estaca)
+            if r.metodo == 'teixeira_1996'
+        ]
+        assert resultado.erro == str(erro.value)
+
+    def test_columnar_profile_pickles_soil_names(self):
+        perfil = PerfilSPTColunar.from_arrays(
+            [1, 2], [4, 9], ['solo_exotico_de_teste', 'argila']
+        )
+        copia = pickle.loads(pickle.dumps(perfil))
+        assert [m.tipo_solo for m in copia.medidas] == [
+            'solo_exotico_de_teste',
+            'argila',
+        ]
+
+
+# =============================================================================
+# SITE (MULTI-BORING) BATCH
+# =============================================================================
+
+
+@pytest.fixture
+def sondagens(perfil_spt):
+    """Three borings; SP-03 is shallower than the others."""
+    sp02 = PerfilSPT.from_arrays(
+        list(range(1, 13)),
+        [4, 5, 5, 7, 9, 12, 15, 22, 30, 33, 35, 41],
+        ['argila_arenosa'] * 4 + ['areia'] * 8,
+        nome_sondagem='SP-02',
+    )
+    sp03 = PerfilSPT.from_arrays(
+        list(range(1, 11)),
+        [2, 3, 4, 6, 9, 12, 18, 24, 30, 35],
+        ['areia_argilosa'] * 10,
+        nome_sondagem='SP-03',
+    )
+    return [perfil_spt, sp02, sp03]
+
+
+class TestCalculoObra:
+    """calcular_obra runs the full matrix for every boring of a site."""
+
+    def test_matches_per_boring_batch(self, sondagens):
+        obra = calcular_obra(sondagens, [7, 8], metodos=METODOS_NATIVOS)
+        assert list(obra) == ['SP-01', 'SP-02', 'SP-03']
+        for perfil in sondagens:
+            esperado = [
+                r
+                for cota in (7, 8)
+                for r in calcular_todos_metodos_todas_estacas(
+                    perfil, cota, metodos=METODOS_NATIVOS
+                )
+            ]
+            assert obra[perfil.nome_sondagem].resultados == esperado
+        assert obra.falhas == {}
+
+    def test_process_pool_matches_sequential(self, sondagens):
+        sequencial = calcular_obra(sondagens, 8, metodos=METODOS_NATIVOS)
+        paralelo = calcular_obra(
+            sondagens, 8, metodos=METODOS_NATIVOS, max_workers=2
+        )
+        assert dict(paralelo) == dict(sequencial)
+
+    def test_failed_boring_does_not_abort(self, sondagens):
+        obra_ruim = {
+            'SP-01': sondagens[0],
+            'CPT-01': PerfilCPT(nome_sondagem='CPT-01'),
+            'SP-02': sondagens[1],
+        }
+        progresso = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            obra = calcular_obra(
+                obra_ruim,
+                8,
+                metodos=['aoki_velloso_1975'],
+                executor=executor,
+                progresso=progresso.append,
+            )
+        assert list(obra) == ['SP-01', 'CPT-01', 'SP-02']
+        assert list(obra.falhas) == ['CPT-01']
+        assert obra['SP-02'].sucesso
+        assert obra['SP-02'].resultados
+        assert sorted(p.concluidas for p in progresso) == [1, 2, 3]
+        assert {p.total for p in progresso} == {3}
+        assert [p.sondagem for p in progresso if p.erro] == ['CPT-01']
+
+        linhas = obra.serializar()
+        falha = [r for r in linhas if r['sondagem'] == 'CPT-01']
+        assert len(falha) == 1
+        assert falha[0]['capacidade_carga'] is None
+        assert 'não é um perfil SPT' in falha[0]['erro']
+
+    def test_loads_borings_from_archive(self, sondagens, tmp_path):
+        from calculus_core.adapters.repository import ProfileArchive
+
+        caminho = tmp_path / f'obra{ARCHIVE_EXTENSION}'
+        write_profile_archive(caminho, sondagens)
+        esperado = calcular_obra(sondagens, 8, metodos=['teixeira_1996'])
+        with ProfileArchive(caminho) as arquivo:
+            obra = calcular_obra(
+                arquivo, 8, metodos=['teixeira_1996'], max_workers=2
+            )
+        assert dict(obra) == dict(esperado)
+
+    def test_stream_is_ordered_and_bounded(self, sondagens):
+        lidas = []
+
+        def fonte():
+            for perfil in sondagens * 3:
+                lidas.append(perfil.nome_sondagem)
+                yield perfil.nome_sondagem, perfil
+
+        esperado = calcular_obra(sondagens, 8, metodos=['teixeira_1996'])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fluxo = iterar_obra(
+                fonte(),
+                8,
+                metodos=['teixeira_1996'],
+                executor=executor,
+                pendentes=2,
+            )
+            primeiro = next(fluxo)
+            # Only the window has been read from the source
+            assert len(lidas) == 2
+            resultados = [primeiro, *fluxo]
+        assert [r.sondagem for r in resultados] == lidas
+        assert resultados[:3] == list(esperado.values())
+
+    def test_duplicate_and_unknown_raise(self, sondagens):
+        with pytest.raises(ValueError, match='duplicada'):
+            calcular_obra(
+                [sondagens[0], sondagens[0]], 8, metodos=METODOS_NATIVOS
+            )
+        with pytest.raises(ValueError, match='não encontrado'):
+            calcular_obra(sondagens, 8, metodos=['inexistente'])
+
+
+# =============================================================================
+# ASYNC SERVICE
+# =============================================================================
+
+
+class ServicoBloqueante:
+    """Stand-in service whose calls wait for an event."""
+
+    def __init__(self):
+        self.liberar = threading.Event()
+        self._lock = threading.Lock()
+        self.ativas = 0
+        self.max_ativas = 0
+
+    def calculate_single_depth(self, request):
+        with self._lock:
+            self.ativas += 1
+            self.max_ativas = max(self.max_ativas, self.ativas)
+        self.liberar.wait(5)
+        with self._lock:
+            self.ativas -= 1
+        return request
+
+
+class TestAsyncCalculationService:
+    """The async service offloads work and enforces its limits."""
+
+    def test_matches_sync_service(self, perfil_spt):
+        request = CalculationRequest(
+            perfil_spt=perfil_spt,
+            tipo_estaca='pré_moldada',
+            processo_construcao='deslocamento',
+            formato='circular',
+            secao_transversal=0.3,
+            cota_assentamento=8,
+        )
+        metodos = ['aoki_velloso_1975', 'teixeira_1996']
+
+        async def principal():
+            async with create_async_calculation_service(
+                'aoki_velloso_1975', max_workers=2
+            ) as servico:
+                return await asyncio.gather(
+                    servico.calculate_single_depth(request),
+                    servico.calculate_all_depths(request),
+                    servico.calculate_batch(perfil_spt, 8, metodos),
+                )
+
+        unica, todas, lote = asyncio.run(principal())
+        assert unica.success
+        assert todas.success
+        assert unica.resultados[0] == todas.resultados[7]
+        assert lote == calcular_todos_metodos_todas_estacas(
+            perfil_spt, 8, metodos=metodos
+        )
+
+    def test_process_pool_resolves_calculator_in_worker(self, perfil_spt):
+        # The Aoki-Velloso provider holds a lambda and cannot be pickled
+        request = CalculationRequest(
+            perfil_spt=perfil_spt,
+            tipo_estaca='pré_moldada',
+            processo_construcao='deslocamento',
+            formato='circular',
+            secao_transversal=0.3,
+        )
+        servico = create_calculation_service('aoki_velloso_1975')
+
+        async def principal():
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                async with create_async_calculation_service(
+                    'aoki_velloso_1975', executor=executor, max_workers=1
+                ) as async_servico:
+                    return await async_servico.calculate_all_depths(request)
+
+        resultado = asyncio.run(principal())
+        assert resultado.success
+        assert resultado.resultados == (
+            servico.calculate_all_depths(request).resultados
+        )
+
+    def test_concurrency_is_capped(self):
+        servico = ServicoBloqueante()
+
+        async def principal():
+            async with AsyncCalculationService(
+                servico, max_workers=8, max_concurrency=3
+            ) as async_servico:
+                tarefas = [
+                    asyncio.create_task(
+                        async_servico.calculate_single_depth(i)
+                    )
+                    for i in range(10)
+                ]
+                await asyncio.sleep(0.05)
+                servico.liberar.set()
+                return await asyncio.gather(*tarefas)
+
+        assert asyncio.run(principal()) == list(range(10))
+        assert servico.max_ativas == 3
+
+    def test_cancelled_batch_does_not_block_interactive(
+        self, perfil_spt, monkeypatch
+    ):
+        from calculus_core.service_layer import async_services
+
+        servico = ServicoBloqueante()
+        metodos_calculados = []
+
+        def metodo_lento(perfil, metodo, *args):
+            metodos_calculados.append(metodo)
+            servico.liberar.wait(5)
+            return []
+
+        monkeypatch.setattr(
+            async_services, 'calcular_um_metodo_todas_estacas', metodo_lento
+        )
+
+        async def principal():
+            async with AsyncCalculationService(
+                servico, max_workers=2
+            ) as async_servico:
+                lote = asyncio.create_task(
+                    async_servico.calculate_batch(
+                        perfil_spt, 8, ['m1', 'm2', 'm3']
+                    )
+                )
+                await asyncio.sleep(0.05)
+                # The batch holds one worker; interactive calls use the
+                # other one
+                interativa = asyncio.create_task(
+                    async_servico.calculate_single_depth('req')
+                )
+                await asyncio.sleep(0.05)
+                lote.cancel()
+                servico.liberar.set()
+                with pytest.raises(asyncio.CancelledError):
+                    await lote
+                return await interativa
+
+        assert asyncio.run(principal()) == 'req'
+        assert metodos_calculados == ['m1']
+
+    def test_invalid_limits_raise(self):
+        with pytest.raises(ValueError, match='positivo'):
+            AsyncCalculationService(ServicoBloqueante(), max_concurrency=0)
+
+
+# =============================================================================
+# REQUEST COALESCING
+# =============================================================================
+
+
+class TestCalculationCoalescer:
+    """Concurrent requests on one boring are evaluated together."""
+
+    @pytest.fixture
+    def estaca(self):
+        return Estaca('pré_moldada', 'deslocamento', 'circular', 0.3, 1)
+
+    def test_group_shares_one_curve(self, perfil_spt, estaca):
+        coalescer = CalculationCoalescer(janela=0.2)
+        calc = CalculationMethodRegistry.get_calculator_instance(
+            'aoki_velloso_1975'
+        )
+        # An equal profile in another object joins the same group
+        medidas = perfil_spt.medidas
+        copia = PerfilSPT.from_arrays(
+            [m.profundidade for m in medidas],
+            [m.N_SPT for m in medidas],
+            [m.tipo_solo for m in medidas],
+            nome_sondagem='SP-01-bis',
+        )
+        pedidos = [(perfil_spt, cota) for cota in (4, 6, 8, 8)]
+        pedidos += [(copia, 5), (perfil_spt, None)]
+
+        with ThreadPoolExecutor(max_workers=len(pedidos)) as executor:
+            futuros = [
+                executor.submit(
+                    coalescer.calcular,
+                    perfil,
+                    'aoki_velloso_1975',
+                    estaca,
+                    cota,
+                )
+                for perfil, cota in pedidos
+            ]
+            wait(futuros)
+
+        for (_, cota), futuro in zip(pedidos, futuros):
+            if cota is None:
+                assert futuro.result() == calc.calcular_curva(
+                    perfil_spt, estaca
+                )
+            else:
+                assert futuro.result() == calc.calcular(
+                    perfil_spt, estaca.na_cota(cota)
+                )
+        estatisticas = coalescer.estatisticas()
+        assert estatisticas.pedidos == 6
+        assert estatisticas.grupos == 1
+        assert estatisticas.curvas == 1
+        assert estatisticas.calculos == 0
+
+    def test_modified_profile_is_not_reused(self, perfil_spt, estaca):
+        coalescer = CalculationCoalescer(janela=0)
+        calc = CalculationMethodRegistry.get_calculator_instance(
+            'aoki_velloso_1975'
+        )
+        medidas = perfil_spt.medidas
+        original = PerfilSPT.from_arrays(
+            [m.profundidade for m in medidas],
+            [m.N_SPT for m in medidas],
+            [m.tipo_solo for m in medidas],
+        )
+        esperado = calc.calcular(original, estaca.na_cota(8))
+
+        coalescer.calcular(perfil_spt, 'aoki_velloso_1975', estaca, 8)
+        perfil_spt.adicionar_medida(0.5, 50, 'areia')
+        alterado = coalescer.calcular(
+            perfil_spt, 'aoki_velloso_1975', estaca, 8
+        )
+        # A fresh copy of the original content gets the original answer
+        resultado = coalescer.calcular(
+            original, 'aoki_velloso_1975', estaca, 8
+        )
+        assert alterado != esperado
+        assert resultado == esperado
+
+    def test_errors_reach_only_their_requests(self, perfil_spt, estaca):
+        coalescer = CalculationCoalescer(janela=0)
+        with pytest.raises(ValueError, match='não encontrado'):
+            coalescer.calcular(perfil_spt, 'inexistente', estaca, 5)
+        resultado = coalescer.calcular(
+            perfil_spt, 'aoki_velloso_1975', estaca, 5.5
+        )
+        assert resultado.cota == 5.5
+        assert coalescer.estatisticas().calculos == 1
@@ -11,7 +11,9 @@ from calculus_core.domain.soil_investigation import (
     CPTtoSPTConverter,
     MedidaCPT,
     PerfilCPT,
+    PerfilCPTColunar,
     SoilTestType,
+    TabelaEsparsa,
     converter_cpt_para_spt,
     listar_correlacoes_cpt_spt,
 )
@@ -65,6 +67,82 @@ class TestPerfilCPT:
         media = perfil.obter_qc_intervalo(1.0, 3.0, 'media')
         assert abs(media - 5.67) < 0.1  # (2+5+10) / 3
 
+    def test_from_arrays_sorts_once(self, perfil):
+        bulk = PerfilCPT.from_arrays(
+            [3.0, 1.0, 2.0],
+            [10.0, 2.0, 5.0],
+            [60.0, 30.0, 50.0],
+            nome_sondagem='CPT-01',
+        )
+        assert bulk.medidas == perfil.medidas
+
+    def test_from_arrays_rejects_mismatched_columns(self):
+        with pytest.raises(ValueError, match='mesmo tamanho'):
+            PerfilCPT.from_arrays([1.0, 2.0], [2.0], [30.0, 50.0])
+
+    def test_builder_validates_rows(self):
+        construtor = PerfilCPT.builder()
+        with pytest.raises(ValueError, match='qc'):
+            construtor.adicionar(1.0, -2.0, 30.0)
+
+
+class TestPerfilCPTColunar:
+    """Array-backed CPT profile answers like the object-backed one."""
+
+    @pytest.fixture
+    def perfis(self):
+        profundidades = [p / 50 for p in range(500, 0, -1)]  # unsorted
+        qc = [1.0 + (i * 37 % 23) / 4 for i in range(500)]
+        fs = [10.0 + (i * 11 % 19) * 5 for i in range(500)]
+        u2 = [None if i % 3 else 50.0 + i for i in range(500)]
+        return (
+            PerfilCPT.from_arrays(profundidades, qc, fs, u2=u2),
+            PerfilCPTColunar.from_arrays(profundidades, qc, fs, u2=u2),
+        )
+
+    def test_same_readings(self, perfis):
+        objetos, colunar = perfis
+        assert len(colunar) == len(objetos)
+        assert colunar.medidas == objetos.medidas
+        assert colunar[-1] == objetos[-1]
+        assert colunar.colunas().qc.typecode == 'd'
+        assert PerfilCPTColunar.de_perfil(objetos).medidas == objetos.medidas
+
+    @pytest.mark.parametrize('metodo', ['media', 'minimo', 'maximo'])
+    def test_interval_queries(self, perfis, metodo):
+        objetos, colunar = perfis
+        for inicio, fim in [(0.02, 10.0), (1.3, 1.3), (4.01, 2.5), (20, 30)]:
+            assert colunar.obter_qc_intervalo(
+                inicio, fim, metodo
+            ) == pytest.approx(objetos.obter_qc_intervalo(inicio, fim, metodo))
+
+    def test_nearest_reading(self, perfis):
+        objetos, colunar = perfis
+        for profundidade in (0.0, 0.03, 0.05, 3.333, 9.99, 50.0):
+            esperado = min(
+                objetos, key=lambda m: abs(m.profundidade - profundidade)
+            )
+            assert objetos.obter_medida(profundidade) == esperado
+            assert colunar.obter_medida(profundidade) == esperado
+
+    def test_incremental_additions(self):
+        perfil = PerfilCPTColunar()
+        perfil.adicionar_medida(2.0, 5.0, 40.0)
+        perfil.adicionar_medidas([(1.0, 2.0, 30.0), (3.0, 10.0, 60.0)])
+        assert [m.profundidade for m in perfil] == [1.0, 2.0, 3.0]
+        assert perfil.obter_qc_intervalo(1.0, 3.0, 'maximo') == 10.0
+        with pytest.raises(ValueError, match='fs'):
+            perfil.adicionar_medida(4.0, 5.0, -1.0)
+
+    def test_sparse_table(self):
+        valores = [5.0, 1.0, 4.0, 8.0, 2.0, 7.0, 3.0]
+        minimos = TabelaEsparsa(valores)
+        maximos = TabelaEsparsa(valores, max)
+        for i in range(len(valores)):
+            for j in range(i + 1, len(valores) + 1):
+                assert minimos.consultar(i, j) == min(valores[i:j])
+                assert maximos.consultar(i, j) == max(valores[i:j])
+
 
 class TestCPTtoSPTConverter:
     """Tests for CPT to SPT conversion."""
@@ -94,6 +172,64 @@ class TestCPTtoSPTConverter:
             assert 1 <= medida.N_SPT <= 60
 
 
+class TestConversaoStreaming:
+    """Single-pass conversion matches the interval-by-interval scan."""
+
+    @staticmethod
+    def _referencia(converter, perfil_cpt, intervalo):
+        linhas = []
+        prof = perfil_cpt.profundidade_minima
+        while prof <= perfil_cpt.profundidade_maxima:
+            janela = [
+                m
+                for m in perfil_cpt
+                if prof - intervalo / 2
+                <= m.profundidade
+                <= prof + intervalo / 2
+            ]
+            if janela:
+                qc = sum(m.qc for m in janela) / len(janela)
+                tipo = converter.inferir_tipo_solo(janela[len(janela) // 2])
+                linhas.append(
+                    (prof, converter.converter_qc_para_nspt(qc, tipo), tipo)
+                )
+            prof = round(prof + intervalo, 3)
+        return linhas
+
+    @pytest.fixture
+    def perfil_cpt(self):
+        # 0.5 m to 12.5 m every 2 cm, with a gap between 6 m and 8 m
+        profundidades = [
+            p / 100 for p in range(50, 1251, 2) if not 600 < p < 800
+        ]
+        return PerfilCPT.from_arrays(
+            profundidades,
+            [1.0 + (i * 37 % 23) / 2 for i in range(len(profundidades))],
+            [10.0 + (i * 11 % 19) * 7 for i in range(len(profundidades))],
+        )
+
+    @pytest.mark.parametrize('intervalo', [0.25, 1.0, 1.5])
+    def test_matches_interval_scan(self, perfil_cpt, intervalo):
+        converter = CPTtoSPTConverter()
+        linhas = list(converter.linhas_spt(perfil_cpt, intervalo))
+        assert linhas == self._referencia(converter, perfil_cpt, intervalo)
+
+    def test_consumes_generator(self, perfil_cpt):
+        converter = CPTtoSPTConverter()
+        linhas = ((m.profundidade, m.qc, m.fs) for m in perfil_cpt)
+        perfil_spt = converter.convert(linhas, nome_sondagem='CPT-G')
+        esperado = converter.convert(perfil_cpt)
+        assert perfil_spt.nome_sondagem == 'CPT-G'
+        assert list(perfil_spt) == list(esperado)
+
+    def test_rejects_unsorted_and_empty(self):
+        converter = CPTtoSPTConverter()
+        with pytest.raises(ValueError, match='ordem crescente'):
+            converter.convert([(2.0, 5.0, 40.0), (1.0, 5.0, 40.0)])
+        with pytest.raises(ValueError, match='Nenhuma medida'):
+            converter.convert(iter([]))
+
+
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
@@ -6,13 +6,24 @@ Essential tests for soil type mapping between methods.
 
 import pytest
 
+from calculus_core.domain.calculation.decourt_quaresma import (
+    SOLO_DECOURT,
+    SOLO_DECOURT_K,
+    normalizar_tipo_solo_decourt,
+)
+from calculus_core.domain.model import PerfilSPT
 from calculus_core.domain.soil_types import (
+    CODIGOS_SOLO,
+    GRAFIAS_POR_CODIGO,
+    LIMITE_CODIGOS,
     AokiVellosoSoilMapper,
     DecourtQuaresmaSoilMapper,
     SoilMapperRegistry,
+    TabelaCodigos,
     TeixeiraSoilMapper,
     TipoSoloCanonical,
     map_soil_type,
+    tabela_solo_metodo,
 )
 
 
@@ -88,3 +99,81 @@ class TestConvenienceFunctions:
             map_soil_type('argila_arenosa', 'aoki_velloso') == 'argila_arenosa'
         )
         assert map_soil_type('argila_arenosa', 'decourt_quaresma') == 'argila'
+
+
+class TestCodigosTipo:
+    """Tests for integer soil/pile type codes."""
+
+    def test_canonical_codes_follow_enum_order(self):
+        for indice, tipo in enumerate(TipoSoloCanonical):
+            assert tipo.codigo == indice
+            assert TipoSoloCanonical.from_codigo(indice) is tipo
+            assert CODIGOS_SOLO.nome(indice) == tipo.to_string()
+
+    def test_spellings_share_code(self):
+        tabela = TabelaCodigos()
+        codigo = tabela.codigo('Argila Arenosa')
+        assert tabela.codigo('argila-arenosa') == codigo
+        assert tabela.codigo('argila_arenosa') == codigo
+        assert tabela.nome(codigo) == 'argila_arenosa'
+        assert tabela.codigo('turfa') == codigo + 1
+        assert len(tabela) == 2
+
+    def test_unused_codes_are_recycled(self):
+        tabela = TabelaCodigos(['argila'], limite=3)
+        maiusculas = tabela.mapear(str.upper)
+        turfa = tabela.reservar('turfa')
+        assert tabela.codigo('lodo') == 2
+        assert maiusculas[2] == 'LODO'
+        # Full: the code of 'lodo' (not held) goes to the new name
+        assert tabela.codigo('cascalho') == 2
+        assert tabela.nome(2) == 'cascalho'
+        assert maiusculas[2] == 'CASCALHO'
+        assert tabela.codigo('turfa') == turfa.codigo == 1
+        assert tabela.codigo('argila') == 0
+        assert len(tabela) == 3
+
+        cascalho = tabela.reservar('cascalho')
+        with pytest.raises(ValueError, match='limite de 3 tipos em uso'):
+            tabela.codigo('lodo')
+        assert cascalho.codigo == 2
+        # Spellings past the memo limit still resolve, without growing it
+        grafias = [
+            ''.join(c.upper() if (i >> j) & 1 else c for j, c in enumerate(n))
+            for n in ('turfa', 'argila')
+            for i in range(32)
+        ]
+        assert {tabela.codigo(g) for g in grafias} == {0, 1}
+        assert len(tabela._codigos) <= GRAFIAS_POR_CODIGO * tabela.limite
+
+    def test_junk_names_do_not_lock_the_table(self):
+        solos = ['argila'] * 100
+        # Far more distinct names than the table holds, then dropped
+        for lote in range(LIMITE_CODIGOS // 100 + 2):
+            lixo = [f'lixo_{lote}_{i}' for i in range(100)]
+            PerfilSPT.from_arrays(range(1, 101), [5] * 100, lixo).colunas()
+
+        perfil = PerfilSPT.from_arrays(
+            range(1, 101), [5] * 100, solos[:-1] + ['solo_residual_novo']
+        )
+        colunas = perfil.colunas()
+        assert colunas.tipo_solo(0) == 'argila'
+        assert colunas.tipo_solo(99) == 'solo_residual_novo'
+        assert len(CODIGOS_SOLO) <= LIMITE_CODIGOS
+
+    def test_unknown_code(self):
+        with pytest.raises(ValueError, match='Código de tipo desconhecido'):
+            TabelaCodigos().nome(0)
+
+    def test_method_tables_match_normalizers(self):
+        for nome in ('silte', 'Argila Siltosa', 'areia_com_pedregulhos'):
+            codigo = CODIGOS_SOLO.codigo(nome)
+            assert SOLO_DECOURT[codigo] == normalizar_tipo_solo_decourt(nome)
+            assert SOLO_DECOURT_K[codigo] == normalizar_tipo_solo_decourt(
+                nome, para_K=True
+            )
+
+    def test_tabela_solo_metodo(self):
+        tabela = tabela_solo_metodo('decourt_quaresma')
+        assert len(tabela) == len(TipoSoloCanonical)
+        assert tabela[TipoSoloCanonical.ARGILA_ARENOSA.codigo] == 'argila'